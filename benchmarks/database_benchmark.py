@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Benchmark DatabaseService insert and query throughput.
+
+Compares the persistent per-thread WAL connections used by DatabaseService
+with the previous behavior of opening a fresh, default-journaled connection
+for every call.
+
+Usage:
+    python benchmarks/database_benchmark.py [--operations 2000]
+"""
+
+import argparse
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.database.models import ScanDatabaseModel, ScanResultDatabaseModel
+from src.database.service import DatabaseService
+
+
+class PerCallConnectionService(DatabaseService):
+    """DatabaseService opening a new connection per call, as before pooling."""
+
+    @contextmanager
+    def _get_connection(self) -> Generator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def run(service: DatabaseService, operations: int) -> tuple[float, float]:
+    """Return (inserts per second, queries per second)."""
+    scan_id = service.store_scan(
+        ScanDatabaseModel(
+            directory="/bench",
+            scan_mode="quick",
+            started_at=time.time(),
+            total_files=operations,
+            processed_files=operations,
+            corrupt_files=0,
+            healthy_files=operations,
+            success_rate=100.0,
+            scan_time=0.0,
+        )
+    )
+
+    start = time.perf_counter()
+    for i in range(operations):
+        row = ScanResultDatabaseModel(
+            scan_id=scan_id,
+            filename=f"/bench/video{i}.mp4",
+            file_size=i,
+            is_corrupt=False,
+            confidence=0.0,
+            inspection_time=0.1,
+            scan_mode="quick",
+            status="HEALTHY",
+        )
+        service.store_scan_results(scan_id, [row])
+    insert_rate = operations / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        service.get_scan(scan_id)
+    query_rate = operations / (time.perf_counter() - start)
+    return insert_rate, query_rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--operations", type=int, default=2000, help="Inserts and queries to run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [
+            ("per-call connection", PerCallConnectionService(Path(tmp) / "per_call.db")),
+            ("persistent WAL connection", DatabaseService(Path(tmp) / "pooled.db")),
+        ]
+        print(f"{'variant':<28}{'inserts/s':>12}{'queries/s':>12}")
+        for name, service in variants:
+            insert_rate, query_rate = run(service, args.operations)
+            print(f"{name:<28}{insert_rate:>12.0f}{query_rate:>12.0f}")
+            service.close()
+
+
+if __name__ == "__main__":
+    main()
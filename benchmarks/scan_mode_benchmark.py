@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark FFmpeg scan modes on the same corpus.
+
+Runs every video file below a directory through each selected scan mode one
+at a time and reports wall time, throughput and how many files each mode
+flagged as corrupt or in need of a deep scan.
+
+Usage:
+    python benchmarks/scan_mode_benchmark.py /path/to/videos [--modes quick keyframe deep]
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.config import FFmpegConfig
+from src.core.file_walker import VideoFileWalker
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanMode, ScanResult
+from src.ffmpeg.ffmpeg_client import FFmpegClient
+
+VIDEO_EXTENSIONS = [".mp4", ".mkv", ".avi", ".mov", ".ts", ".m4v", ".mpeg", ".mpg", ".webm"]
+
+
+def inspector_for(client: FFmpegClient, mode: ScanMode) -> Callable[[VideoFile], ScanResult]:
+    """Return the FFmpegClient method implementing a scan mode."""
+    inspectors = {
+        ScanMode.QUICK: client.inspect_quick,
+        ScanMode.KEYFRAME: client.inspect_keyframe,
+        ScanMode.BITSTREAM: client.inspect_bitstream,
+        ScanMode.PROBE: client.inspect_probe,
+        ScanMode.DEEP: client.inspect_deep,
+        ScanMode.FULL: client.inspect_full,
+    }
+    return inspectors[mode]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path, help="Directory of video files to scan")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["quick", "keyframe", "deep"],
+        choices=["quick", "keyframe", "bitstream", "probe", "deep", "full"],
+        help="Scan modes to compare",
+    )
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="FFmpeg executable")
+    args = parser.parse_args()
+
+    files = sorted(VideoFileWalker(VIDEO_EXTENSIONS).walk(args.directory))
+    total_bytes = sum(path.stat().st_size for path in files)
+    client = FFmpegClient(FFmpegConfig(command=Path(args.ffmpeg)))
+    print(f"{len(files)} files, {total_bytes / 1e6:.1f} MB")
+    print(f"{'mode':<10}{'seconds':>10}{'MB/s':>10}{'corrupt':>10}{'needs deep':>12}")
+
+    for mode in (ScanMode(m) for m in args.modes):
+        inspect = inspector_for(client, mode)
+        corrupt = needs_deep = 0
+        start = time.perf_counter()
+        for path in files:
+            result = inspect(VideoFile(path=path))
+            corrupt += result.is_corrupt
+            needs_deep += result.needs_deep_scan
+        elapsed = time.perf_counter() - start
+        rate = total_bytes / 1e6 / elapsed if elapsed else 0.0
+        print(f"{mode.value:<10}{elapsed:>10.2f}{rate:>10.1f}{corrupt:>10}{needs_deep:>12}")
+
+
+if __name__ == "__main__":
+    main()
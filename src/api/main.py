@@ -24,7 +24,7 @@ from src.api.models import (
     ScanStatusResponse,
 )
 from src.config import load_config
-from src.core.models.scanning import ScanProgress, ScanSummary
+from src.core.models.scanning import ScanProgress, ScanResult, ScanSummary
 from src.core.scanner import VideoScanner
 from src.version import __version__
 
@@ -272,6 +272,7 @@ async def run_scan(scan_id: str, request: ScanRequest) -> None:
 
         # Override with request parameters
         config.processing.max_workers = request.max_workers
+        config.scan.max_workers = request.max_workers
         config.scan.recursive = request.recursive
         # mode is ScanMode enum, no need to convert to string
         config.processing.default_mode = request.mode.value
@@ -279,29 +280,36 @@ async def run_scan(scan_id: str, request: ScanRequest) -> None:
         # Create scanner
         scanner = VideoScanner(config)
 
-        # Progress callback
+        # Progress callback (runs on the scan thread)
         def progress_callback(progress: ScanProgress) -> None:
             scan_data["progress"] = progress.model_dump()
+            if scan_data["status"] == ScanStatusEnum.CANCELLED:
+                scanner.request_shutdown()
 
-        # Run scan
-        directory = Path(request.directory)
-        summary: ScanSummary | None = scanner.scan_directory(
-            directory=directory,
+        # Latest result per file; a hybrid deep result replaces the quick one
+        results: dict[str, ScanResult] = {}
+
+        def result_callback(result: ScanResult) -> None:
+            results[str(result.video_file.path)] = result
+
+        # Run the blocking scan in a worker thread so the event loop keeps
+        # serving status and WebSocket traffic
+        summary: ScanSummary = await asyncio.to_thread(
+            scanner.scan_directory,
+            directory=Path(request.directory),
             scan_mode=request.mode,
             recursive=request.recursive,
             progress_callback=progress_callback,
+            result_callback=result_callback,
+            order=request.order,
         )
 
-        if summary is None:
-            scan_data["status"] = ScanStatusEnum.FAILED
-            scan_data["error"] = "Scan completed with no results"
-        else:
+        if scan_data["status"] != ScanStatusEnum.CANCELLED:
             scan_data["status"] = ScanStatusEnum.COMPLETED
-            # Store summary data - individual file results not available from scan_directory
-            scan_data["results"] = {
-                "summary": summary.model_dump(),
-                "details": [],  # TODO: Implement file-level results storage
-            }
+        scan_data["results"] = {
+            "summary": summary.model_dump(),
+            "details": [result.model_dump(mode="json") for result in results.values()],
+        }
 
     except Exception:
         logger.exception(f"Scan {scan_id} failed")
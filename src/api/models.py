@@ -6,7 +6,7 @@ from enum import Enum
 
 from pydantic import BaseModel, Field
 
-from src.core.models.scanning import ScanMode
+from src.core.models.scanning import ScanMode, ScanOrder
 
 
 class HealthResponse(BaseModel):
@@ -24,6 +24,10 @@ class ScanRequest(BaseModel):
     mode: ScanMode = Field(default=ScanMode.QUICK, description="Scan mode")
     recursive: bool = Field(default=True, description="Scan subdirectories")
     max_workers: int = Field(default=8, ge=1, le=32, description="Number of worker threads")
+    order: ScanOrder = Field(
+        default=ScanOrder.DISCOVERY,
+        description="Order files are scanned in: discovery, longest-first or shortest-first",
+    )
 
 
 class ScanStatusEnum(str, Enum):
@@ -60,7 +64,7 @@ class ScanResultsResponse(BaseModel):
     """Scan results response."""
 
     scan_id: str = Field(description="Unique scan identifier")
-    results: dict = Field(description="Complete scan results")
+    results: list[dict] = Field(description="Per-file scan results")
     summary: dict = Field(description="Scan summary statistics")
 
 
@@ -1,5 +1,6 @@
 """REST API endpoints for scan operations."""
 
+import asyncio
 import logging
 import uuid
 from datetime import datetime
@@ -17,7 +18,7 @@ from src.api.graphql.resolvers import (
 from src.api.graphql.types import ScanModeType
 from src.cli.handlers import ScanHandler
 from src.config import load_config
-from src.core.models.scanning import ScanProgress
+from src.core.models.scanning import ScanOrder, ScanProgress
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +74,10 @@ class ScanRequest(BaseModel):
     scan_mode: str = Field(default="quick", description="Scan mode: quick, deep, or hybrid")
     recursive: bool = Field(default=True, description="Scan subdirectories recursively")
     resume: bool = Field(default=True, description="Resume from previous scan if available")
+    order: ScanOrder = Field(
+        default=ScanOrder.DISCOVERY,
+        description="Order files are scanned in: discovery, longest-first or shortest-first",
+    )
 
 
 class ScanResponse(BaseModel):
@@ -155,12 +160,15 @@ async def create_scan(request: ScanRequest) -> ScanResponse:
         # Initialize scan handler
         scan_handler = ScanHandler(config)
 
-        # Run the scan (this is blocking, in production use background tasks)
-        summary = scan_handler.run_scan(
+        # Run the blocking scan in a worker thread so the event loop keeps
+        # serving status and WebSocket traffic
+        summary = await asyncio.to_thread(
+            scan_handler.run_scan,
             directory=Path(request.directory),
             scan_mode=convert_scan_mode(scan_mode_type),
             recursive=request.recursive,
             resume=request.resume,
+            order=request.order,
         )
 
         # Update job with results
@@ -15,7 +15,7 @@ import click
 from src.cli.handlers import ListHandler, ScanHandler, TraktHandler
 from src.cli.logging import configure_logging_from_config, setup_logging
 from src.config import load_config
-from src.core.models.scanning import FileStatus, ScanMode
+from src.core.models.scanning import FileStatus, ScanMode, ScanOrder
 from src.core.reporter import ReportService
 from src.ffmpeg.ffmpeg_client import FFmpegClient
 
@@ -135,7 +135,7 @@ def cli(
     "-m",
     type=click.Choice([e.value for e in ScanMode], case_sensitive=False),
     default="hybrid",
-    help="Scan mode: quick (1min timeout), deep (full scan), hybrid (quick then deep for suspicious), full (complete scan without timeout)",
+    help="Scan mode: quick (1min timeout), deep (full scan), hybrid (quick then deep for suspicious), full (complete scan without timeout), keyframe (keyframes of the whole file only), bitstream (parse packets without decoding), probe (ffprobe container structure check), zeroblock (find zero-filled blocks left by storage corruption)",
     show_default=True,
 )
 @click.option(
@@ -165,7 +165,14 @@ def cli(
 @click.option(
     "--incremental/--full-scan",
     default=False,
-    help="Skip files that were recently scanned and found healthy",
+    help="Skip files unchanged since their last verdict (see scan.incremental_max_age_days)",
+    show_default=True,
+)
+@click.option(
+    "--order",
+    type=click.Choice([e.value for e in ScanOrder], case_sensitive=False),
+    default=ScanOrder.DISCOVERY.value,
+    help="Order files are scanned in: discovery (start while the directory is still being listed), longest-first (shortest total scan time) or shortest-first (most results early), estimated from file size and past scan times",
     show_default=True,
 )
 @click.pass_context
@@ -178,6 +185,7 @@ def scan(
     extensions,
     resume,
     incremental,
+    order,
     config,
 ):
     # If no arguments are provided, show the help for the scan subcommand
@@ -187,18 +195,22 @@ def scan(
     """
     Scan a directory for corrupt video files.
 
-    Uses FFmpeg to analyze video files and detect corruption. Supports four scan modes:
+    Uses FFmpeg to analyze video files and detect corruption. Supports eight scan modes:
 
     \b
     - quick: Fast scan with 1-minute timeout per file
     - deep: Full scan with 15-minute timeout per file
     - hybrid: Quick scan first, then deep scan for suspicious files
     - full: Complete scan of entire video stream without timeout
+    - keyframe: Decode only keyframes across the whole file, for cheap triage
+    - bitstream: Parse every packet of the file without decoding, near disk speed
+    - probe: Check container structure with ffprobe, catches truncated files
+    - zeroblock: Read whole files for zero-filled blocks (bit rot), no decoding
 
     - All scan results are stored in the SQLite database.
 
     \b
-    - Use --incremental to skip files recently scanned and found healthy
+    - Use --incremental to skip files unchanged since they were last scanned
 
     Examples:
 
@@ -211,13 +223,21 @@ def scan(
     corrupt-video-inspector scan --mode quick /path/to/videos
 
     \b
-    # Incremental scan (skip recently healthy files)
+    # Incremental scan (skip files unchanged since the last scan)
     corrupt-video-inspector scan --incremental /path/to/videos
 
+    \b
+    # Deep scan starting with the longest files, so none is left running alone at the end
+    corrupt-video-inspector scan --mode deep --order longest-first /path/to/videos
+
     \b
     # Full scan without timeout (for thorough analysis)
     corrupt-video-inspector scan --mode full /path/to/videos
 
+    \b
+    # Nightly keyframe triage of a whole library
+    corrupt-video-inspector scan --mode keyframe --incremental /path/to/videos
+
     \b
     # Deep scan with custom extensions
     corrupt-video-inspector scan --mode deep --extensions mp4 --extensions mkv /videos
@@ -229,6 +249,7 @@ def scan(
         # Override config with CLI options
         if max_workers:
             app_config.scan.max_workers = max_workers
+            app_config.processing.max_workers = max_workers
         if extensions:
             app_config.scan.extensions = [
                 f".{ext}" if not ext.startswith(".") else ext for ext in extensions
@@ -237,27 +258,6 @@ def scan(
         # Convert mode string to ScanMode enum
         scan_mode = ScanMode(mode.lower())
 
-        # Handle incremental scanning
-        if incremental:
-            try:
-                from src.database.service import DatabaseService
-
-                db_service = DatabaseService(
-                    app_config.database.path, app_config.database.auto_cleanup_days
-                )
-
-                # Get files that were recently scanned and found healthy
-                recent_healthy = db_service.get_files_needing_rescan(
-                    str(directory), scan_mode.value
-                )
-                # Invert the logic - skip files NOT in the rescan list
-                # (these are files that were healthy in recent scans)
-                click.echo(
-                    f"Incremental scan: focusing on {len(recent_healthy)} files that need rescanning"
-                )
-            except Exception as e:
-                logger.warning(f"Could not perform incremental scan: {e}")
-
         # Create and run scan handler
         handler = ScanHandler(app_config)
         summary = handler.run_scan(
@@ -265,6 +265,8 @@ def scan(
             scan_mode=scan_mode,
             recursive=recursive,
             resume=resume,
+            incremental=incremental,
+            order=ScanOrder(order.lower()),
         )
         if summary is not None:
             click.echo("\nScan Summary:")
@@ -465,9 +467,7 @@ def sync(
         # Get database service
         from src.database.service import DatabaseService
 
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         # Get scan from database
         if scan_id is None:
@@ -959,9 +959,7 @@ def report(
         # Get database service
         from src.database.service import DatabaseService
 
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         # Get scan from database
         if scan_id is None:
@@ -1215,9 +1213,7 @@ def query(
         from src.database.service import DatabaseService
 
         # Initialize database service
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         # Parse since date if provided
         since_timestamp = None
@@ -1344,9 +1340,7 @@ def stats(ctx, config):
         from src.database.service import DatabaseService
 
         # Initialize database service
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         # Get statistics
         stats = db_service.get_database_stats()
@@ -1409,9 +1403,7 @@ def cleanup(ctx, days, dry_run, config):
         from src.database.service import DatabaseService
 
         # Initialize database service
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         if dry_run:
             # Show what would be deleted
@@ -1481,9 +1473,7 @@ def backup(ctx, backup_path, config):
         from src.database.service import DatabaseService
 
         # Initialize database service
-        db_service = DatabaseService(
-            app_config.database.path, app_config.database.auto_cleanup_days
-        )
+        db_service = DatabaseService.from_config(app_config.database)
 
         # Create backup
         db_service.backup_database(backup_path)
@@ -25,6 +25,7 @@ from src.core.models.inspection import VideoFile
 from src.core.models.scanning import (
     FileStatus,
     ScanMode,
+    ScanOrder,
     ScanProgress,
     ScanResult,
     ScanSummary,
@@ -69,23 +70,23 @@ class BaseHandler:
     def _store_scan_results(
         self,
         summary: ScanSummary,
+        scan_id: int | None = None,
     ) -> int:
         """Store scan summary in database.
 
         Args:
             summary: Scan summary to store
+            scan_id: Scan registered before the scan started, whose individual
+                results were already written while scanning
 
         Returns:
             Scan ID in database
         """
         try:
-            # Store results in database
-            # Note: Individual scan results are not currently tracked by scanner,
-            # so we only store the summary. This is sufficient for basic database
-            # functionality and incremental scanning.
             scan_id = self.output_formatter.store_scan_results(
                 summary=summary,
-                scan_results=None,  # Scanner doesn't provide individual results
+                scan_results=None,
+                scan_id=scan_id,
             )
             logger.info(f"Scan results stored in database with ID: {scan_id}")
             return scan_id
@@ -108,28 +109,54 @@ class ScanHandler(BaseHandler):
         scan_mode: ScanMode,
         recursive: bool = True,
         resume: bool = True,
+        incremental: bool = False,
+        *,
+        order: ScanOrder = ScanOrder.DISCOVERY,
     ) -> ScanSummary | None:
         """
         Run a video corruption scan and return ScanSummary or None.
-        Results are stored in the database.
+        Each file's result is stored in the database as soon as it is
+        inspected, and the scan record is finalized with the summary. The
+        record is created with the first result, so a scan that finds nothing
+        to inspect or fails before inspecting any file leaves none behind.
+        With ``incremental``, files unchanged since their last verdict are not
+        inspected again. ``order`` selects the order files are handed to
+        workers in (see ``ScanOrder``).
         """
+        scan_id: int | None = None
+        sink: Any = None
+
+        def store_result(result: ScanResult) -> None:
+            # Runs on the scan thread, one result at a time
+            nonlocal scan_id, sink
+            if sink is None:
+                scan_id = self.output_formatter.begin_scan(directory, scan_mode)
+                sink = self.output_formatter.create_result_sink(scan_id)
+            sink.add(result)
+
         try:
-            video_files = self.scanner.get_video_files(directory, recursive=recursive)
-            if not video_files:
+            try:
+                # Discovery runs inside scan_directory, overlapping with the scan itself
+                summary = self.scanner.scan_directory(
+                    directory=directory,
+                    scan_mode=scan_mode,
+                    recursive=recursive,
+                    resume=resume,
+                    progress_callback=(
+                        self._progress_callback if self.config.logging.level != "QUIET" else None
+                    ),
+                    incremental=incremental,
+                    result_callback=store_result,
+                    order=order,
+                )
+            finally:
+                if sink is not None:
+                    sink.close()
+            if summary.total_files == 0:
                 logger.info("No video files found to scan.")
                 return None
-            logger.info(f"Found {len(video_files)} video files to scan.")
-            summary = self.scanner.scan_directory(
-                directory=directory,
-                scan_mode=scan_mode,
-                recursive=recursive,
-                resume=resume,
-                progress_callback=(
-                    self._progress_callback if self.config.logging.level != "QUIET" else None
-                ),
-            )
-            # Store results in database
-            self._store_scan_results(summary=summary)
+            self._store_scan_results(summary=summary, scan_id=scan_id)
+            logger.info(f"Found {summary.total_files} video files to scan.")
             return summary
         except KeyboardInterrupt:
             logger.warning("Scan interrupted by user.")
@@ -151,6 +178,14 @@ class ScanHandler(BaseHandler):
             click.echo("  Quick scan only (1min timeout per file)")
         elif scan_mode == ScanMode.DEEP:
             click.echo("  Deep scan all files (15min timeout per file)")
+        elif scan_mode == ScanMode.KEYFRAME:
+            click.echo("  Keyframe-only scan of all files (triage, deep scan flagged files)")
+        elif scan_mode == ScanMode.BITSTREAM:
+            click.echo("  Packet-level scan of all files without decoding (triage)")
+        elif scan_mode == ScanMode.PROBE:
+            click.echo("  Container structure check of all files with ffprobe (triage)")
+        elif scan_mode == ScanMode.ZEROBLOCK:
+            click.echo("  Whole-file read of all files for zero-filled blocks (no decoding)")
 
         click.echo(f"Max workers: {self.config.processing.max_workers}")
         click.echo(f"Recursive: {'enabled' if recursive else 'disabled'}")
@@ -221,6 +256,9 @@ class ScanHandler(BaseHandler):
 
         click.echo(f"Success rate: {summary.success_rate:.1f}%")
 
+        if summary.skipped_unchanged:
+            click.echo(f"Unchanged files skipped: {summary.skipped_unchanged}")
+
         if summary.was_resumed:
             click.echo("(Scan was resumed from previous session)")
 
@@ -676,11 +714,12 @@ class UtilityHandler(BaseHandler):
         Return list of video file objects.
         Accepts Path for directory.
         """
-        # Ensure directory is a Path
-        directory_path = Path(directory)
-        # Pass extensions directly to get_video_files instead of mutating config
-        return self.scanner.get_video_files(
-            directory_path, recursive=recursive, extensions=list(extensions) if extensions else None
+        walker = self.scanner.create_file_walker(
+            recursive=recursive, extensions=list(extensions) if extensions else None
+        )
+        return sorted(
+            (VideoFile(path=path) for path in walker.walk(Path(directory))),
+            key=lambda vf: vf.path,
         )
 
     def list_video_files_simple(
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import toml
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PositiveInt
 
 from src.config.merge import load_configuration_with_merge
 from src.core.models.scanning import FileStatus, ScanMode
@@ -20,6 +20,73 @@ class FFmpegConfig(BaseModel):
     command: Path = Field(default=Path("/usr/bin/ffmpeg"))
     quick_timeout: int = Field(default=30)
     deep_timeout: int = Field(default=1800)
+    keyframe_timeout: int = Field(default=600)
+    bitstream_timeout: int = Field(default=600)
+    probe_timeout: int = Field(default=300)
+    early_abort: bool = Field(
+        default=True,
+        description="Stop FFmpeg on the first definitive corruption pattern in its output",
+    )
+    quick_window_seconds: float = Field(
+        default=10, gt=0, description="Seconds decoded per quick scan window"
+    )
+    quick_sample_windows: int = Field(
+        default=1,
+        ge=1,
+        description="Evenly spaced windows decoded by a quick scan (1 = start of file only)",
+    )
+    quick_tail_seconds: float = Field(
+        default=5,
+        ge=0,
+        description="Seconds decoded at the declared end of the file to detect truncation (0 = off)",
+    )
+    stall_timeout: float = Field(
+        default=120,
+        ge=0,
+        description="Seconds without decoding progress before a deep or full scan is "
+        "stopped as stalled (0 = off)",
+    )
+    deep_segments: int = Field(
+        default=1,
+        ge=1,
+        description="Time segments a long deep or full scan is split into and decoded "
+        "concurrently (1 = off)",
+    )
+    min_segment_seconds: float = Field(
+        default=600, gt=0, description="Shortest segment of a split deep or full scan in seconds"
+    )
+    adaptive_timeouts: bool = Field(
+        default=True,
+        description="Derive deep scan timeouts from each file's duration, codec and resolution",
+    )
+    timeout_safety_factor: float = Field(
+        default=3.0, ge=1, description="Multiple of the expected decode time allowed per file"
+    )
+    min_adaptive_timeout: float = Field(
+        default=30, gt=0, description="Shortest adaptive deep scan timeout in seconds"
+    )
+    default_decode_speed: float = Field(
+        default=4.0,
+        gt=0,
+        description="Seconds of 1080p H.264 decoded per second until speed is learned",
+    )
+    nice: int = Field(
+        default=0,
+        ge=0,
+        le=19,
+        description="Niceness FFmpeg and ffprobe run at, so other services keep the CPU (0 = normal)",
+    )
+    ionice_class: str = Field(
+        default="",
+        pattern=r"^(idle|best-effort)?$",
+        description="I/O scheduling class of FFmpeg and ffprobe: idle or best-effort ('' = inherit)",
+    )
+    ionice_level: int = Field(
+        default=7,
+        ge=0,
+        le=7,
+        description="Priority within the best-effort I/O class, 0 (highest) to 7 (lowest)",
+    )
 
 
 class ProcessingConfig(BaseModel):
@@ -44,6 +111,24 @@ class DatabaseConfig(BaseModel):
         default=0, description="Auto-delete scans older than X days (0 = disabled)"
     )
     create_backup: bool = Field(default=True, description="Create backups before schema changes")
+    result_batch_size: int = Field(
+        default=100, ge=1, description="Scan results written per database transaction"
+    )
+    result_flush_interval: float = Field(
+        default=2.0, gt=0, description="Maximum seconds before pending scan results are written"
+    )
+    cache_size_kib: int = Field(
+        default=16384, ge=0, description="SQLite page cache per connection in KiB"
+    )
+    mmap_size_mb: int = Field(
+        default=64, ge=0, description="MiB of the database file to memory-map (0 = disabled)"
+    )
+    busy_timeout_ms: int = Field(
+        default=5000, ge=0, description="Milliseconds to wait for a locked database"
+    )
+    statement_cache_size: int = Field(
+        default=128, ge=0, description="Prepared statements cached per connection"
+    )
 
 
 class TraktConfig(BaseModel):
@@ -64,6 +149,103 @@ class ScanConfig(BaseModel):
     extensions: list[str] = Field(
         default_factory=lambda: [".mp4", ".mkv", ".avi", ".mov", ".wmv", ".flv"]
     )
+    skip_hidden_dirs: bool = Field(
+        default=True, description="Do not descend into directories starting with a dot"
+    )
+    exclude_dirs: list[str] = Field(
+        default_factory=list, description="Directory names or glob patterns to skip"
+    )
+    discovery_workers: int = Field(
+        default=4, ge=1, description="Threads listing directories concurrently"
+    )
+    deep_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Deep scans of suspicious files running alongside quick scans in hybrid mode",
+    )
+    device_workers: dict[str, PositiveInt] = Field(
+        default_factory=dict,
+        description="Maximum concurrent scans per filesystem, keyed by its mount point",
+    )
+    default_device_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum concurrent scans on filesystems not in device_workers (0 = no cap)",
+    )
+    adaptive_workers: bool = Field(
+        default=False,
+        description="Tune concurrent scans between min_workers and max_workers from throughput",
+    )
+    min_workers: int = Field(
+        default=1, ge=1, description="Fewest concurrent scans when adaptive_workers is enabled"
+    )
+    adaptive_window: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds of throughput measured before each adaptive concurrency decision",
+    )
+    max_io_wait: float = Field(
+        default=0.3,
+        ge=0,
+        le=1,
+        description="Share of CPU time in I/O wait above which adaptive concurrency backs off",
+    )
+    max_load_per_cpu: float = Field(
+        default=0.0,
+        ge=0,
+        description="1-minute load average per CPU above which new scans are held back (0 = off)",
+    )
+    max_cpu_pressure: float = Field(
+        default=0.0,
+        ge=0,
+        le=100,
+        description="Percent of time tasks stalled on CPU (PSI) above which new scans are "
+        "held back (0 = off)",
+    )
+    max_io_pressure: float = Field(
+        default=0.0,
+        ge=0,
+        le=100,
+        description="Percent of time tasks stalled on I/O (PSI) above which new scans are "
+        "held back (0 = off)",
+    )
+    load_check_interval: float = Field(
+        default=5.0, gt=0, description="Seconds between system load checks"
+    )
+    resume_fsync_interval: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds between fsyncs of the resume journal (0 syncs every file)",
+    )
+    discovery_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum discovered files waiting for a scan worker",
+    )
+    incremental_max_age_days: int = Field(
+        default=30,
+        ge=0,
+        description="Re-inspect unchanged files whose last verdict is older than X days (0 = never)",
+    )
+    prefilter: bool = Field(
+        default=True,
+        description="Flag empty, sparse, zero-filled and mis-typed files before running FFmpeg",
+    )
+    max_hole_fraction: float = Field(
+        default=0.5,
+        ge=0,
+        le=1,
+        description="Fraction of a file that may be unallocated holes before it is flagged",
+    )
+    zero_block_min_run: int = Field(
+        default=8,
+        ge=1,
+        description="Shortest run of zero-filled 4 KiB blocks reported by zeroblock scans",
+    )
+    structure_check: bool = Field(
+        default=True,
+        description="Validate MP4/MKV container structure in-process before running FFmpeg",
+    )
 
 
 class APIConfig(BaseModel):
@@ -0,0 +1,373 @@
+"""
+Adaptive concurrency control for scan workers based on measured throughput and system load.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.core.models.scanning import ScanResult
+
+logger = logging.getLogger(__name__)
+
+_PROC_STAT = Path("/proc/stat")
+_PROC_PRESSURE = Path("/proc/pressure")
+
+# Windows are stretched up to this many times while too few files complete to judge
+_MAX_WINDOW_STRETCH = 4
+
+# Held-back scans resume once every metric is below this share of its threshold
+_RESUME_FRACTION = 0.8
+
+
+@dataclass(frozen=True)
+class ConcurrencyDecision:
+    """One adjustment made by :class:`ConcurrencyController`.
+
+    Attributes:
+        previous: Worker limit before the decision
+        limit: Worker limit after the decision
+        reason: Why the limit was changed or kept
+        bytes_per_second: File bytes inspected per second in the window
+        video_seconds_per_second: Seconds of video inspected per second in the window
+        io_wait: Fraction of CPU time spent waiting on I/O, None if unknown
+    """
+
+    previous: int
+    limit: int
+    reason: str
+    bytes_per_second: float
+    video_seconds_per_second: float
+    io_wait: float | None
+
+
+class IoWaitSampler:
+    """Measures the share of CPU time spent in I/O wait between calls, from /proc/stat."""
+
+    def __init__(self, path: Path = _PROC_STAT) -> None:
+        """Initialize the sampler and take a first reading.
+
+        Args:
+            path: Location of the kernel CPU statistics
+        """
+        self.path = path
+        self._last = self._read()
+
+    def _read(self) -> tuple[int, int] | None:
+        """Return cumulative ``(iowait, total)`` CPU jiffies, None if unavailable."""
+        try:
+            with self.path.open(encoding="ascii") as f:
+                fields = f.readline().split()
+        except OSError:
+            return None
+        if len(fields) < 6 or fields[0] != "cpu":
+            return None
+        # cpu user nice system idle iowait irq softirq steal ...; guest time is
+        # already counted in user and nice
+        jiffies = [int(value) for value in fields[1:9]]
+        return jiffies[4], sum(jiffies)
+
+    def sample(self) -> float | None:
+        """Return the I/O wait fraction since the previous sample, None if unavailable."""
+        current = self._read()
+        previous, self._last = self._last, current
+        if current is None or previous is None or current[1] <= previous[1]:
+            return None
+        return (current[0] - previous[0]) / (current[1] - previous[1])
+
+
+class ConcurrencyController:
+    """AIMD controller tuning how many inspections run at once.
+
+    Throughput is measured as file bytes (and seconds of video, when known)
+    inspected per second over a sliding window. At the end of each window:
+
+    - I/O wait above ``max_io_wait`` cuts the limit multiplicatively, since
+      more workers would only add seeks
+    - Throughput that improved by more than ``tolerance`` on the previous
+      window raises the limit by one
+    - Throughput that plateaued after an increase cuts the limit
+      multiplicatively, as the extra worker bought nothing; after a cut the
+      limit is raised again to probe for the best level
+
+    The limit stays within ``[min_workers, max_workers]``. Every decision is
+    logged and kept in :attr:`decisions`. Methods are meant to be called from
+    the thread running the scan engine.
+    """
+
+    def __init__(
+        self,
+        min_workers: int,
+        max_workers: int,
+        *,
+        window: float = 30.0,
+        max_io_wait: float = 0.3,
+        tolerance: float = 0.05,
+        backoff: float = 0.75,
+        io_wait: IoWaitSampler | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the controller, starting at ``min_workers``.
+
+        Args:
+            min_workers: Lowest worker limit
+            max_workers: Highest worker limit
+            window: Seconds of throughput measured before each decision
+            max_io_wait: I/O wait fraction above which the limit is cut
+            tolerance: Relative throughput change treated as no change
+            backoff: Factor the limit is multiplied by when cut
+            io_wait: I/O wait source; defaults to reading /proc/stat
+            clock: Monotonic time source
+        """
+        if not 1 <= min_workers <= max_workers:
+            msg = f"Need 1 <= min_workers <= max_workers, got {min_workers} and {max_workers}"
+            raise ValueError(msg)
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.window = window
+        self.max_io_wait = max_io_wait
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.limit = min_workers
+        self.decisions: list[ConcurrencyDecision] = []
+        self._io_wait = io_wait if io_wait is not None else IoWaitSampler()
+        self._clock = clock
+        self._window_start = clock()
+        self._bytes = 0
+        self._video_seconds = 0.0
+        self._completed = 0
+        self._last_rate: float | None = None
+        self._last_increased = False
+
+    def observe(self, result: ScanResult) -> None:
+        """Count a completed inspection towards the current window."""
+        self._bytes += result.video_file.size
+        self._video_seconds += max(0.0, result.video_file.duration)
+        self._completed += 1
+
+    def update(self) -> ConcurrencyDecision | None:
+        """Adjust the limit if the current window is over.
+
+        Returns:
+            The decision made, or None while the window is still running
+        """
+        elapsed = self._clock() - self._window_start
+        if elapsed < self.window:
+            return None
+        # Throughput from a handful of files says little; wait for more unless
+        # the files are so long that the window would never fill
+        if self._completed < self.limit and elapsed < self.window * _MAX_WINDOW_STRETCH:
+            return None
+
+        bytes_rate = self._bytes / elapsed
+        video_rate = self._video_seconds / elapsed
+        io_wait = self._io_wait.sample()
+        previous = self.limit
+        improved = self._last_rate is None or bytes_rate > self._last_rate * (1 + self.tolerance)
+        if io_wait is not None and io_wait > self.max_io_wait:
+            self._cut()
+            reason = f"I/O wait above {self.max_io_wait:.0%}"
+        elif improved or not self._last_increased:
+            self.limit = min(self.max_workers, self.limit + 1)
+            self._last_increased = True
+            if self._last_rate is None:
+                reason = "first window"
+            else:
+                reason = "throughput improved" if improved else "probing after a cut"
+            if self.limit == previous:
+                reason += ", at max_workers"
+        else:
+            self._cut()
+            reason = "throughput plateaued"
+
+        decision = ConcurrencyDecision(
+            previous, self.limit, reason, bytes_rate, video_rate, io_wait
+        )
+        self.decisions.append(decision)
+        io_wait_text = "unknown" if io_wait is None else f"{io_wait:.0%}"
+        logger.info(
+            f"Concurrency {previous} -> {self.limit} ({reason}): "
+            f"{bytes_rate / 1e6:.1f} MB/s, {video_rate:.1f} video s/s, "
+            f"{self._completed} files in {elapsed:.0f}s, I/O wait {io_wait_text}"
+        )
+
+        self._last_rate = bytes_rate
+        self._window_start += elapsed
+        self._bytes = 0
+        self._video_seconds = 0.0
+        self._completed = 0
+        return decision
+
+    def _cut(self) -> None:
+        self.limit = max(self.min_workers, math.floor(self.limit * self.backoff))
+        self._last_increased = False
+
+
+@dataclass(frozen=True)
+class SystemLoad:
+    """One reading of :class:`SystemLoadSampler`; metrics the host lacks are None.
+
+    Attributes:
+        load_per_cpu: 1-minute load average divided by the number of CPUs
+        cpu_pressure: Percent of the last 10 seconds some task stalled on CPU
+        io_pressure: Percent of the last 10 seconds some task stalled on I/O
+    """
+
+    load_per_cpu: float | None
+    cpu_pressure: float | None
+    io_pressure: float | None
+
+
+class SystemLoadSampler:
+    """Reads the load average and pressure stall information (PSI) of the host."""
+
+    def __init__(
+        self,
+        pressure_dir: Path = _PROC_PRESSURE,
+        load_average: Callable[[], tuple[float, float, float]] | None = None,
+        cpu_count: int | None = None,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            pressure_dir: Directory holding the kernel's ``cpu`` and ``io`` PSI files
+            load_average: Load average source; defaults to ``os.getloadavg``
+            cpu_count: CPUs the load average is divided by; defaults to ``os.cpu_count()``
+        """
+        self.pressure_dir = pressure_dir
+        self._load_average = load_average or getattr(os, "getloadavg", None)
+        self.cpu_count = cpu_count or os.cpu_count() or 1
+
+    def _pressure(self, resource: str) -> float | None:
+        """Return the ``some avg10`` pressure of a resource, None if unavailable."""
+        try:
+            with (self.pressure_dir / resource).open(encoding="ascii") as f:
+                fields = f.readline().split()
+        except OSError:
+            return None
+        if not fields or fields[0] != "some":
+            return None
+        for entry in fields[1:]:
+            key, _, value = entry.partition("=")
+            if key == "avg10":
+                try:
+                    return float(value)
+                except ValueError:
+                    return None
+        return None
+
+    def sample(self) -> SystemLoad:
+        """Return the current load of the host."""
+        load_per_cpu = None
+        if self._load_average is not None:
+            with contextlib.suppress(OSError):
+                load_per_cpu = self._load_average()[0] / self.cpu_count
+        return SystemLoad(load_per_cpu, self._pressure("cpu"), self._pressure("io"))
+
+
+class LoadThrottle:
+    """Holds back new inspections while other work on the host needs its resources.
+
+    Every ``interval`` seconds the host load is compared with the configured
+    thresholds, where 0 disables a threshold and metrics the host does not
+    expose are ignored:
+
+    - While any metric is above its threshold, the limit on running
+      inspections is halved, down to 0, which pauses new launches
+    - Once every metric is below 80% of its threshold, the limit is raised
+      by one, up to ``max_workers``
+
+    Running inspections are never stopped; the limit only gates new ones.
+    Pauses and resumes are logged. Methods are meant to be called from the
+    thread running the scan engine.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        max_load_per_cpu: float = 0.0,
+        max_cpu_pressure: float = 0.0,
+        max_io_pressure: float = 0.0,
+        interval: float = 5.0,
+        sampler: SystemLoadSampler | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the throttle with the limit at ``max_workers``.
+
+        Args:
+            max_workers: Highest limit on running inspections
+            max_load_per_cpu: Load average per CPU to stay below, 0 for no limit
+            max_cpu_pressure: CPU pressure percentage to stay below, 0 for no limit
+            max_io_pressure: I/O pressure percentage to stay below, 0 for no limit
+            interval: Seconds between load checks
+            sampler: Load source; defaults to reading the host's load
+            clock: Monotonic time source
+        """
+        self.max_workers = max_workers
+        self.thresholds = {
+            "load per CPU": max_load_per_cpu,
+            "CPU pressure": max_cpu_pressure,
+            "I/O pressure": max_io_pressure,
+        }
+        self.interval = interval
+        self.limit = max_workers
+        self._sampler = sampler if sampler is not None else SystemLoadSampler()
+        self._clock = clock
+        self._next_check = clock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any threshold is set."""
+        return any(threshold > 0 for threshold in self.thresholds.values())
+
+    @property
+    def paused(self) -> bool:
+        """Whether new inspections are currently held back entirely."""
+        return self.limit == 0
+
+    def update(self) -> None:
+        """Check the host load if a check is due and adjust the limit."""
+        now = self._clock()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.interval
+        load = self._sampler.sample()
+        metrics = {
+            "load per CPU": load.load_per_cpu,
+            "CPU pressure": load.cpu_pressure,
+            "I/O pressure": load.io_pressure,
+        }
+        watched = {
+            name: (value, self.thresholds[name])
+            for name, value in metrics.items()
+            if value is not None and self.thresholds[name] > 0
+        }
+        over = [
+            f"{name} {value:.2f} > {threshold:g}"
+            for name, (value, threshold) in watched.items()
+            if value > threshold
+        ]
+        previous = self.limit
+        if over:
+            self.limit //= 2
+        elif all(value < threshold * _RESUME_FRACTION for value, threshold in watched.values()):
+            self.limit = min(self.max_workers, self.limit + 1)
+        if self.limit == previous:
+            return
+        if over:
+            action = "pausing new scans" if self.paused else f"lowering scan limit to {self.limit}"
+            logger.info(f"Host busy ({', '.join(over)}), {action}")
+        else:
+            action = "resuming scans" if previous == 0 else f"raising scan limit to {self.limit}"
+            logger.info(f"Host load dropped, {action}")
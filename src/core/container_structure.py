@@ -0,0 +1,326 @@
+"""
+In-process container structure validation for MP4 and Matroska files.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import struct
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Top-level ISO-BMFF box types a file may start with, including the uuid, styp
+# and sidx boxes that lead some vendor and segmented (DASH/CMAF) exports
+MP4_LEADING_BOXES = frozenset(
+    {
+        b"ftyp",
+        b"styp",
+        b"moov",
+        b"moof",
+        b"mdat",
+        b"free",
+        b"skip",
+        b"wide",
+        b"pnot",
+        b"uuid",
+        b"sidx",
+        b"pdin",
+    }
+)
+
+_EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+_EBML_ID_HEADER = 0x1A45DFA3
+_EBML_ID_SEGMENT = 0x18538067
+_EBML_ID_SEEK_HEAD = 0x114D9B74
+_EBML_ID_SEEK = 0x4DBB
+_EBML_ID_SEEK_ID = 0x53AB
+_EBML_ID_SEEK_POSITION = 0x53AC
+_EBML_ID_CLUSTER = 0x1F43B675
+_EBML_ID_CUES = 0x1C53BB6B
+_EBML_ID_VOID = 0xEC
+_EBML_ID_CRC32 = 0xBF
+
+# Elements allowed directly inside a Segment
+_SEGMENT_CHILDREN = {
+    _EBML_ID_SEEK_HEAD: "SeekHead",
+    0x1549A966: "Info",
+    0x1654AE6B: "Tracks",
+    _EBML_ID_CUES: "Cues",
+    _EBML_ID_CLUSTER: "Cluster",
+    0x1043A770: "Chapters",
+    0x1254C367: "Tags",
+    0x1941A469: "Attachments",
+    _EBML_ID_VOID: "Void",
+    _EBML_ID_CRC32: "CRC-32",
+}
+
+
+class _StructureError(Exception):
+    """Raised while walking a container to report a definitive structural defect."""
+
+
+class _UnparseableBoxError(_StructureError):
+    """Raised when the bytes where an ISO-BMFF box should start are not a box header."""
+
+
+@dataclass
+class StructureReport:
+    """Outcome of validating one file's container structure.
+
+    Attributes:
+        container: Detected container ("mp4", "matroska"), or "" when the format
+            is not one the validator understands
+        issues: Structural defects found; empty when the structure is intact
+    """
+
+    container: str = ""
+    issues: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether no structural defects were found."""
+        return not self.issues
+
+
+class ContainerStructureValidator:
+    """Checks the container structure of MP4 and Matroska files without decoding.
+
+    The file is memory-mapped and only element headers are read, so even large
+    files are checked with a handful of page reads and no subprocess.
+
+    - MP4/MOV: top-level boxes must chain to the end of the file without
+      running past it, a ``moov`` box must be present (except in ``styp``
+      media segments) and its children must fit inside it; padding or junk
+      after the last box is ignored once a ``moov`` has been found
+    - Matroska/WebM: the EBML header and Segment must be present, the Segment
+      must fit in the file unless its size is unknown, level 1 elements (e.g.
+      Clusters) must follow each other without gaps or garbage, and every
+      SeekHead entry (usually pointing at the Cues) must lie inside the file
+
+    Files in other formats are reported as not validated rather than invalid.
+    """
+
+    def validate(self, path: Path) -> StructureReport:
+        """Validate a file's container structure.
+
+        Args:
+            path: File to validate
+
+        Returns:
+            StructureReport: Detected container and any structural defects;
+            unreadable files are reported as not validated
+        """
+        try:
+            with path.open("rb") as f:
+                size = f.seek(0, 2)
+                if size == 0:
+                    # Nothing to map; empty files have no container to validate
+                    return StructureReport()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_RANDOM"):
+                        # Only headers are read, readahead would fetch payload data
+                        mm.madvise(mmap.MADV_RANDOM)
+                    return self._validate_mapped(mm, size)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Structure check skipped for {path}: {e}")
+            return StructureReport()
+
+    def _validate_mapped(self, mm: mmap.mmap, size: int) -> StructureReport:
+        if mm[:4] == _EBML_MAGIC:
+            report = StructureReport(container="matroska")
+            check = self._check_matroska
+        elif size >= 8 and mm[4:8] in MP4_LEADING_BOXES:
+            report = StructureReport(container="mp4")
+            check = self._check_mp4
+        else:
+            return StructureReport()
+        try:
+            check(mm, size)
+        except _StructureError as e:
+            report.issues.append(str(e))
+        return report
+
+    # ISO-BMFF
+
+    def _check_mp4(self, mm: mmap.mmap, size: int) -> None:
+        moov: tuple[int, int] | None = None
+        first_box = mm[4:8]
+        offset = 0
+        try:
+            for box_type, start, end in self._iter_boxes(mm, 0, size, size):
+                if box_type == b"moov":
+                    moov = (start, end)
+                offset = end
+        except _UnparseableBoxError:
+            # Players stop reading at the first unparseable top-level box, so
+            # padding or junk after a complete moov does not affect playback
+            if moov is None:
+                raise
+            logger.debug(f"Ignoring {size - offset} trailing bytes after the last box")
+        # A media segment (styp) takes its moov from a separate init segment
+        if moov is None and first_box != b"styp":
+            msg = "missing moov box"
+            raise _StructureError(msg)
+        if moov is not None:
+            for _box in self._iter_boxes(mm, *moov, size):
+                pass
+
+    def _iter_boxes(
+        self, mm: mmap.mmap, offset: int, end: int, file_size: int
+    ) -> Iterator[tuple[bytes, int, int]]:
+        """Yield ``(type, payload_start, box_end)`` for each box between two offsets."""
+        while end - offset >= 8:
+            box_size, box_type = struct.unpack_from(">I4s", mm, offset)
+            header = 8
+            if box_size == 1:
+                if end - offset < 16:
+                    msg = f"truncated box header at offset {offset}"
+                    raise _UnparseableBoxError(msg)
+                (box_size,) = struct.unpack_from(">Q", mm, offset + 8)
+                header = 16
+            elif box_size == 0:
+                # Box extends to the end of its parent
+                box_size = end - offset
+            name = box_type.decode("latin-1")
+            if not name.isprintable() or box_size < header:
+                msg = f"invalid box at offset {offset}"
+                raise _UnparseableBoxError(msg)
+            box_end = offset + box_size
+            if box_end > end:
+                if end == file_size:
+                    msg = (
+                        f"truncated: '{name}' box at offset {offset} needs "
+                        f"{box_end - file_size} bytes past end of file"
+                    )
+                else:
+                    msg = f"'{name}' box at offset {offset} overruns its parent"
+                raise _StructureError(msg)
+            yield box_type, offset + header, box_end
+            offset = box_end
+
+    # Matroska
+
+    def _check_matroska(self, mm: mmap.mmap, size: int) -> None:
+        element_id, data_start, data_size = self._read_element(mm, 0, size)
+        if element_id != _EBML_ID_HEADER or data_size is None:
+            msg = "invalid EBML header"
+            raise _StructureError(msg)
+        offset = data_start + data_size
+        # Skip Void elements some muxers place between the header and the Segment
+        while offset < size:
+            element_id, data_start, data_size = self._read_element(mm, offset, size)
+            if element_id == _EBML_ID_SEGMENT:
+                break
+            if element_id != _EBML_ID_VOID or data_size is None:
+                msg = f"expected Segment at offset {offset}"
+                raise _StructureError(msg)
+            offset = data_start + data_size
+        else:
+            msg = "missing Segment"
+            raise _StructureError(msg)
+
+        segment_start = data_start
+        if data_size is None:
+            segment_end = size
+        else:
+            segment_end = segment_start + data_size
+            if segment_end > size:
+                msg = f"truncated: Segment needs {segment_end - size} bytes past end of file"
+                raise _StructureError(msg)
+        self._check_segment(mm, segment_start, segment_end, size)
+
+    def _check_segment(self, mm: mmap.mmap, start: int, end: int, file_size: int) -> None:
+        """Walk level 1 elements, checking each one follows the previous without gaps."""
+        offset = start
+        while offset < end:
+            element_id, data_start, data_size = self._read_element(mm, offset, end)
+            name = _SEGMENT_CHILDREN.get(element_id)
+            if name is None:
+                msg = f"broken element chain at offset {offset}"
+                raise _StructureError(msg)
+            if data_size is None:
+                # Unknown-size (live) Clusters can only be delimited by parsing
+                # their contents, which is left to the decoder
+                return
+            element_end = data_start + data_size
+            if element_end > end:
+                if end == file_size:
+                    msg = (
+                        f"truncated: {name} at offset {offset} needs "
+                        f"{element_end - file_size} bytes past end of file"
+                    )
+                else:
+                    msg = f"{name} at offset {offset} overruns the Segment"
+                raise _StructureError(msg)
+            if element_id == _EBML_ID_SEEK_HEAD:
+                self._check_seek_head(mm, data_start, element_end, start, end)
+            offset = element_end
+
+    def _check_seek_head(
+        self, mm: mmap.mmap, start: int, end: int, segment_start: int, segment_end: int
+    ) -> None:
+        """Check that every SeekHead entry points at the element it names."""
+        for element_id, data_start, data_end in self._iter_children(mm, start, end):
+            if element_id != _EBML_ID_SEEK:
+                continue
+            target_id = position = None
+            for child_id, child_start, child_end in self._iter_children(mm, data_start, data_end):
+                if child_id == _EBML_ID_SEEK_ID:
+                    target_id = int.from_bytes(mm[child_start:child_end], "big")
+                elif child_id == _EBML_ID_SEEK_POSITION:
+                    position = int.from_bytes(mm[child_start:child_end], "big")
+            if target_id is None or position is None:
+                continue
+            name = _SEGMENT_CHILDREN.get(target_id, f"element 0x{target_id:X}")
+            target = segment_start + position
+            if target >= segment_end:
+                msg = f"truncated: SeekHead points to {name} at offset {target} past end of data"
+                raise _StructureError(msg)
+            found_id, _, _ = self._read_element(mm, target, segment_end)
+            if found_id != target_id:
+                msg = f"SeekHead entry for {name} points to offset {target} holding another element"
+                raise _StructureError(msg)
+
+    def _iter_children(
+        self, mm: mmap.mmap, offset: int, end: int
+    ) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(id, data_start, data_end)`` for sized child elements of a master element."""
+        while offset < end:
+            element_id, data_start, data_size = self._read_element(mm, offset, end)
+            if data_size is None or data_start + data_size > end:
+                msg = f"invalid element size at offset {offset}"
+                raise _StructureError(msg)
+            yield element_id, data_start, data_start + data_size
+            offset = data_start + data_size
+
+    def _read_element(self, mm: mmap.mmap, offset: int, end: int) -> tuple[int, int, int | None]:
+        """Read an element header, returning its ID, data offset and size (None if unknown)."""
+        element_id, id_length = self._read_vint(mm, offset, end, max_length=4)
+        offset += id_length
+        raw_size, size_length = self._read_vint(mm, offset, end, max_length=8)
+        # Sizes drop the length marker bit; all value bits set means "unknown size"
+        mask = (1 << (7 * size_length)) - 1
+        data_size = raw_size & mask
+        return element_id, offset + size_length, None if data_size == mask else data_size
+
+    def _read_vint(self, mm: mmap.mmap, offset: int, end: int, max_length: int) -> tuple[int, int]:
+        """Read an EBML variable-length integer, returning its raw bytes as an int and its length."""
+        if offset >= end:
+            msg = f"truncated element header at offset {offset}"
+            raise _StructureError(msg)
+        first = mm[offset]
+        length = 9 - first.bit_length()
+        if first == 0 or length > max_length:
+            msg = f"invalid element header at offset {offset}"
+            raise _StructureError(msg)
+        if offset + length > end:
+            msg = f"truncated element header at offset {offset}"
+            raise _StructureError(msg)
+        return int.from_bytes(mm[offset : offset + length], "big"), length
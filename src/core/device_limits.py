@@ -0,0 +1,76 @@
+"""
+Per-device caps on concurrent inspections, so one slow disk cannot be overloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.models.inspection import VideoFile
+
+logger = logging.getLogger(__name__)
+
+# Device key for files whose directory cannot be read; they share the default cap
+UNKNOWN_DEVICE = -1
+
+
+class DeviceLimits:
+    """Concurrency caps per storage device, identified by ``st_dev``.
+
+    Files are grouped by the device of the directory holding them, so all
+    files on one NAS mount or local disk share that device's cap. Caps are
+    configured by mount point (any path on the filesystem works); devices
+    without an explicit cap get ``default_cap``, where 0 means only the
+    engine's overall worker count applies.
+
+    Device lookups are cached per directory and are meant to be made from
+    a single thread.
+    """
+
+    def __init__(self, caps: dict[str, int] | None = None, default_cap: int = 0) -> None:
+        """Initialize the limits.
+
+        Args:
+            caps: Maximum concurrent inspections keyed by a path on the device,
+                usually its mount point; unreadable paths are skipped
+            default_cap: Cap for devices not listed in ``caps``, 0 for no cap
+        """
+        self.default_cap = default_cap
+        self._caps: dict[int, int] = {}
+        for path, cap in (caps or {}).items():
+            try:
+                self._caps[Path(path).stat().st_dev] = cap
+            except OSError as e:
+                logger.warning(f"Ignoring worker cap for {path}: {e}")
+        self._devices: dict[Path, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any device is capped."""
+        return bool(self._caps) or self.default_cap > 0
+
+    def device_of(self, video_file: VideoFile) -> int:
+        """Return the device a file is stored on.
+
+        Args:
+            video_file: File to look up
+
+        Returns:
+            The ``st_dev`` of the file's directory, or UNKNOWN_DEVICE
+        """
+        directory = video_file.path.parent
+        device = self._devices.get(directory)
+        if device is None:
+            try:
+                device = directory.stat().st_dev
+            except OSError:
+                device = UNKNOWN_DEVICE
+            self._devices[directory] = device
+        return device
+
+    def cap(self, device: int) -> int:
+        """Return the maximum concurrent inspections on a device, 0 for no cap."""
+        return self._caps.get(device, self.default_cap)
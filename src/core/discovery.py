@@ -0,0 +1,106 @@
+"""
+Background file discovery feeding scan workers through a bounded queue.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from src.core.models.inspection import VideoFile
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+class DiscoveryStream:
+    """Runs a directory walk on a background thread while its files are consumed.
+
+    Scanning can start as soon as the first file is found instead of after the
+    whole tree has been listed, which matters on slow network mounts. The queue
+    between the walk and the consumer is bounded, so the walk never runs
+    arbitrarily far ahead of the scan.
+
+    Iterating the stream yields discovered files in walk order. When no file is
+    ready within ``poll_interval`` it yields None, letting the consumer attend to
+    other work (see :meth:`ScanEngine.run`). Iteration ends once the walk has
+    finished and every file has been handed out.
+    """
+
+    def __init__(
+        self,
+        source: Iterable[VideoFile],
+        maxsize: int = 1000,
+        poll_interval: float = 0.1,
+    ) -> None:
+        """Initialize the discovery stream.
+
+        Args:
+            source: Lazily evaluated walk producing video files
+            maxsize: Maximum number of discovered files waiting to be consumed
+            poll_interval: Seconds to wait for a file before yielding None
+        """
+        self._source = source
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max(1, maxsize))
+        self._poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="scan-discovery", daemon=True)
+        self.discovered_count = 0
+        self.is_complete = False
+
+    def start(self) -> DiscoveryStream:
+        """Start walking in the background."""
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the walk and wait for the background thread to exit."""
+        self._stop.set()
+        self._thread.join()
+
+    def __enter__(self) -> DiscoveryStream:
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _produce(self) -> None:
+        try:
+            for video_file in self._source:
+                self.discovered_count += 1
+                if not self._put(video_file):
+                    return
+        except Exception:
+            logger.exception("Video file discovery failed")
+        finally:
+            self.is_complete = not self._stop.is_set()
+            self._put(_END)
+
+    def _put(self, item: object) -> bool:
+        """Block until the item is queued, giving up if the stream is closed."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self._poll_interval)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[VideoFile | None]:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._poll_interval)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                yield None
+                continue
+            if item is _END:
+                return
+            yield item  # type: ignore[misc]
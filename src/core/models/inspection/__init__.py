@@ -33,6 +33,9 @@ class VideoFile(BaseModel):
     path: Path = Field(..., description="Filesystem path to the video file")
     duration: float = Field(0.0, description="Video duration in seconds (set by scanner)")
     media_type: MediaType = Field(MediaType.MOVIE, description="Type of media content")
+    video_codec: str = Field("", description="Codec of the first video stream (set by probe)")
+    width: int = Field(0, description="Frame width in pixels (set by probe)")
+    height: int = Field(0, description="Frame height in pixels (set by probe)")
 
     @field_validator("path", mode="before")
     @classmethod
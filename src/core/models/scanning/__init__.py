@@ -17,12 +17,35 @@ class ScanMode(Enum):
         DEEP: Thorough scan analyzing entire video stream
         HYBRID: Smart scan - quick first, then deep for suspicious files
         FULL: Complete scan of entire video stream without timeout
+        KEYFRAME: Triage scan decoding only the keyframes of the whole video stream
+        BITSTREAM: Triage scan parsing every packet of the file without decoding
+        PROBE: Triage scan validating container structure from ffprobe packet metadata
+        ZEROBLOCK: Whole-file read finding zero-filled block runs left by storage corruption
     """
 
     QUICK = "quick"
     DEEP = "deep"
     HYBRID = "hybrid"
     FULL = "full"
+    KEYFRAME = "keyframe"
+    BITSTREAM = "bitstream"
+    PROBE = "probe"
+    ZEROBLOCK = "zeroblock"
+
+
+class ScanOrder(Enum):
+    """Order in which discovered files are handed to scan workers.
+
+    Attributes:
+        DISCOVERY: Scan files as soon as they are found, without waiting for discovery
+        LONGEST_FIRST: Most expensive files first, so no long file is left to finish
+            alone at the end of the scan (shortest overall scan time)
+        SHORTEST_FIRST: Cheapest files first, for the most results early on
+    """
+
+    DISCOVERY = "discovery"
+    LONGEST_FIRST = "longest-first"
+    SHORTEST_FIRST = "shortest-first"
 
 
 class OutputFormat(Enum):
@@ -64,11 +87,37 @@ class FileStatus(Enum):
         HEALTHY: File is healthy (not corrupt and doesn't need deep scan)
         CORRUPT: File has been identified as corrupt
         SUSPICIOUS: File needs deep scan (may be corrupt)
+        STALLED: FFmpeg stopped making progress and was killed, no verdict
     """
 
     HEALTHY = "healthy"
     CORRUPT = "corrupt"
     SUSPICIOUS = "suspicious"
+    STALLED = "stalled"
+
+
+class IssueCode(Enum):
+    """Machine-readable reasons for verdicts reached by targeted checks.
+
+    Attributes:
+        EMPTY_FILE: File has zero length
+        TYPE_MISMATCH: File content does not match its extension (e.g. an HTML
+            error page saved as .mkv)
+        SPARSE_FILE: Most of the file is unallocated holes, e.g. an unfinished
+            preallocated download
+        ZERO_FILLED: File starts with zero-filled blocks instead of a container header
+        BROKEN_CONTAINER: Container structure is truncated or broken
+        ZERO_BLOCKS: File contains runs of zero-filled blocks
+        TRUNCATED: Decoding stops short of the duration declared by the container
+    """
+
+    EMPTY_FILE = "empty_file"
+    TYPE_MISMATCH = "type_mismatch"
+    SPARSE_FILE = "sparse_file"
+    ZERO_FILLED = "zero_filled"
+    BROKEN_CONTAINER = "broken_container"
+    ZERO_BLOCKS = "zero_blocks"
+    TRUNCATED = "truncated"
 
 
 class ScanResult(BaseModel):
@@ -85,6 +134,14 @@ class ScanResult(BaseModel):
         deep_scan_completed: Whether deep scan was performed
         timestamp: When the scan was performed
         confidence: Confidence level of corruption detection (0.0-1.0)
+        issue_code: Reason for a verdict reached without decoding, if any
+        damaged_ranges: ``(start, end)`` byte offsets of damaged regions found
+            by a zero-block scan, end exclusive
+        stalled: Whether FFmpeg was killed by the stall watchdog because
+            decoding stopped advancing (e.g. an NFS stall or decoder livelock)
+        error_timestamps: ``(seconds, message)`` of each FFmpeg error logged by
+            a deep or full scan, timed by the decoding progress reported about
+            twice a second
     """
 
     video_file: VideoFile
@@ -97,6 +154,10 @@ class ScanResult(BaseModel):
     deep_scan_completed: bool = False
     timestamp: float = Field(default_factory=time.time)
     confidence: float = 0.0
+    issue_code: IssueCode | None = None
+    damaged_ranges: list[tuple[int, int]] = Field(default_factory=list)
+    stalled: bool = False
+    error_timestamps: list[tuple[float, str]] = Field(default_factory=list)
 
     @property
     def filename(self) -> str:
@@ -113,6 +174,8 @@ class ScanResult(BaseModel):
         """Get human-readable status."""
         if self.is_corrupt:
             return "CORRUPT"
+        if self.stalled:
+            return "STALLED"
         if self.needs_deep_scan:
             return "SUSPICIOUS"
         return "HEALTHY"
@@ -165,6 +228,8 @@ class ScanResult(BaseModel):
         """Get file status based on scan results."""
         if self.is_corrupt:
             return FileStatus.CORRUPT
+        if self.stalled:
+            return FileStatus.STALLED
         if self.needs_deep_scan:
             return FileStatus.SUSPICIOUS
         return FileStatus.HEALTHY
@@ -198,6 +263,8 @@ class ScanSummary(BaseModel):
         started_at: Timestamp when scan started
         completed_at: Timestamp when scan completed (None if incomplete)
         was_resumed: Whether this scan was resumed from previous state
+        skipped_unchanged: Files skipped by an incremental scan because they were
+            unchanged since their last verdict
     """
 
     directory: Path
@@ -212,6 +279,7 @@ class ScanSummary(BaseModel):
     started_at: float = Field(default_factory=time.time)
     completed_at: float | None = None
     was_resumed: bool = False
+    skipped_unchanged: int = 0
 
     @property
     def success_rate(self) -> float:
@@ -326,6 +394,9 @@ class ScanSummary(BaseModel):
         if self.deep_scans_needed > 0:
             lines.append(f"Deep Scans: {self.deep_scans_completed}/{self.deep_scans_needed}")
 
+        if self.skipped_unchanged > 0:
+            lines.append(f"Unchanged: {self.skipped_unchanged} files reused their last verdict")
+
         if self.was_resumed:
             lines.append("Note: This scan was resumed from a previous session")
 
@@ -337,12 +408,17 @@ class ScanProgress(BaseModel):
 
     Attributes:
         current_file: Path of currently processing file
-        total_files: Total number of files to process
+        total_files: Total number of files to process; while discovery is still
+            running this is the number of files discovered so far
         processed_count: Number of files already processed
         corrupt_count: Number of corrupt files found so far
         phase: Current scan phase (scanning, deep_scan, etc.)
         scan_mode: Current scan mode being used
         start_time: When the scan started
+        discovery_complete: Whether the directory walk has finished and
+            total_files is final
+        active_files: Fraction (0.0-1.0) of each file decoded so far, for deep
+            and full scans still in progress
     """
 
     current_file: str | None = None
@@ -352,6 +428,8 @@ class ScanProgress(BaseModel):
     phase: ScanPhase = ScanPhase.SCANNING
     scan_mode: ScanMode = ScanMode.QUICK
     start_time: float = Field(default_factory=time.time)
+    discovery_complete: bool = True
+    active_files: dict[str, float] = Field(default_factory=dict)
 
     @property
     def remaining_count(self) -> int:
@@ -365,10 +443,11 @@ class ScanProgress(BaseModel):
 
     @property
     def progress_percentage(self) -> float:
-        """Get progress as percentage (0-100)."""
+        """Get progress as percentage (0-100), counting partly decoded files."""
         if self.total_files == 0:
             return 0.0
-        return min(100.0, (self.processed_count / self.total_files) * 100.0)
+        done = self.processed_count + sum(self.active_files.values())
+        return min(100.0, (done / self.total_files) * 100.0)
 
     @property
     def elapsed_time(self) -> float:
@@ -380,6 +459,8 @@ class ScanProgress(BaseModel):
         """Estimate remaining time in seconds."""
         if self.processed_count == 0 or self.remaining_count == 0:
             return None
+        if not self.discovery_complete:
+            return None
 
         avg_time_per_file = self.elapsed_time / self.processed_count
         return avg_time_per_file * self.remaining_count
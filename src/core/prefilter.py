@@ -0,0 +1,186 @@
+"""
+Cheap pre-checks that rule out files before any FFmpeg process is started.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.core.container_structure import MP4_LEADING_BOXES
+from src.core.models.scanning import IssueCode
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_BLOCK_SIZE = 4096
+
+# Leading bytes of each container, as (offset, signature) alternatives
+_MP4_SIGNATURES = tuple((4, box) for box in sorted(MP4_LEADING_BOXES))
+_SIGNATURES: dict[str, tuple[tuple[int, bytes], ...]] = {
+    "mp4": _MP4_SIGNATURES,
+    "matroska": ((0, b"\x1a\x45\xdf\xa3"),),
+    "avi": ((0, b"RIFF"),),
+    "asf": ((0, b"\x30\x26\xb2\x75\x8e\x66\xcf\x11"),),
+    "flv": ((0, b"FLV"),),
+    "mpeg-ps": ((0, b"\x00\x00\x01\xba"), (0, b"\x00\x00\x01\xb3")),
+    "mpeg-ts": ((0, b"\x47"), (4, b"\x47")),
+}
+
+# Containers each extension is expected to hold. MPEG program and transport
+# streams are left out: demuxers resynchronise past leading garbage, so their
+# first bytes say nothing about whether the file plays.
+_EXTENSION_CONTAINERS: dict[str, str] = {
+    ".mp4": "mp4",
+    ".m4v": "mp4",
+    ".mov": "mp4",
+    ".mkv": "matroska",
+    ".webm": "matroska",
+    ".avi": "avi",
+    ".wmv": "asf",
+    ".asf": "asf",
+    ".flv": "flv",
+}
+
+# Prefixes of text documents commonly saved in place of a video
+_TEXT_PREFIXES = (b"<!doctype", b"<html", b"<?xml", b"<head", b"{", b"[")
+
+
+@dataclass
+class PrefilterFinding:
+    """A verdict reached without decoding the file.
+
+    Attributes:
+        code: Machine-readable reason
+        message: Human-readable description
+        confidence: Confidence that the file is unusable (0.0-1.0)
+    """
+
+    code: IssueCode
+    message: str
+    confidence: float
+
+
+class FilePrefilter:
+    """Rules out files that cannot be valid video from metadata and a few bytes.
+
+    Checks, cheapest first:
+
+    - Zero-length files
+    - Sparse files whose extents are mostly holes (``SEEK_DATA``/``SEEK_HOLE``),
+      typical of unfinished preallocated downloads
+    - Files starting with zero-filled blocks instead of a container header
+    - Files whose leading bytes match no video container although their
+      extension names one, such as HTML error pages saved as .mkv
+
+    Files that pass are not known to be healthy, only worth decoding.
+    """
+
+    def __init__(self, max_hole_fraction: float = 0.5, max_extents: int = 4096):
+        """Initialize the pre-filter.
+
+        Args:
+            max_hole_fraction: Fraction of a file that may be holes before it is
+                reported as sparse
+            max_extents: Maximum data extents examined per file; larger files are
+                judged on the range examined
+        """
+        self.max_hole_fraction = max_hole_fraction
+        self.max_extents = max_extents
+
+    def check(self, path: Path) -> PrefilterFinding | None:
+        """Check a file.
+
+        Args:
+            path: File to check
+
+        Returns:
+            PrefilterFinding if the file cannot be valid video, otherwise None;
+            unreadable files are left to the decoder
+        """
+        try:
+            with path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return PrefilterFinding(IssueCode.EMPTY_FILE, "File is empty", 1.0)
+                return self._check_holes(f.fileno(), size) or self._check_header(
+                    f.read(_BLOCK_SIZE), path.suffix.lower()
+                )
+        except OSError as e:
+            logger.debug(f"Pre-filter skipped for {path}: {e}")
+            return None
+
+    def _check_holes(self, fd: int, size: int) -> PrefilterFinding | None:
+        """Measure how much of the file is unallocated using SEEK_DATA/SEEK_HOLE."""
+        if not hasattr(os, "SEEK_DATA"):
+            return None
+        data_bytes = 0
+        position = 0
+        try:
+            for _ in range(self.max_extents):
+                try:
+                    data_start = os.lseek(fd, position, os.SEEK_DATA)
+                except OSError as e:
+                    if e.errno != errno.ENXIO:
+                        raise
+                    # No data after position, the rest of the file is a hole
+                    position = size
+                    break
+                position = os.lseek(fd, data_start, os.SEEK_HOLE)
+                data_bytes += position - data_start
+                if position >= size:
+                    break
+        except OSError as e:
+            logger.debug(f"Hole detection unavailable: {e}")
+            return None
+        finally:
+            os.lseek(fd, 0, os.SEEK_SET)
+
+        examined = min(position, size)
+        hole_fraction = 1 - data_bytes / examined if examined else 0.0
+        if hole_fraction <= self.max_hole_fraction:
+            return None
+        return PrefilterFinding(
+            IssueCode.SPARSE_FILE,
+            f"File is {hole_fraction:.0%} unallocated holes (incomplete download?)",
+            0.9,
+        )
+
+    def _check_header(self, head: bytes, extension: str) -> PrefilterFinding | None:
+        """Check the leading bytes against known containers and the file extension."""
+        if not head.strip(b"\x00"):
+            return PrefilterFinding(
+                IssueCode.ZERO_FILLED,
+                "File starts with zero-filled data, no container header",
+                0.95,
+            )
+        if any(_matches(head, container) for container in _SIGNATURES):
+            return None
+        if head.lstrip().lower().startswith(_TEXT_PREFIXES):
+            return PrefilterFinding(
+                IssueCode.TYPE_MISMATCH,
+                f"Content does not match {extension} extension: file is a text document "
+                "(e.g. an HTML error page)",
+                0.95,
+            )
+        expected = _EXTENSION_CONTAINERS.get(extension)
+        if expected is None:
+            return None
+        return PrefilterFinding(
+            IssueCode.TYPE_MISMATCH,
+            f"Content does not match {extension} extension: expected {expected}, "
+            "found no known video container",
+            0.95,
+        )
+
+
+def _matches(head: bytes, container: str) -> bool:
+    return any(
+        head[offset : offset + len(signature)] == signature
+        for offset, signature in _SIGNATURES[container]
+    )
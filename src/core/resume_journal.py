@@ -0,0 +1,145 @@
+"""
+Append-only journal recording per-file scan verdicts so interrupted scans can resume.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from src.core.models.scanning import ScanResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResumeEntry:
+    """Verdict recorded for one completed file."""
+
+    path: str
+    is_corrupt: bool = False
+    needs_deep_scan: bool = False
+    scan_mode: str | None = None
+
+
+class ResumeJournal:
+    """Append-only resume journal with one JSON record per completed file.
+
+    Records are appended as files finish, so the cost of saving progress does not
+    grow with the size of the scan. Writes are flushed to the OS immediately but
+    only fsynced every ``fsync_interval`` seconds, bounding how much progress a
+    power loss can drop. When the same file is recorded more than once the last
+    record wins; :meth:`load` compacts the journal down to one record per file
+    and discards a torn final line left by a crash.
+    """
+
+    def __init__(self, path: Path, fsync_interval: float = 5.0) -> None:
+        """Initialize the resume journal.
+
+        Args:
+            path: Location of the journal file
+            fsync_interval: Minimum seconds between fsync calls; 0 syncs every record
+        """
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self._file: IO[str] | None = None
+        self._last_sync = time.monotonic()
+
+    def load(self) -> dict[str, ResumeEntry]:
+        """Read the journal and compact it in place.
+
+        Returns:
+            dict[str, ResumeEntry]: Latest entry for every recorded file, keyed by path
+        """
+        if not self.path.exists():
+            return {}
+
+        entries: dict[str, ResumeEntry] = {}
+        line_count = 0
+        with self.path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line_count += 1
+                try:
+                    entry = ResumeEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    logger.warning(f"Skipping unreadable resume record in {self.path}")
+                    continue
+                entries[entry.path] = entry
+
+        if line_count != len(entries):
+            self._compact(entries)
+        return entries
+
+    def _compact(self, entries: dict[str, ResumeEntry]) -> None:
+        """Atomically rewrite the journal with a single record per file."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for entry in entries.values():
+                f.write(json.dumps(asdict(entry)) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_path.replace(self.path)
+        logger.debug(f"Compacted resume journal to {len(entries)} records")
+
+    def open(self, truncate: bool = False) -> None:
+        """Open the journal for appending.
+
+        Args:
+            truncate: Discard any existing records first
+        """
+        self._file = self.path.open("w" if truncate else "a", encoding="utf-8")
+        self._last_sync = time.monotonic()
+
+    def record(self, result: ScanResult) -> None:
+        """Append the verdict for a completed file.
+
+        Args:
+            result: Scan result to record
+        """
+        if self._file is None:
+            msg = "Resume journal is not open"
+            raise RuntimeError(msg)
+        entry = ResumeEntry(
+            path=str(result.video_file.path),
+            is_corrupt=result.is_corrupt,
+            needs_deep_scan=result.needs_deep_scan,
+            scan_mode=result.scan_mode.value,
+        )
+        self._file.write(json.dumps(asdict(entry)) + "\n")
+        self._file.flush()
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the journal."""
+        if self._file is None:
+            return
+        self._sync()
+        self._file.close()
+        self._file = None
+
+    def remove(self) -> None:
+        """Close and delete the journal once it is no longer needed."""
+        self.close()
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove resume file: {e}")
+
+    def __enter__(self) -> ResumeJournal:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
@@ -0,0 +1,359 @@
+"""
+Concurrent execution engine for per-file video inspections.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Final
+
+from src.core.device_limits import DeviceLimits
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from src.core.concurrency import ConcurrencyController, LoadThrottle
+    from src.core.models.inspection import VideoFile
+    from src.core.models.scanning import ScanResult
+
+logger = logging.getLogger(__name__)
+
+
+class _Exhausted(Enum):
+    """Marker returned by ``next()`` once the input has no files left."""
+
+    TOKEN = auto()
+
+
+_EXHAUSTED: Final = _Exhausted.TOKEN
+
+
+@dataclass
+class FollowUpStage:
+    """Second inspection stage fed by results of the first, e.g. HYBRID deep scans.
+
+    Files selected from first-stage results are queued and inspected on a
+    separate worker pool as soon as a worker is free, while the first stage
+    keeps running. ``on_result`` runs on the thread that called
+    :meth:`ScanEngine.run`, like the first-stage callback.
+
+    Attributes:
+        inspect: Function performing the follow-up inspection of a single file
+        on_result: Callback receiving each completed follow-up result
+        select: Predicate choosing the first-stage results that need a follow-up
+        max_workers: Maximum number of follow-up inspections running at once
+        pending: Files waiting for a follow-up worker; may be seeded up front,
+            e.g. with files left over from an interrupted scan. Only the
+            engine thread may touch it once the run has started
+        incoming: Files handed over from other threads, e.g. a discovery walk
+            finding leftovers of an interrupted scan; the engine moves them to
+            ``pending``
+        completed: Number of follow-up results delivered
+    """
+
+    inspect: Callable[[VideoFile], ScanResult]
+    on_result: Callable[[ScanResult], None]
+    select: Callable[[ScanResult], bool]
+    max_workers: int = 1
+    pending: deque[VideoFile] = field(default_factory=deque)
+    incoming: queue.SimpleQueue[VideoFile] = field(default_factory=queue.SimpleQueue)
+    completed: int = 0
+
+    def collect_incoming(self) -> None:
+        """Move files handed over through ``incoming`` to ``pending``."""
+        while True:
+            try:
+                self.pending.append(self.incoming.get_nowait())
+            except queue.Empty:
+                return
+
+
+class _DeviceSlots:
+    """Inspections running on each device and files held back until it has capacity."""
+
+    def __init__(self, limits: DeviceLimits | None) -> None:
+        self._limits = limits or DeviceLimits()
+        self._enabled = self._limits.enabled
+        self._running: Counter[int] = Counter()
+        self._held: dict[int, deque[VideoFile]] = {}
+        self.held_count = 0
+
+    def _has_capacity(self, device: int) -> bool:
+        cap = self._limits.cap(device)
+        return cap <= 0 or self._running[device] < cap
+
+    def try_acquire(self, video_file: VideoFile) -> bool:
+        """Reserve a slot on the file's device, returning False if it is at its cap."""
+        if not self._enabled:
+            return True
+        device = self._limits.device_of(video_file)
+        if not self._has_capacity(device):
+            return False
+        self._running[device] += 1
+        return True
+
+    def release(self, video_file: VideoFile) -> None:
+        """Free the slot taken by a finished inspection."""
+        if self._enabled:
+            self._running[self._limits.device_of(video_file)] -= 1
+
+    def hold(self, video_file: VideoFile) -> None:
+        """Keep a file whose device is at its cap for later."""
+        self._held.setdefault(self._limits.device_of(video_file), deque()).append(video_file)
+        self.held_count += 1
+
+    def take_held(self) -> VideoFile | None:
+        """Take a held file from the least busy device with capacity, reserving its slot."""
+        ready = [
+            device for device, files in self._held.items() if files and self._has_capacity(device)
+        ]
+        if not ready:
+            return None
+        device = min(ready, key=lambda d: self._running[d])
+        self._running[device] += 1
+        self.held_count -= 1
+        return self._held[device].popleft()
+
+    def take_from(self, pending: deque[VideoFile]) -> VideoFile | None:
+        """Take the first queued file whose device has capacity, reserving its slot."""
+        for index, video_file in enumerate(pending):
+            if self.try_acquire(video_file):
+                del pending[index]
+                return video_file
+        return None
+
+
+class ScanEngine:
+    """Bounded worker pool that runs file inspections concurrently.
+
+    Each inspection typically blocks on an FFmpeg subprocess, so a thread pool
+    gives real parallelism. Results are delivered to ``on_result`` on the thread
+    that called :meth:`run`, which means callers can update progress counters
+    and resume state without any locking.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        should_stop: Callable[[], bool] | None = None,
+        poll_interval: float = 0.1,
+        *,
+        device_limits: DeviceLimits | None = None,
+        read_ahead: int = 1000,
+        controller: ConcurrencyController | None = None,
+        throttle: LoadThrottle | None = None,
+    ) -> None:
+        """Initialize the scan engine.
+
+        Args:
+            max_workers: Maximum number of inspections running at once
+            should_stop: Optional predicate checked before each dispatch; when it
+                returns True no new work is started
+            poll_interval: Seconds to wait for running inspections before asking a
+                starved input for more files
+            device_limits: Optional caps on inspections running per storage device,
+                shared by both stages of a run
+            read_ahead: Maximum files held back while their device is at its cap;
+                reading ahead finds work for other devices
+            controller: Optional controller adjusting how many of the
+                ``max_workers`` first-stage inspections run at once
+            throttle: Optional limit on inspections of both stages started while
+                the host is under load
+        """
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.device_limits = device_limits
+        self.read_ahead = read_ahead
+        self.controller = controller
+        self.throttle = throttle
+        self._should_stop = should_stop or (lambda: False)
+
+    def _worker_limit(self) -> int:
+        if self.controller is None:
+            return self.max_workers
+        return min(self.max_workers, self.controller.limit)
+
+    def _throttled(self, running: int) -> bool:
+        return self.throttle is not None and running >= self.throttle.limit
+
+    def run(
+        self,
+        video_files: Iterable[VideoFile | None],
+        inspect: Callable[[VideoFile], ScanResult],
+        on_result: Callable[[ScanResult], None],
+        *,
+        precheck: Callable[[VideoFile], ScanResult | None] | None = None,
+        on_idle: Callable[[], None] | None = None,
+        follow_up: FollowUpStage | None = None,
+    ) -> int:
+        """Inspect files concurrently until the input is exhausted or a stop is requested.
+
+        Files are pulled from ``video_files`` lazily, so at most ``max_workers``
+        inspections are queued at any time. The input may yield None to signal
+        that no file is ready yet (e.g. a :class:`DiscoveryStream` still walking);
+        completed results keep being delivered in the meantime. When a stop is
+        requested, pending work is not started but inspections already running
+        are allowed to finish and their results are still delivered.
+
+        ``precheck`` runs on the calling thread before a file is dispatched. If it
+        returns a result, that result is delivered directly and the file never
+        occupies a worker, so cheap checks must not block for long.
+
+        ``on_idle`` also runs on the calling thread, every ``poll_interval``
+        seconds in which no inspection completes, so progress made inside long
+        inspections can be reported without locking.
+
+        With a ``controller``, first-stage results are fed to it and its limit
+        caps the inspections started; running inspections above a lowered
+        limit are allowed to finish.
+
+        With a ``throttle``, no inspection of either stage is started while as
+        many as its limit are running, so the run pauses while the host is
+        busy and picks up again once the load drops.
+
+        With ``device_limits``, a file whose device is at its cap is held back
+        and the input is read ahead for files on other devices, so work is
+        interleaved across devices instead of queueing behind the slowest one.
+        Held files are dispatched, least busy device first, as slots free up.
+
+        With a ``follow_up`` stage, results it selects are queued for a second
+        inspection that runs on its own pool alongside the first stage. The run
+        ends once both stages are drained; a stop request leaves queued
+        follow-ups in ``follow_up.pending``.
+
+        Args:
+            video_files: Files to inspect
+            inspect: Function performing the inspection of a single file
+            on_result: Callback receiving each completed result
+            precheck: Optional check returning a final result for files that need
+                no inspection, or None to inspect the file
+            on_idle: Optional callback run while waiting on running inspections
+            follow_up: Optional second stage fed with selected results
+
+        Returns:
+            Number of first-stage results delivered
+        """
+        files = iter(video_files)
+        in_flight: dict[Future[ScanResult], VideoFile] = {}
+        follow_up_in_flight: dict[Future[ScanResult], VideoFile] = {}
+        delivered = 0
+        exhausted = False
+        slots = _DeviceSlots(self.device_limits)
+
+        def deliver(result: ScanResult) -> None:
+            nonlocal delivered
+            on_result(result)
+            delivered += 1
+            if follow_up is not None and follow_up.select(result):
+                follow_up.pending.append(result.video_file)
+
+        with (
+            ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="scan-worker"
+            ) as executor,
+            ThreadPoolExecutor(
+                max_workers=follow_up.max_workers if follow_up else 1,
+                thread_name_prefix="scan-follow-up",
+            ) as follow_up_executor,
+        ):
+            while True:
+                # Top up the pool while there is capacity and no stop request
+                starved = False
+                while len(in_flight) < self._worker_limit() and not self._throttled(
+                    len(in_flight) + len(follow_up_in_flight)
+                ):
+                    if self._should_stop():
+                        exhausted = True
+                        break
+                    video_file = slots.take_held()
+                    if video_file is None:
+                        if exhausted or slots.held_count >= self.read_ahead:
+                            break
+                        item = next(files, _EXHAUSTED)
+                        if item is _EXHAUSTED:
+                            exhausted = True
+                            break
+                        if item is None:
+                            starved = True
+                            break
+                        video_file = item
+                        if precheck is not None:
+                            result = precheck(video_file)
+                            if result is not None:
+                                deliver(result)
+                                continue
+                        if not slots.try_acquire(video_file):
+                            slots.hold(video_file)
+                            continue
+                    in_flight[executor.submit(inspect, video_file)] = video_file
+
+                if follow_up is not None:
+                    follow_up.collect_incoming()
+                    while (
+                        follow_up.pending
+                        and len(follow_up_in_flight) < follow_up.max_workers
+                        and not self._throttled(len(in_flight) + len(follow_up_in_flight))
+                        and not self._should_stop()
+                    ):
+                        video_file = slots.take_from(follow_up.pending)
+                        if video_file is None:
+                            break
+                        future = follow_up_executor.submit(follow_up.inspect, video_file)
+                        follow_up_in_flight[future] = video_file
+
+                if not in_flight and not follow_up_in_flight:
+                    waiting = slots.held_count or (follow_up is not None and follow_up.pending)
+                    if self._should_stop() or (exhausted and not waiting):
+                        break
+                    if self.throttle is not None and self.throttle.paused:
+                        # Nothing running to wait on until the host load drops
+                        time.sleep(self.poll_interval)
+                        if on_idle is not None:
+                            on_idle()
+                        self.throttle.update()
+                    continue
+
+                polling = (
+                    starved
+                    or on_idle is not None
+                    or self.controller is not None
+                    or self.throttle is not None
+                )
+                done, _ = wait(
+                    [*in_flight, *follow_up_in_flight],
+                    timeout=self.poll_interval if polling else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                if not done and on_idle is not None:
+                    on_idle()
+                for future in done:
+                    is_follow_up = future in follow_up_in_flight
+                    video_file = (follow_up_in_flight if is_follow_up else in_flight).pop(future)
+                    slots.release(video_file)
+                    try:
+                        result = future.result()
+                    except Exception:
+                        logger.exception("Inspection failed: %s", video_file.path)
+                        continue
+                    if follow_up is not None and is_follow_up:
+                        follow_up.on_result(result)
+                        follow_up.completed += 1
+                    else:
+                        if self.controller is not None:
+                            self.controller.observe(result)
+                        deliver(result)
+                if self.controller is not None:
+                    self.controller.update()
+                if self.throttle is not None:
+                    self.throttle.update()
+
+        return delivered
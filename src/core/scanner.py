@@ -3,33 +3,87 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
 import logging
 import os
-import subprocess
+import queue
 import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from src.config import load_config
+from src.core.concurrency import ConcurrencyController, LoadThrottle
+from src.core.container_structure import ContainerStructureValidator
+from src.core.device_limits import DeviceLimits
+from src.core.discovery import DiscoveryStream
+from src.core.errors.errors import FFmpegError
+from src.core.file_walker import VideoFileWalker
 from src.core.models.inspection import VideoFile
 from src.core.models.scanning import (
+    IssueCode,
     ScanMode,
+    ScanOrder,
+    ScanPhase,
     ScanProgress,
     ScanResult,
     ScanSummary,
 )
+from src.core.prefilter import FilePrefilter, PrefilterFinding
+from src.core.resume_journal import ResumeJournal
+from src.core.scan_engine import FollowUpStage, ScanEngine
+from src.core.scheduler import ScanCostEstimator, order_by_cost
+from src.core.zero_blocks import BLOCK_SIZE, ZeroBlockDetector
+from src.database.models import FileFingerprintDatabaseModel
+from src.database.service import DatabaseService
 from src.ffmpeg.corruption_detector import CorruptionDetector
 from src.ffmpeg.ffmpeg_client import FFmpegClient
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
 
     from src.config.config import AppConfig
+    from src.core.resume_journal import ResumeEntry
 
 logger = logging.getLogger(__name__)
 
+# Modes whose inconclusive results are deferred to a deep scan
+_TRIAGE_MODES = frozenset({ScanMode.QUICK, ScanMode.KEYFRAME, ScanMode.BITSTREAM, ScanMode.PROBE})
+
+# Modes that decode every frame, whose verdicts hold for any decoding scan mode
+_FULL_DECODE_MODES = frozenset({ScanMode.DEEP, ScanMode.FULL})
+
+# Seconds async scans held back by host load wait before checking it again
+_LOAD_POLL_SECONDS = 0.5
+
+
+@dataclass
+class _DiscoveryTally:
+    """Counts kept by the discovery thread while a scan is running.
+
+    Files whose verdict is carried forward from the resume journal or an
+    unchanged fingerprint count as processed without being inspected. In HYBRID
+    scans, resumed files still waiting for their deep scan are counted in
+    ``resumed_suspicious`` as well.
+    """
+
+    discovered: int = 0
+    resumed: int = 0
+    resumed_suspicious: int = 0
+    unchanged: int = 0
+    carried_processed: int = 0
+    carried_corrupt: int = 0
+
+    @property
+    def queued(self) -> int:
+        return self.discovered - self.resumed - self.unchanged
+
+    def carry(self, is_corrupt: bool) -> None:
+        self.carried_processed += 1
+        if is_corrupt:
+            self.carried_corrupt += 1
+
 
 class VideoScanner:
     def _get_resume_path(self, directory: Path) -> Path:
@@ -41,18 +95,10 @@ class VideoScanner:
             raise OSError(msg)
         # Use a unique name for each scan directory
         safe_dir = directory.resolve().as_posix().replace("/", "_").lstrip("_")
-        return output_dir / f".scan_resume_{safe_dir}.json"
+        return output_dir / f".scan_resume_{safe_dir}.jsonl"
 
-    def _save_resume_state(self, resume_path: Path, processed_files: set[str]) -> None:
-        with resume_path.open("w", encoding="utf-8") as f:
-            json.dump({"processed_files": list(processed_files)}, f)
-
-    def _load_resume_state(self, resume_path: Path) -> set[str]:
-        if not resume_path.exists():
-            return set()
-        with resume_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        return set(data.get("processed_files", []))
+    def _create_resume_journal(self, resume_path: Path) -> ResumeJournal:
+        return ResumeJournal(resume_path, fsync_interval=self.config.scan.resume_fsync_interval)
 
     def __init__(self, config: AppConfig | None = None) -> None:
         """Initialize the video scanner.
@@ -67,6 +113,8 @@ class VideoScanner:
         self._shutdown_requested = False
         self._current_scan_summary: ScanSummary | None = None
         self.corruption_detector = CorruptionDetector()
+        self.prefilter = FilePrefilter(max_hole_fraction=config.scan.max_hole_fraction)
+        self.structure_validator = ContainerStructureValidator()
 
         logger.info("VideoScanner initialized with config: %s", config.scan)
 
@@ -209,40 +257,42 @@ class VideoScanner:
         Returns:
             List of video files found
         """
-        try:
-            try:
-                loop = asyncio.get_running_loop()
-                # If already running, create a new loop in a new thread
+        return sorted(
+            self.iter_video_files(directory, recursive=recursive, extensions=extensions),
+            key=lambda x: x.path,
+        )
 
-                result = []
+    def order_video_files(
+        self,
+        video_files: list[VideoFile],
+        directory: Path,
+        scan_mode: ScanMode,
+        order: ScanOrder,
+    ) -> list[VideoFile]:
+        """Order files for scanning by their expected inspection cost.
 
-                def run():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    result.append(
-                        new_loop.run_until_complete(
-                            self._find_video_files_async(directory, recursive, extensions)
-                        )
-                    )
-                    new_loop.close()
+        Costs come from how long each file took in earlier scans of the same
+        mode, stored in the database, falling back to the file size (see
+        :class:`~src.core.scheduler.ScanCostEstimator`).
 
-                t = threading.Thread(target=run)
-                t.start()
-                t.join()
-                return result[0]
-            except RuntimeError:
-                # No running event loop, create a new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(
-                        self._find_video_files_async(directory, recursive, extensions)
-                    )
-                finally:
-                    loop.close()
-        except Exception:
-            logger.exception("Error in get_video_files")
-            raise
+        Args:
+            video_files: Files to order
+            directory: Directory the files were found in, to look up history
+            scan_mode: Scan mode the files will be inspected with
+            order: Requested order; DISCOVERY returns the files unchanged
+
+        Returns:
+            Files in scan order
+        """
+        if order == ScanOrder.DISCOVERY:
+            return video_files
+        store = self._create_fingerprint_store()
+        try:
+            estimator = self._create_cost_estimator(store, directory, scan_mode)
+        finally:
+            if store is not None:
+                store.close()
+        return order_by_cost(video_files, estimator, order)
 
     def request_shutdown(self) -> None:
         """Request graceful shutdown of current scan operation."""
@@ -261,15 +311,55 @@ class VideoScanner:
         recursive: bool = True,
         resume: bool = True,
         progress_callback: Callable[[ScanProgress], None] | None = None,
+        *,
+        incremental: bool = False,
+        result_callback: Callable[[ScanResult], None] | None = None,
+        order: ScanOrder = ScanOrder.DISCOVERY,
     ) -> ScanSummary:
         """Scan a directory for corrupt video files.
 
+        Each file is pre-checked in-process before FFmpeg runs: empty, sparse,
+        zero-filled and mis-typed files (``scan.prefilter``) are reported corrupt
+        with an issue code and never occupy a scan worker, and structurally
+        broken MP4/MKV containers (``scan.structure_check``) are reported by the
+        worker without running FFmpeg.
+
+        Every conclusive verdict is stored in the database together with the
+        file's fingerprint (size, mtime, inode, device). In incremental mode,
+        files whose fingerprint is unchanged and whose verdict is younger than
+        ``scan.incremental_max_age_days`` are not inspected again; their stored
+        verdict is counted instead. Only verdicts from a scan at least as
+        thorough as ``scan_mode`` are reused, so a deep scan re-inspects files
+        that were only triaged by a quick or keyframe scan.
+
+        With ``scan.adaptive_workers``, the number of concurrent scans starts at
+        ``scan.min_workers`` and is tuned up to ``scan.max_workers`` from the
+        measured throughput (see :class:`~src.core.concurrency.ConcurrencyController`).
+
+        Filesystems capped in ``scan.device_workers`` (or by
+        ``scan.default_device_workers``) never run more scans at once than
+        their cap; files on other filesystems are scanned in the meantime.
+
+        In HYBRID mode, files the quick pass flags as suspicious are deep-scanned
+        on a separate pool of ``scan.deep_workers`` workers while quick scans
+        continue. Suspicious files are kept in the resume journal until their
+        deep verdict replaces the quick one, so a resumed scan deep-scans those
+        left over from an interrupted run.
+
         Args:
             directory: Directory to scan
             scan_mode: Type of scan to perform
             recursive: Whether to scan subdirectories
             resume: Whether to resume from previous scan state
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates, also called
+                as deep and full decodes advance (see ``ScanProgress.active_files``)
+            incremental: Whether to skip files unchanged since their last verdict
+            result_callback: Optional callback receiving each file's result as
+                soon as it is inspected; a hybrid deep result follows the
+                quick result for the same file
+            order: Order files are scanned in; any order other than DISCOVERY
+                waits for discovery to finish and sorts by expected cost (see
+                :meth:`order_video_files`)
 
         Returns:
             ScanSummary: Summary of the scan operation
@@ -277,226 +367,236 @@ class VideoScanner:
         logger.info("Starting directory scan: %s", directory)
         logger.info("Scan mode: %s, recursive: %s", scan_mode.value, recursive)
 
-        # Get video files
-        video_files = self.get_video_files(directory, recursive=recursive)
-        if not video_files:
-            logger.warning("No video files found to scan")
-            return ScanSummary(
-                directory=directory,
-                total_files=0,
-                processed_files=0,
-                corrupt_files=0,
-                healthy_files=0,
-                scan_mode=scan_mode,
-                scan_time=0.0,
-            )
+        journal = self._create_resume_journal(self._get_resume_path(directory))
+        resumed_entries: dict[str, ResumeEntry] = journal.load() if resume else {}
+        if resumed_entries:
+            logger.info(f"Resume state found with {len(resumed_entries)} completed files.")
+        fingerprint_store = self._create_fingerprint_store()
+        known_fingerprints: dict[str, FileFingerprintDatabaseModel] = {}
+        if incremental and fingerprint_store is not None:
+            known_fingerprints = fingerprint_store.get_file_fingerprints_under(str(directory))
+        tally = _DiscoveryTally()
+        file_stats: dict[str, os.stat_result] = {}
+        verify_time = time.time()
+        # HYBRID files interrupted before their deep scan, handed from the
+        # discovery thread to the engine's deep scan stage
+        resumed_deep_scans: queue.SimpleQueue[VideoFile] = queue.SimpleQueue()
 
-        logger.info("Found %d video files to scan", len(video_files))
-        resume_path = self._get_resume_path(directory)
-        processed_files: set[str] = set()
-        was_resumed = False
-        if resume and resume_path.exists():
-            processed_files = self._load_resume_state(resume_path)
-            if processed_files:
-                logger.info(f"Resuming scan, skipping {len(processed_files)} files.")
-                was_resumed = True
+        def files_to_inspect() -> Iterator[VideoFile]:
+            # Runs on the discovery thread; files with a verdict carried forward
+            # from the resume journal or an unchanged fingerprint are not yielded
+            for video_file in self.iter_video_files(directory, recursive=recursive):
+                tally.discovered += 1
+                path = str(video_file.path)
+                entry = resumed_entries.get(path)
+                if entry is not None:
+                    tally.carry(entry.is_corrupt)
+                    tally.resumed += 1
+                    if scan_mode == ScanMode.HYBRID and _awaits_deep_scan(entry):
+                        # Interrupted before its deep scan; the quick verdict stays counted
+                        tally.resumed_suspicious += 1
+                        resumed_deep_scans.put(video_file)
+                    continue
+                # Fingerprints are taken before inspection, so a file modified while
+                # it is being scanned gets a stale fingerprint and is re-checked later
+                stat_result = self._stat_file(video_file) if fingerprint_store else None
+                if stat_result is not None:
+                    file_stats[path] = stat_result
+                    fingerprint = known_fingerprints.get(path)
+                    if fingerprint is not None and self._is_unchanged(
+                        fingerprint, stat_result, verify_time, scan_mode
+                    ):
+                        tally.carry(fingerprint.is_corrupt)
+                        tally.unchanged += 1
+                        continue
+                yield video_file
+
+        verified: list[FileFingerprintDatabaseModel] = []
+
+        def record_verdict(result: ScanResult) -> None:
+            journal.record(result)
+            if result_callback:
+                result_callback(result)
+            stat_result = file_stats.get(str(result.video_file.path))
+            # Failed, timed-out and still-suspicious files are re-checked next time
+            conclusive = result.is_corrupt or not (result.error_message or result.needs_deep_scan)
+            if stat_result and conclusive:
+                verified.append(FileFingerprintDatabaseModel.from_scan_result(result, stat_result))
 
         # Initialize tracking variables
-        suspicious_files: list[VideoFile] = []
-        progress: ScanProgress = ScanProgress(
-            total_files=len(video_files),
-            processed_count=0,
-            corrupt_count=0,
-            scan_mode=scan_mode.value,
-        )
+        progress: ScanProgress = ScanProgress(scan_mode=scan_mode.value, discovery_complete=False)
+        scanned_count = 0
+        scanned_corrupt_count = 0
+        escalated_count = 0
         start_time: float = time.time()
-        detector: CorruptionDetector = CorruptionDetector()
         deep_scans_needed: int = 0
         deep_scans_completed: int = 0
+        ffmpeg_client = self._create_ffmpeg_client()
+        if ffmpeg_client is not None and fingerprint_store is not None:
+            self._load_decode_speed(ffmpeg_client, fingerprint_store)
+        # Fraction decoded of each file in a deep or full scan, written by FFmpeg
+        # progress threads; single key updates need no locking
+        decode_positions: dict[str, float] = {}
 
-        # Phase 1: Quick scan (for HYBRID or QUICK modes only)
-        if scan_mode in (ScanMode.QUICK, ScanMode.HYBRID):
-            for video_file in video_files:
-                if self._shutdown_requested:
-                    break
-                video_file_str: str = str(video_file.path)
-                if resume and video_file_str in processed_files:
-                    continue
-                progress.processed_count += 1
-                progress.current_file = video_file_str
-                # Run FFmpeg to analyze file (quick scan)
-                # Only analyze first 10 seconds for quick scan
-                ffmpeg_cmd: list[str] = [
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-t",
-                    "10",
-                    "-i",
-                    video_file_str,
-                    "-f",
-                    "null",
-                    "-",
-                ]
-                try:
-                    proc = subprocess.run(
-                        ffmpeg_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=30,
-                        check=False,
-                    )
-                    stderr = proc.stderr
-                    exit_code = proc.returncode
-                except Exception as e:
-                    stderr = str(e)
-                    exit_code = 1
-                analysis = detector.analyze_ffmpeg_output(stderr, exit_code, is_quick_scan=True)
-                if analysis.is_corrupt:
-                    progress.corrupt_count += 1
-                elif analysis.needs_deep_scan and scan_mode == ScanMode.HYBRID:
-                    suspicious_files.append(video_file)
-                processed_files.add(video_file_str)
-                self._save_resume_state(resume_path, processed_files)
-                if progress_callback:
-                    progress_callback(progress)
-
-        # Phase 2: Deep/Full scan (for HYBRID, DEEP, or FULL modes)
-        if scan_mode == ScanMode.HYBRID and suspicious_files:
-            deep_scans_needed = len(suspicious_files)
-            for video_file in suspicious_files:
-                if self._shutdown_requested:
-                    break
-                video_file_str = str(video_file.path)
-                ffmpeg_cmd = [
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-i",
-                    video_file_str,
-                    "-f",
-                    "null",
-                    "-",
-                ]
-                try:
-                    proc = subprocess.run(
-                        ffmpeg_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                        check=False,
-                    )
-                    stderr = proc.stderr
-                    exit_code = proc.returncode
-                except Exception as e:
-                    stderr = str(e)
-                    exit_code = 1
-                analysis = detector.analyze_ffmpeg_output(stderr, exit_code, is_quick_scan=False)
-                deep_scans_completed += 1
-                if analysis.is_corrupt:
-                    progress.corrupt_count += 1
-                if progress_callback:
-                    progress_callback(progress)
-        elif scan_mode == ScanMode.DEEP:
-            deep_scans_needed = len(video_files)
-            for video_file in video_files:
-                if self._shutdown_requested:
-                    break
-                video_file_str = str(video_file.path)
-                if resume and video_file_str in processed_files:
-                    continue
-                progress.processed_count += 1
-                progress.current_file = video_file_str
-                ffmpeg_cmd = [
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-i",
-                    video_file_str,
-                    "-f",
-                    "null",
-                    "-",
-                ]
-                try:
-                    proc = subprocess.run(
-                        ffmpeg_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=60,
-                        check=False,
-                    )
-                    stderr = proc.stderr
-                    exit_code = proc.returncode
-                except Exception as e:
-                    stderr = str(e)
-                    exit_code = 1
-                analysis = detector.analyze_ffmpeg_output(stderr, exit_code, is_quick_scan=False)
-                deep_scans_completed += 1
-                if analysis.is_corrupt:
-                    progress.corrupt_count += 1
-                processed_files.add(video_file_str)
-                self._save_resume_state(resume_path, processed_files)
-                if progress_callback:
-                    progress_callback(progress)
-        elif scan_mode == ScanMode.FULL:
-            deep_scans_needed = len(video_files)
-            for video_file in video_files:
-                if self._shutdown_requested:
-                    break
-                video_file_str = str(video_file.path)
-                if resume and video_file_str in processed_files:
-                    continue
-                progress.processed_count += 1
-                progress.current_file = video_file_str
-                ffmpeg_cmd = [
-                    "ffmpeg",
-                    "-v",
-                    "error",
-                    "-i",
-                    video_file_str,
-                    "-f",
-                    "null",
-                    "-",
-                ]
-                try:
-                    # No timeout for FULL scan mode
-                    proc = subprocess.run(
-                        ffmpeg_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=None,
-                        check=False,
+        def on_decode_progress(video_file: VideoFile, position: float) -> None:
+            fraction = _decoded_fraction(video_file, position)
+            if fraction is not None:
+                decode_positions[str(video_file.path)] = fraction
+
+        if ffmpeg_client is not None and progress_callback:
+            ffmpeg_client.progress_listener = on_decode_progress
+        max_workers = self._get_max_workers()
+        engine = ScanEngine(
+            max_workers=max_workers,
+            should_stop=lambda: self._shutdown_requested,
+            device_limits=DeviceLimits(
+                self.config.scan.device_workers, self.config.scan.default_device_workers
+            ),
+            read_ahead=self.config.scan.discovery_queue_size,
+            controller=self._create_concurrency_controller(max_workers),
+            throttle=self._create_load_throttle(
+                max_workers + (self.config.scan.deep_workers if scan_mode == ScanMode.HYBRID else 0)
+            ),
+        )
+        if engine.controller is not None:
+            logger.info(
+                "Scanning with %d to %d concurrent workers, adjusted from throughput",
+                engine.controller.min_workers,
+                engine.max_workers,
+            )
+        else:
+            logger.info("Scanning with %d concurrent workers", engine.max_workers)
+        if engine.throttle is not None:
+            logger.info("Holding back new scans while the host is busy")
+        discovery = DiscoveryStream(
+            files_to_inspect(), maxsize=self.config.scan.discovery_queue_size
+        )
+
+        def report(result: ScanResult) -> None:
+            decode_positions.pop(str(result.video_file.path), None)
+            progress.active_files = dict(decode_positions)
+            progress.current_file = str(result.video_file.path)
+            progress.total_files = tally.discovered
+            progress.discovery_complete = discovery.is_complete
+            progress.processed_count = tally.carried_processed + scanned_count
+            progress.corrupt_count = tally.carried_corrupt + scanned_corrupt_count
+            if (
+                deep_stage is not None
+                and progress.discovery_complete
+                and progress.processed_count >= progress.total_files
+                and (
+                    deep_stage.pending
+                    or deep_stage.completed < escalated_count + tally.resumed_suspicious
+                )
+            ):
+                # Every quick scan is done, only deep scans are left
+                progress.phase = ScanPhase.DEEP_SCAN
+            if progress_callback:
+                progress_callback(progress)
+
+        def report_decoding() -> None:
+            # Called while no file completes, so long decodes still move progress
+            if progress_callback and decode_positions != progress.active_files:
+                progress.active_files = dict(decode_positions)
+                progress.total_files = tally.discovered
+                progress.discovery_complete = discovery.is_complete
+                progress_callback(progress)
+
+        def on_primary_result(result: ScanResult) -> None:
+            # Runs on this thread, so counters and resume state need no locking
+            nonlocal scanned_count, scanned_corrupt_count, escalated_count
+            scanned_count += 1
+            if result.is_corrupt:
+                scanned_corrupt_count += 1
+            elif result.needs_deep_scan and deep_stage is not None:
+                escalated_count += 1
+            record_verdict(result)
+            report(result)
+
+        def on_deep_result(result: ScanResult) -> None:
+            # The deep verdict replaces the quick one in the resume journal
+            nonlocal scanned_corrupt_count
+            if result.is_corrupt:
+                scanned_corrupt_count += 1
+            record_verdict(result)
+            report(result)
+
+        deep_stage: FollowUpStage | None = None
+        if scan_mode == ScanMode.HYBRID:
+            deep_stage = FollowUpStage(
+                inspect=lambda video_file: self._inspect_file(
+                    ffmpeg_client, video_file, ScanMode.DEEP
+                ),
+                on_result=on_deep_result,
+                select=lambda result: result.needs_deep_scan and not result.is_corrupt,
+                max_workers=self.config.scan.deep_workers,
+                incoming=resumed_deep_scans,
+            )
+            logger.info("Deep scanning suspicious files with %d workers", deep_stage.max_workers)
+        # Quick scan for QUICK/HYBRID, or the single deep/full pass, running while
+        # discovery is still walking the directory. HYBRID deep scans run on their
+        # own workers as soon as the quick pass flags a file.
+        primary_mode = ScanMode.QUICK if scan_mode == ScanMode.HYBRID else scan_mode
+        journal.open(truncate=not resume)
+        try:
+            with discovery:
+                source: Iterable[VideoFile | None] = discovery
+                if order != ScanOrder.DISCOVERY:
+                    estimator = self._create_cost_estimator(
+                        fingerprint_store, directory, primary_mode
                     )
-                    stderr = proc.stderr
-                    exit_code = proc.returncode
-                except Exception as e:
-                    stderr = str(e)
-                    exit_code = 1
-                analysis = detector.analyze_ffmpeg_output(stderr, exit_code, is_quick_scan=False)
-                deep_scans_completed += 1
-                if analysis.is_corrupt:
-                    progress.corrupt_count += 1
-                processed_files.add(video_file_str)
-                self._save_resume_state(resume_path, processed_files)
-                if progress_callback:
-                    progress_callback(progress)
-        # Remove resume file if scan completed or was interrupted
-        if resume_path.exists():
-            try:
-                resume_path.unlink()
-            except Exception as e:
-                logger.warning(f"Failed to remove resume file: {e}")
+                    discovered = [video_file for video_file in discovery if video_file]
+                    source = order_by_cost(discovered, estimator, order)
+                completed = engine.run(
+                    source,
+                    lambda video_file: self._inspect_file(ffmpeg_client, video_file, primary_mode),
+                    on_primary_result,
+                    precheck=lambda video_file: self._precheck_file(video_file, scan_mode),
+                    on_idle=report_decoding,
+                    follow_up=deep_stage,
+                )
+            logger.info(
+                "Discovered %d video files (%d resumed, %d unchanged)",
+                tally.discovered,
+                tally.resumed,
+                tally.unchanged,
+            )
+            if scan_mode in (ScanMode.DEEP, ScanMode.FULL):
+                deep_scans_needed = tally.queued
+                deep_scans_completed = completed
+            elif deep_stage is not None:
+                deep_scans_needed = escalated_count + tally.resumed_suspicious
+                deep_scans_completed = deep_stage.completed
+        finally:
+            journal.close()
+            if fingerprint_store is not None:
+                self._store_fingerprints(fingerprint_store, verified)
+                if ffmpeg_client is not None:
+                    self._store_decode_speed(ffmpeg_client, fingerprint_store)
+                fingerprint_store.close()
+
+        if tally.discovered == 0:
+            logger.warning("No video files found to scan")
+
+        # Keep the journal when interrupted so the next run can pick up from here
+        if self._shutdown_requested:
+            logger.info(f"Scan interrupted, resume state kept at {journal.path}")
+        else:
+            journal.remove()
         # Create summary
+        processed_count = tally.carried_processed + scanned_count
+        corrupt_count = tally.carried_corrupt + scanned_corrupt_count
         summary: ScanSummary = ScanSummary(
             directory=directory,
-            total_files=len(video_files),
-            processed_files=progress.processed_count,
-            corrupt_files=progress.corrupt_count,
-            healthy_files=progress.processed_count - progress.corrupt_count,
+            total_files=tally.discovered,
+            processed_files=processed_count,
+            corrupt_files=corrupt_count,
+            healthy_files=processed_count - corrupt_count,
             scan_mode=scan_mode,
             scan_time=time.time() - start_time,
         )
-        summary.was_resumed = was_resumed
+        summary.was_resumed = tally.resumed > 0
+        summary.skipped_unchanged = tally.unchanged
         summary.deep_scans_needed = deep_scans_needed
         summary.deep_scans_completed = deep_scans_completed
         logger.info(
@@ -558,6 +658,14 @@ class VideoScanner:
                 )
                 progress_callback(progress)
 
+            # Files ruled out by the pre-checks need no FFmpeg run
+            result = self._precheck_file(video_file, mode) or self._check_structure(
+                video_file, mode
+            )
+            if result is not None:
+                results.append(result)
+                continue
+
             # Perform scan based on mode
             result = None
             if mode == ScanMode.QUICK:
@@ -571,6 +679,14 @@ class VideoScanner:
                     result = ffmpeg_client.inspect_deep(video_file)
             elif mode == ScanMode.FULL:
                 result = ffmpeg_client.inspect_full(video_file)
+            elif mode == ScanMode.KEYFRAME:
+                result = ffmpeg_client.inspect_keyframe(video_file)
+            elif mode == ScanMode.BITSTREAM:
+                result = ffmpeg_client.inspect_bitstream(video_file)
+            elif mode == ScanMode.PROBE:
+                result = ffmpeg_client.inspect_probe(video_file)
+            elif mode == ScanMode.ZEROBLOCK:
+                result = self._inspect_zero_blocks(video_file)
             else:  # pragma: no cover
                 logger.error("Unknown scan mode: %s", mode)  # type: ignore[unreachable]
                 # Skip this file if unknown mode
@@ -586,8 +702,414 @@ class VideoScanner:
         )
         return results
 
+    async def scan_files_async(
+        self,
+        video_files: list[VideoFile],
+        scan_mode: ScanMode,
+        max_concurrency: int | None = None,
+        progress_callback: Callable[[ScanProgress], None] | None = None,
+    ) -> list[ScanResult]:
+        """Scan video files concurrently on the running event loop.
+
+        FFmpeg runs as asyncio subprocesses bounded by a semaphore, so the event
+        loop stays free to serve other requests while decodes are in progress.
+        Files are pre-checked in-process like in :meth:`scan_directory`, so both
+        give the same verdicts.
+        Per-device caps from ``scan.device_workers`` and holding back new
+        scans while the host is busy apply as in :meth:`scan_directory`.
+
+        Args:
+            video_files: Video files to scan
+            scan_mode: Type of scan to perform
+            max_concurrency: Maximum concurrent FFmpeg processes (defaults to config)
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            List of scan results for the files that were scanned
+        """
+        ffmpeg_client = self._create_ffmpeg_client()
+        max_workers = max_concurrency or self._get_max_workers()
+        semaphore = asyncio.Semaphore(max_workers)
+        throttle = self._create_load_throttle(max_workers)
+        running = 0
+        device_limits = DeviceLimits(
+            self.config.scan.device_workers, self.config.scan.default_device_workers
+        )
+        device_semaphores: dict[int, asyncio.Semaphore] = {}
+
+        def device_slot(video_file: VideoFile) -> contextlib.AbstractAsyncContextManager[None]:
+            device = device_limits.device_of(video_file)
+            cap = device_limits.cap(device)
+            if cap <= 0:
+                return contextlib.nullcontext()
+            return device_semaphores.setdefault(device, asyncio.Semaphore(cap))
+
+        progress = ScanProgress(total_files=len(video_files), scan_mode=scan_mode.value)
+        results: list[ScanResult] = []
+
+        def on_decode_progress(video_file: VideoFile, position: float) -> None:
+            # FFmpeg progress is read on the event loop as well
+            fraction = _decoded_fraction(video_file, position)
+            if fraction is not None and progress_callback:
+                progress.active_files[str(video_file.path)] = fraction
+                progress_callback(progress)
+
+        if ffmpeg_client is not None and progress_callback:
+            ffmpeg_client.progress_listener = on_decode_progress
+
+        async def wait_for_load() -> None:
+            while throttle is not None:
+                throttle.update()
+                if running < throttle.limit:
+                    return
+                await asyncio.sleep(_LOAD_POLL_SECONDS)
+
+        async def scan_one(video_file: VideoFile) -> None:
+            nonlocal running
+            # The device slot is taken first, so files waiting on a busy device
+            # leave the shared slots to files on other devices
+            async with device_slot(video_file), semaphore:
+                await wait_for_load()
+                if self._shutdown_requested:
+                    return
+                running += 1
+                try:
+                    # The same in-process checks as scan_directory, off the event loop
+                    precheck = await asyncio.to_thread(self._precheck_file, video_file, scan_mode)
+                    result = precheck or await self._inspect_file_async(
+                        ffmpeg_client, video_file, scan_mode
+                    )
+                finally:
+                    running -= 1
+            # All tasks share one event loop thread, so no locking is needed here
+            results.append(result)
+            progress.active_files.pop(str(video_file.path), None)
+            progress.processed_count += 1
+            progress.current_file = str(video_file.path)
+            if result.is_corrupt:
+                progress.corrupt_count += 1
+            if progress_callback:
+                progress_callback(progress)
+
+        await asyncio.gather(*(scan_one(video_file) for video_file in video_files))
+
+        logger.info(
+            "Async scan completed: %d files, %d corrupt",
+            len(results),
+            progress.corrupt_count,
+        )
+        return results
+
     # Private methods
 
+    def _create_fingerprint_store(self) -> DatabaseService | None:
+        """Open the database holding file fingerprints, or None if it is unavailable."""
+        try:
+            return DatabaseService.from_config(self.config.database)
+        except Exception as e:
+            logger.warning(f"File fingerprints unavailable, incremental scanning disabled: {e}")
+            return None
+
+    def _create_concurrency_controller(self, max_workers: int) -> ConcurrencyController | None:
+        """Build the adaptive worker count controller, or None if it is disabled."""
+        scan_config = self.config.scan
+        if not scan_config.adaptive_workers:
+            return None
+        return ConcurrencyController(
+            min(scan_config.min_workers, max_workers),
+            max_workers,
+            window=scan_config.adaptive_window,
+            max_io_wait=scan_config.max_io_wait,
+        )
+
+    def _create_load_throttle(self, max_workers: int) -> LoadThrottle | None:
+        """Build the throttle holding back scans while the host is busy, or None if it is off."""
+        scan_config = self.config.scan
+        throttle = LoadThrottle(
+            max_workers,
+            max_load_per_cpu=scan_config.max_load_per_cpu,
+            max_cpu_pressure=scan_config.max_cpu_pressure,
+            max_io_pressure=scan_config.max_io_pressure,
+            interval=scan_config.load_check_interval,
+        )
+        return throttle if throttle.enabled else None
+
+    def _create_cost_estimator(
+        self,
+        store: DatabaseService | None,
+        directory: Path,
+        scan_mode: ScanMode,
+    ) -> ScanCostEstimator:
+        """Build a cost estimator from past inspection times."""
+        history: dict[str, tuple[int, float]] = {}
+        if store is not None:
+            try:
+                history = store.get_inspection_times_under(str(directory), scan_mode.value)
+            except Exception as e:
+                logger.warning(f"Scan history unavailable, ordering by file size: {e}")
+        return ScanCostEstimator(history)
+
+    def _stat_file(self, video_file: VideoFile) -> os.stat_result | None:
+        """Stat a file for fingerprinting, or None if it cannot be read."""
+        try:
+            return video_file.path.stat()
+        except OSError:
+            return None
+
+    def _is_unchanged(
+        self,
+        fingerprint: FileFingerprintDatabaseModel,
+        stat_result: os.stat_result,
+        now: float,
+        scan_mode: ScanMode,
+    ) -> bool:
+        """Check whether a stored verdict still applies to a file.
+
+        Args:
+            fingerprint: Stored fingerprint and verdict
+            stat_result: Current file status
+            now: Reference time for the verdict age
+            scan_mode: Scan mode the file would be inspected with
+
+        Returns:
+            True if the file is unchanged, the verdict has not expired and it
+            came from a scan at least as thorough as ``scan_mode``
+        """
+        max_age_seconds = self.config.scan.incremental_max_age_days * 24 * 60 * 60
+        if max_age_seconds > 0 and now - fingerprint.verified_at > max_age_seconds:
+            return False
+        try:
+            verdict_mode = ScanMode(fingerprint.scan_mode)
+        except ValueError:
+            return False
+        return _verdict_covers(verdict_mode, scan_mode) and fingerprint.matches(stat_result)
+
+    def _store_fingerprints(
+        self,
+        fingerprint_store: DatabaseService,
+        fingerprints: list[FileFingerprintDatabaseModel],
+    ) -> None:
+        """Persist verdicts without letting a database problem fail the scan."""
+        try:
+            fingerprint_store.store_file_fingerprints(fingerprints)
+        except Exception:
+            logger.exception("Failed to store file fingerprints")
+
+    def _load_decode_speed(self, ffmpeg_client: FFmpegClient, store: DatabaseService) -> None:
+        """Seed the client's decode speed model, used for adaptive timeouts, from history."""
+        try:
+            ffmpeg_client.decode_speed.load(store.get_decode_speed_samples())
+        except Exception:
+            logger.exception("Failed to load decode speed history")
+
+    def _store_decode_speed(self, ffmpeg_client: FFmpegClient, store: DatabaseService) -> None:
+        """Persist decode speed samples measured during the scan."""
+        try:
+            store.store_decode_speed_samples(ffmpeg_client.decode_speed.take_unsaved())
+        except Exception:
+            logger.exception("Failed to store decode speed samples")
+
+    def _get_max_workers(self) -> int:
+        """Return the number of concurrent inspections to run.
+
+        ``processing.max_workers`` is the global worker limit and
+        ``scan.max_workers`` the per-scan setting; the smaller one wins.
+        """
+        return max(1, min(self.config.processing.max_workers, self.config.scan.max_workers))
+
+    def _create_ffmpeg_client(self) -> FFmpegClient | None:
+        """Create the FFmpeg client used for a scan, or None if FFmpeg is unavailable."""
+        try:
+            return FFmpegClient(self.config.ffmpeg)
+        except FFmpegError:
+            logger.exception("FFmpeg is not available, files cannot be inspected")
+            return None
+
+    def _precheck_file(self, video_file: VideoFile, scan_mode: ScanMode) -> ScanResult | None:
+        """Run the prefilter on a file before it is dispatched to a worker.
+
+        Only the prefilter's few header and metadata reads run here, on the
+        dispatch thread; the container structure check walks the file and runs
+        in the worker (see :meth:`_check_structure`).
+
+        Returns:
+            A corrupt result if the prefilter rules the file out, otherwise None
+            so the file is inspected
+        """
+        if not self.config.scan.prefilter:
+            return None
+        start_time = time.time()
+        finding = self.prefilter.check(video_file.path)
+        return self._finding_result(video_file, scan_mode, finding, start_time)
+
+    def _check_structure(self, video_file: VideoFile, scan_mode: ScanMode) -> ScanResult | None:
+        """Validate a file's container structure in-process. Called from worker threads.
+
+        Returns:
+            A corrupt result if the structure is broken, otherwise None so the
+            file is inspected with FFmpeg
+        """
+        if not self.config.scan.structure_check:
+            return None
+        start_time = time.time()
+        report = self.structure_validator.validate(video_file.path)
+        finding = None
+        if not report.is_valid:
+            finding = PrefilterFinding(
+                IssueCode.BROKEN_CONTAINER,
+                f"Structural corruption: {'; '.join(report.issues)}",
+                0.9,
+            )
+        return self._finding_result(video_file, scan_mode, finding, start_time)
+
+    def _finding_result(
+        self,
+        video_file: VideoFile,
+        scan_mode: ScanMode,
+        finding: PrefilterFinding | None,
+        start_time: float,
+    ) -> ScanResult | None:
+        """Turn an in-process check's finding into a corrupt result, or None if there is none."""
+        if finding is None:
+            return None
+        logger.info(
+            f"Pre-check flagged {video_file.path} ({finding.code.value}): {finding.message}"
+        )
+        return ScanResult(
+            video_file=video_file,
+            is_corrupt=True,
+            error_message=finding.message,
+            inspection_time=time.time() - start_time,
+            scan_mode=scan_mode,
+            confidence=finding.confidence,
+            issue_code=finding.code,
+        )
+
+    def _inspect_file(
+        self,
+        ffmpeg_client: FFmpegClient | None,
+        video_file: VideoFile,
+        scan_mode: ScanMode,
+    ) -> ScanResult:
+        """Inspect a single file with the given scan mode. Called from worker threads."""
+        structure_result = self._check_structure(video_file, scan_mode)
+        if structure_result is not None:
+            return structure_result
+        if scan_mode == ScanMode.ZEROBLOCK:
+            return self._inspect_zero_blocks(video_file)
+        if ffmpeg_client is None:
+            return _ffmpeg_unavailable(video_file, scan_mode)
+        inspections: dict[ScanMode, Callable[[VideoFile], ScanResult]] = {
+            ScanMode.QUICK: ffmpeg_client.inspect_quick,
+            ScanMode.KEYFRAME: ffmpeg_client.inspect_keyframe,
+            ScanMode.BITSTREAM: ffmpeg_client.inspect_bitstream,
+            ScanMode.PROBE: ffmpeg_client.inspect_probe,
+            ScanMode.FULL: ffmpeg_client.inspect_full,
+        }
+        # DEEP, also used for the deep scans of HYBRID
+        return inspections.get(scan_mode, ffmpeg_client.inspect_deep)(video_file)
+
+    def _inspect_zero_blocks(self, video_file: VideoFile) -> ScanResult:
+        """Read a whole file looking for runs of zero-filled blocks. Called from worker threads."""
+        start_time = time.time()
+        detector = ZeroBlockDetector(min_run_blocks=self.config.scan.zero_block_min_run)
+        try:
+            runs = detector.find_zero_runs(video_file.path)
+        except OSError as e:
+            return ScanResult(
+                video_file=video_file,
+                scan_mode=ScanMode.ZEROBLOCK,
+                error_message=f"Cannot read file: {e}",
+                inspection_time=time.time() - start_time,
+            )
+        result = ScanResult(
+            video_file=video_file,
+            scan_mode=ScanMode.ZEROBLOCK,
+            inspection_time=time.time() - start_time,
+        )
+        if runs:
+            zero_blocks = sum(end - start for start, end in runs) // BLOCK_SIZE
+            result.is_corrupt = True
+            result.confidence = 0.85
+            result.issue_code = IssueCode.ZERO_BLOCKS
+            result.damaged_ranges = runs
+            result.error_message = (
+                f"{zero_blocks} zero-filled blocks in {len(runs)} regions, "
+                f"first at bytes {runs[0][0]}-{runs[0][1]}"
+            )
+            logger.info(f"Zero-filled regions in {video_file.path}: {runs}")
+        return result
+
+    async def _inspect_file_async(
+        self,
+        ffmpeg_client: FFmpegClient | None,
+        video_file: VideoFile,
+        scan_mode: ScanMode,
+    ) -> ScanResult:
+        """Inspect a single file on the event loop; HYBRID escalates to a deep scan."""
+        structure_result = await asyncio.to_thread(self._check_structure, video_file, scan_mode)
+        if structure_result is not None:
+            return structure_result
+        if scan_mode == ScanMode.ZEROBLOCK:
+            return await asyncio.to_thread(self._inspect_zero_blocks, video_file)
+        if ffmpeg_client is None:
+            return _ffmpeg_unavailable(video_file, scan_mode)
+        if scan_mode == ScanMode.HYBRID:
+            result = await ffmpeg_client.inspect_quick_async(video_file)
+            if result.needs_deep_scan:
+                result = await ffmpeg_client.inspect_deep_async(video_file)
+            return result
+        inspections: dict[ScanMode, Callable[[VideoFile], Awaitable[ScanResult]]] = {
+            ScanMode.QUICK: ffmpeg_client.inspect_quick_async,
+            ScanMode.KEYFRAME: ffmpeg_client.inspect_keyframe_async,
+            ScanMode.BITSTREAM: ffmpeg_client.inspect_bitstream_async,
+            ScanMode.PROBE: ffmpeg_client.inspect_probe_async,
+            ScanMode.FULL: ffmpeg_client.inspect_full_async,
+        }
+        return await inspections.get(scan_mode, ffmpeg_client.inspect_deep_async)(video_file)
+
+    def create_file_walker(
+        self, *, recursive: bool = True, extensions: list[str] | None = None
+    ) -> VideoFileWalker:
+        """Create a directory walker configured from the scan settings.
+
+        Args:
+            recursive: Whether to search subdirectories
+            extensions: File extensions to include (defaults to config)
+
+        Returns:
+            VideoFileWalker: Walker for locating video files
+        """
+        scan_config = self.config.scan
+        return VideoFileWalker(
+            extensions if extensions is not None else scan_config.extensions,
+            recursive=recursive,
+            skip_hidden=scan_config.skip_hidden_dirs,
+            exclude_dirs=scan_config.exclude_dirs,
+            max_workers=scan_config.discovery_workers,
+        )
+
+    def iter_video_files(
+        self,
+        directory: Path,
+        *,
+        recursive: bool = True,
+        extensions: list[str] | None = None,
+    ) -> Iterator[VideoFile]:
+        """Lazily yield video files as the directory is traversed, in no particular order.
+
+        Args:
+            directory: Directory to search
+            recursive: Whether to search subdirectories
+            extensions: File extensions to include (defaults to config)
+
+        Yields:
+            VideoFile: Each video file as soon as it is found
+        """
+        walker = self.create_file_walker(recursive=recursive, extensions=extensions)
+        for file_path in walker.walk(directory):
+            yield VideoFile(path=file_path)
+
     async def _find_video_files_async(
         self,
         directory: Path,
@@ -595,31 +1117,42 @@ class VideoScanner:
         extensions: list[str] | None,
     ) -> list[VideoFile]:
         """Find all video files in directory asynchronously."""
-        if extensions is None:
-            extensions = self.config.scan.extensions
+        return await asyncio.to_thread(
+            self.get_video_files, directory, recursive=recursive, extensions=extensions
+        )
+
 
-        logger.debug("Scanning for video files with extensions: %s", extensions)
+def _ffmpeg_unavailable(video_file: VideoFile, scan_mode: ScanMode) -> ScanResult:
+    """Result for a file that cannot be inspected because FFmpeg is missing."""
+    return ScanResult(
+        video_file=video_file,
+        scan_mode=scan_mode,
+        needs_deep_scan=scan_mode in _TRIAGE_MODES,
+        error_message="FFmpeg command not found",
+    )
 
-        video_files: list[VideoFile] = []
 
-        # Use asyncio to make file system operations non-blocking
-        def _scan_directory() -> Iterator[VideoFile]:
-            pattern = "**/*" if recursive else "*"
-            logger.debug(f"Scanning directory: {directory}, pattern: {pattern}")
-            logger.debug(f"Using extensions: {extensions}")
-            for file_path in directory.glob(pattern):
-                logger.debug(f"Found file: {file_path} (suffix: {file_path.suffix.lower()})")
-                if file_path.is_file() and file_path.suffix.lower() in extensions:
-                    logger.debug(f"Accepted as video file: {file_path}")
-                    yield VideoFile(path=file_path)
-                else:
-                    logger.debug(f"Skipped: {file_path}")
+def _decoded_fraction(video_file: VideoFile, position: float) -> float | None:
+    """Fraction of a file decoded at a position in seconds, None if its duration is unknown."""
+    if video_file.duration <= 0:
+        return None
+    return min(1.0, position / video_file.duration)
 
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        video_files = await loop.run_in_executor(None, lambda: list(_scan_directory()))
 
-        return sorted(video_files, key=lambda x: x.path)
+def _verdict_covers(verdict_mode: ScanMode, scan_mode: ScanMode) -> bool:
+    """Whether a verdict from one scan mode can stand in for a scan in another.
+
+    Full-decode verdicts cover every decoding mode and HYBRID accepts the clean
+    quick verdicts it would produce itself; otherwise the modes must match, as
+    triage modes and zero-block scans check different things.
+    """
+    if verdict_mode == scan_mode:
+        return True
+    if scan_mode == ScanMode.ZEROBLOCK:
+        return False
+    if verdict_mode in _FULL_DECODE_MODES:
+        return True
+    return scan_mode == ScanMode.HYBRID and verdict_mode == ScanMode.QUICK
 
 
 def validate_scan_results(results: list[ScanResult]) -> list[str]:
@@ -645,3 +1178,10 @@ def validate_scan_results(results: list[ScanResult]) -> list[str]:
         ):
             issues.append(f"Result {i}: Deep scan completed but not needed and mode is quick")
     return issues
+
+
+def _awaits_deep_scan(entry: ResumeEntry) -> bool:
+    """Whether a resumed HYBRID entry was flagged by the quick pass but never deep-scanned."""
+    return (
+        entry.needs_deep_scan and not entry.is_corrupt and entry.scan_mode == ScanMode.QUICK.value
+    )
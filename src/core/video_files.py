@@ -6,6 +6,7 @@ import logging
 from pathlib import Path
 
 from src.config.video_formats import get_video_extensions
+from src.core.file_walker import VideoFileWalker
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -32,22 +33,8 @@ def count_all_video_files(
         # Use same default extensions as config for consistency
         extensions = get_video_extensions()
 
-    logger.debug(f"Counting video files in {directory}, recursive={recursive}")
-    logger.debug(f"Looking for extensions: {extensions}")
-
-    ext_set = {ext.lower() for ext in extensions}
-    count = 0
-
     try:
-        path = Path(directory)
-
-        pattern = "**/*" if recursive else "*"
-
-        for file_path in path.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in ext_set:
-                count += 1
-                logger.debug(f"Found video file: {file_path}")
-
+        count = VideoFileWalker(extensions, recursive=recursive).count(Path(directory))
         logger.info(f"Counted {count} video files in {directory}")
         return count
 
@@ -653,6 +653,8 @@ def process_scan_file(
 
             if is_corrupt:
                 file_status = FileStatus.CORRUPT
+            elif result.get("stalled", False):
+                file_status = FileStatus.STALLED
             elif needs_deep_scan:
                 file_status = FileStatus.SUSPICIOUS
             else:
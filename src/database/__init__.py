@@ -1,6 +1,13 @@
 """Database package for scan results persistence."""
 
-from .models import ScanDatabaseModel, ScanResultDatabaseModel
+from .models import FileFingerprintDatabaseModel, ScanDatabaseModel, ScanResultDatabaseModel
+from .result_sink import ScanResultSink
 from .service import DatabaseService
 
-__all__ = ["DatabaseService", "ScanDatabaseModel", "ScanResultDatabaseModel"]
+__all__ = [
+    "DatabaseService",
+    "FileFingerprintDatabaseModel",
+    "ScanDatabaseModel",
+    "ScanResultDatabaseModel",
+    "ScanResultSink",
+]
@@ -0,0 +1,98 @@
+"""Per-thread SQLite connection management for the database service."""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionManager:
+    """Hands out one long-lived, tuned SQLite connection per thread.
+
+    Opening a connection for every query costs a file open, schema parse and
+    pragma round trip, and discards the statement cache. Instead each thread
+    gets its own connection on first use and keeps it. Connections are opened
+    in WAL mode, so readers are not blocked by a concurrent writer, with
+    ``synchronous=NORMAL``, which is durable across application crashes and
+    only risks the last transactions on power loss.
+
+    SQLite connections must not be shared between threads without locking,
+    which is why connections are per thread rather than a shared pool.
+    Connections of threads that have exited are closed the next time a
+    connection is opened.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        cache_size_kib: int = 16384,
+        mmap_size_mb: int = 64,
+        busy_timeout_ms: int = 5000,
+        statement_cache_size: int = 128,
+    ):
+        """Initialize the connection manager.
+
+        Args:
+            db_path: Path to SQLite database file
+            cache_size_kib: Page cache size per connection in KiB
+            mmap_size_mb: Bytes of the database file to memory-map, in MiB (0 = disabled)
+            busy_timeout_ms: Milliseconds to wait for a lock held by another connection
+            statement_cache_size: Prepared statements cached per connection
+        """
+        self.db_path = db_path
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size_mb = mmap_size_mb
+        self.busy_timeout_ms = busy_timeout_ms
+        self.statement_cache_size = statement_cache_size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: dict[int, tuple[threading.Thread, sqlite3.Connection]] = {}
+
+    def connection(self) -> sqlite3.Connection:
+        """Return the calling thread's connection, opening it on first use."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._close_dead_threads()
+                self._connections[threading.get_ident()] = (threading.current_thread(), conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this manager."""
+        with self._lock:
+            connections = [conn for _thread, conn in self._connections.values()]
+            self._connections.clear()
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def _open(self) -> sqlite3.Connection:
+        # Connections are only used by their owning thread; disabling the check
+        # lets close() release connections of other threads.
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=self.statement_cache_size,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if journal_mode.lower() != "wal":
+            logger.warning(f"WAL journal mode unavailable for {self.db_path}, using {journal_mode}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size_mb) * 1024 * 1024}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    def _close_dead_threads(self) -> None:
+        """Close connections whose owning thread has exited. Caller holds the lock."""
+        for ident, (thread, conn) in list(self._connections.items()):
+            if not thread.is_alive():
+                conn.close()
+                del self._connections[ident]
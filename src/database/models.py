@@ -1,5 +1,6 @@
 """Database models for scan results persistence."""
 
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -85,7 +86,7 @@ class ScanResultDatabaseModel(BaseModel):
     confidence: float = Field(..., description="Confidence level (0.0-1.0)")
     inspection_time: float = Field(..., description="Time taken to scan file")
     scan_mode: str = Field(..., description="Scan mode used for this file")
-    status: str = Field(..., description="File status (HEALTHY/CORRUPT/SUSPICIOUS)")
+    status: str = Field(..., description="File status (HEALTHY/CORRUPT/SUSPICIOUS/STALLED)")
     created_at: float = Field(default_factory=time.time, description="When record was created")
 
     @classmethod
@@ -129,6 +130,66 @@ class ScanResultDatabaseModel(BaseModel):
             inspection_time=self.inspection_time,
             scan_mode=ScanMode(self.scan_mode),
             timestamp=self.created_at,
+            stalled=self.status == "STALLED",
+        )
+
+
+class FileFingerprintDatabaseModel(BaseModel):
+    """Database model for a file fingerprint and its last verdict.
+
+    Maps to the 'file_fingerprints' table in SQLite database. Used by incremental
+    scans to skip files that have not changed since they were last verified.
+    """
+
+    filename: str = Field(..., description="Full path to the video file")
+    file_size: int = Field(..., description="File size in bytes")
+    mtime_ns: int = Field(..., description="Modification time in nanoseconds")
+    inode: int = Field(..., description="Inode number")
+    device: int = Field(..., description="Device ID")
+    is_corrupt: bool = Field(..., description="Whether file was corrupt when last verified")
+    confidence: float = Field(0.0, description="Confidence level of the last verdict")
+    scan_mode: str = Field(..., description="Scan mode that produced the last verdict")
+    verified_at: float = Field(default_factory=time.time, description="When verdict was recorded")
+
+    @classmethod
+    def from_scan_result(
+        cls, result: ScanResult, stat_result: os.stat_result
+    ) -> "FileFingerprintDatabaseModel":
+        """Create database model from a ScanResult and the file's stat taken before inspection.
+
+        Args:
+            result: ScanResult holding the verdict
+            stat_result: File status the verdict applies to
+
+        Returns:
+            FileFingerprintDatabaseModel instance
+        """
+        return cls(
+            filename=str(result.video_file.path),
+            file_size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            inode=stat_result.st_ino,
+            device=stat_result.st_dev,
+            is_corrupt=result.is_corrupt,
+            confidence=result.confidence,
+            scan_mode=result.scan_mode.value,
+            verified_at=result.timestamp,
+        )
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Check whether the file is unchanged since this fingerprint was taken.
+
+        Args:
+            stat_result: Current file status
+
+        Returns:
+            True if size, mtime, inode and device are all unchanged
+        """
+        return (
+            self.file_size == stat_result.st_size
+            and self.mtime_ns == stat_result.st_mtime_ns
+            and self.inode == stat_result.st_ino
+            and self.device == stat_result.st_dev
         )
 
 
@@ -0,0 +1,100 @@
+"""Write-behind sink persisting scan results while a scan is running."""
+
+import logging
+import queue
+import threading
+import time
+
+from src.core.models.scanning import ScanResult
+
+from .models import ScanResultDatabaseModel
+from .service import DatabaseService
+
+logger = logging.getLogger(__name__)
+
+_CLOSE = object()
+
+
+class ScanResultSink:
+    """Batches scan results and writes them to the database on a dedicated thread.
+
+    :meth:`add` only enqueues, so the scan loop never waits on SQLite. The writer
+    thread flushes a batch with a single ``executemany`` transaction once
+    ``batch_size`` results are pending or ``flush_interval`` seconds have passed
+    since the last flush, so a crash loses at most one batch.
+    """
+
+    def __init__(
+        self,
+        database_service: DatabaseService,
+        scan_id: int,
+        batch_size: int = 100,
+        flush_interval: float = 2.0,
+    ):
+        """Initialize the result sink and start its writer thread.
+
+        Args:
+            database_service: Database to write results to
+            scan_id: ID of the scan the results belong to
+            batch_size: Number of pending results that triggers a flush
+            flush_interval: Maximum seconds a result waits before being flushed
+        """
+        self.database_service = database_service
+        self.scan_id = scan_id
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.written_count = 0
+        self._queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="scan-result-writer", daemon=True)
+        self._thread.start()
+
+    def add(self, result: ScanResult) -> None:
+        """Queue a result for writing.
+
+        Args:
+            result: Completed scan result
+        """
+        self._queue.put(result)
+
+    def close(self) -> None:
+        """Flush all pending results and stop the writer thread."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(_CLOSE)
+        self._thread.join()
+
+    def __enter__(self) -> "ScanResultSink":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        batch: list[ScanResult] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _CLOSE:
+                self._flush(batch)
+                return
+            if isinstance(item, ScanResult):
+                batch.append(item)
+
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _flush(self, batch: list[ScanResult]) -> None:
+        if not batch:
+            return
+        try:
+            rows = [ScanResultDatabaseModel.from_scan_result(r, self.scan_id) for r in batch]
+            self.database_service.store_scan_results(self.scan_id, rows)
+            self.written_count += len(rows)
+        except Exception:
+            logger.exception(f"Failed to write {len(batch)} scan results for scan {self.scan_id}")
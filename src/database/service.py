@@ -1,6 +1,7 @@
 """Database service for scan results persistence."""
 
 import logging
+import os
 import sqlite3
 import time
 from collections.abc import Generator
@@ -8,31 +9,84 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+from src.config.config import DatabaseConfig
+
+from .connection import ConnectionManager
 from .models import (
     DatabaseQueryFilter,
     DatabaseStats,
+    FileFingerprintDatabaseModel,
     ScanDatabaseModel,
     ScanResultDatabaseModel,
 )
 
 logger = logging.getLogger(__name__)
 
+# Keep IN (...) lists well below SQLite's bound parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+# Decode speed samples kept for learning adaptive scan timeouts
+_MAX_DECODE_SPEED_SAMPLES = 1000
+
 
 class DatabaseService:
     """Service for managing scan results in SQLite database."""
 
-    def __init__(self, db_path: Path, auto_cleanup_days: int = 0):
+    def __init__(
+        self,
+        db_path: Path,
+        auto_cleanup_days: int = 0,
+        *,
+        cache_size_kib: int = 16384,
+        mmap_size_mb: int = 64,
+        busy_timeout_ms: int = 5000,
+        statement_cache_size: int = 128,
+    ):
         """Initialize database service.
 
         Args:
             db_path: Path to SQLite database file
             auto_cleanup_days: Auto-delete scans older than this many days (0 = disabled)
+            cache_size_kib: Page cache size per connection in KiB
+            mmap_size_mb: Bytes of the database file to memory-map, in MiB (0 = disabled)
+            busy_timeout_ms: Milliseconds to wait for a lock held by another connection
+            statement_cache_size: Prepared statements cached per connection
         """
-        self.db_path = db_path
+        self.db_path = db_path.expanduser()
         self.auto_cleanup_days = auto_cleanup_days
         self._ensure_database_directory()
+        self._connections = ConnectionManager(
+            self.db_path,
+            cache_size_kib=cache_size_kib,
+            mmap_size_mb=mmap_size_mb,
+            busy_timeout_ms=busy_timeout_ms,
+            statement_cache_size=statement_cache_size,
+        )
         self._initialize_database()
 
+    @classmethod
+    def from_config(cls, config: DatabaseConfig) -> "DatabaseService":
+        """Create a database service from the database configuration.
+
+        Args:
+            config: Database configuration
+
+        Returns:
+            DatabaseService instance
+        """
+        return cls(
+            config.path,
+            config.auto_cleanup_days,
+            cache_size_kib=config.cache_size_kib,
+            mmap_size_mb=config.mmap_size_mb,
+            busy_timeout_ms=config.busy_timeout_ms,
+            statement_cache_size=config.statement_cache_size,
+        )
+
+    def close(self) -> None:
+        """Close all database connections held by this service."""
+        self._connections.close()
+
     def _ensure_database_directory(self) -> None:
         """Ensure database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -79,6 +133,35 @@ class DatabaseService:
             """
             )
 
+            # Create file_fingerprints table for incremental scans
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_fingerprints (
+                    filename TEXT PRIMARY KEY,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    device INTEGER NOT NULL,
+                    is_corrupt BOOLEAN NOT NULL,
+                    confidence REAL NOT NULL,
+                    scan_mode TEXT NOT NULL,
+                    verified_at REAL NOT NULL
+                )
+            """
+            )
+
+            # Create decode_speed_samples table for adaptive deep scan timeouts
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS decode_speed_samples (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    work_seconds REAL NOT NULL,
+                    wall_seconds REAL NOT NULL,
+                    recorded_at REAL DEFAULT (strftime('%s', 'now'))
+                )
+            """
+            )
+
             # Create indexes for common queries
             conn.execute(
                 """
@@ -113,13 +196,18 @@ class DatabaseService:
 
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection]:
-        """Get database connection with proper cleanup."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Enable column access by name
+        """Get the calling thread's database connection.
+
+        The connection stays open for reuse, so a transaction left uncommitted
+        by a failing operation is rolled back here.
+        """
+        conn = self._connections.connection()
         try:
             yield conn
-        finally:
-            conn.close()
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
 
     def store_scan(self, scan: ScanDatabaseModel) -> int:
         """Store a scan record and return the scan ID.
@@ -161,6 +249,42 @@ class DatabaseService:
             logger.info(f"Stored scan {scan_id} for directory {scan.directory}")
             return scan_id
 
+    def update_scan(self, scan_id: int, scan: ScanDatabaseModel) -> None:
+        """Replace the metadata of an existing scan record.
+
+        Used to finalize a scan that was registered before its results were
+        written.
+
+        Args:
+            scan_id: ID of the scan to update
+            scan: Final scan data
+        """
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                UPDATE scans SET
+                    directory = ?, scan_mode = ?, started_at = ?, completed_at = ?,
+                    total_files = ?, processed_files = ?, corrupt_files = ?,
+                    healthy_files = ?, success_rate = ?, scan_time = ?
+                WHERE id = ?
+            """,
+                (
+                    scan.directory,
+                    scan.scan_mode,
+                    scan.started_at,
+                    scan.completed_at,
+                    scan.total_files,
+                    scan.processed_files,
+                    scan.corrupt_files,
+                    scan.healthy_files,
+                    scan.success_rate,
+                    scan.scan_time,
+                    scan_id,
+                ),
+            )
+            conn.commit()
+            logger.info(f"Updated scan {scan_id} for directory {scan.directory}")
+
     def store_scan_results(self, scan_id: int, results: list[ScanResultDatabaseModel]) -> None:
         """Store scan results for a given scan.
 
@@ -392,17 +516,201 @@ class DatabaseService:
 
             last_scan_id = row["id"]
 
-            # Get files that were corrupt or suspicious in the last scan
+            # Get files that were corrupt, suspicious or stalled in the last scan
             cursor = conn.execute(
                 """
                 SELECT filename FROM scan_results
-                WHERE scan_id = ? AND (is_corrupt = 1 OR status = 'SUSPICIOUS')
+                WHERE scan_id = ? AND (is_corrupt = 1 OR status IN ('SUSPICIOUS', 'STALLED'))
             """,
                 (last_scan_id,),
             )
 
             return [row["filename"] for row in cursor.fetchall()]
 
+    def store_file_fingerprints(self, fingerprints: list[FileFingerprintDatabaseModel]) -> None:
+        """Store fingerprints with their latest verdicts, replacing older ones.
+
+        Args:
+            fingerprints: Fingerprints to store
+        """
+        if not fingerprints:
+            return
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO file_fingerprints (
+                    filename, file_size, mtime_ns, inode, device,
+                    is_corrupt, confidence, scan_mode, verified_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                [
+                    (
+                        fp.filename,
+                        fp.file_size,
+                        fp.mtime_ns,
+                        fp.inode,
+                        fp.device,
+                        fp.is_corrupt,
+                        fp.confidence,
+                        fp.scan_mode,
+                        fp.verified_at,
+                    )
+                    for fp in fingerprints
+                ],
+            )
+
+            conn.commit()
+            logger.info(f"Stored {len(fingerprints)} file fingerprints")
+
+    def get_file_fingerprints(
+        self, filenames: list[str]
+    ) -> dict[str, FileFingerprintDatabaseModel]:
+        """Get stored fingerprints for the given files.
+
+        Args:
+            filenames: Full paths of the files to look up
+
+        Returns:
+            Mapping of filename to fingerprint for files that have one
+        """
+        fingerprints: dict[str, FileFingerprintDatabaseModel] = {}
+        with self._get_connection() as conn:
+            for start in range(0, len(filenames), _QUERY_CHUNK_SIZE):
+                chunk = filenames[start : start + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT * FROM file_fingerprints WHERE filename IN ({placeholders})
+                """,
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    fingerprints[row["filename"]] = self._row_to_fingerprint(row)
+
+        return fingerprints
+
+    def get_file_fingerprints_under(
+        self, directory: str
+    ) -> dict[str, FileFingerprintDatabaseModel]:
+        """Get stored fingerprints for every file below a directory.
+
+        Args:
+            directory: Directory path, as used to build the stored filenames
+
+        Returns:
+            Mapping of filename to fingerprint
+        """
+        prefix = directory.rstrip(os.sep)
+        with self._get_connection() as conn:
+            if prefix in ("", "."):
+                # Files under the current directory are stored as bare relative paths
+                cursor = conn.execute("SELECT * FROM file_fingerprints")
+            else:
+                # Range scan on the primary key: every path starting with "<prefix>/"
+                cursor = conn.execute(
+                    """
+                    SELECT * FROM file_fingerprints WHERE filename > ? AND filename < ?
+                """,
+                    (prefix + os.sep, prefix + chr(ord(os.sep) + 1)),
+                )
+            return {row["filename"]: self._row_to_fingerprint(row) for row in cursor.fetchall()}
+
+    def get_inspection_times_under(
+        self, directory: str, scan_mode: str
+    ) -> dict[str, tuple[int, float]]:
+        """Get how long the latest inspection of every file below a directory took.
+
+        Args:
+            directory: Directory path, as used to build the stored filenames
+            scan_mode: Scan mode the inspections were run with
+
+        Returns:
+            Mapping of filename to ``(file_size, inspection_time)`` of its most
+            recent result in that mode; results without a timing are left out
+        """
+        prefix = directory.rstrip(os.sep)
+        query = """
+            SELECT filename, file_size, inspection_time FROM scan_results
+            WHERE scan_mode = ? AND inspection_time > 0
+        """
+        params: tuple[str, ...] = (scan_mode,)
+        if prefix not in ("", "."):
+            # Range scan on the filename index: every path starting with "<prefix>/"
+            query += " AND filename > ? AND filename < ?"
+            params += (prefix + os.sep, prefix + chr(ord(os.sep) + 1))
+        with self._get_connection() as conn:
+            cursor = conn.execute(query + " ORDER BY id", params)
+            # Later rows overwrite earlier ones, leaving the latest result per file
+            return {
+                row["filename"]: (row["file_size"], row["inspection_time"])
+                for row in cursor.fetchall()
+            }
+
+    def store_decode_speed_samples(self, samples: list[tuple[float, float]]) -> None:
+        """Store decode speed measurements from completed scans.
+
+        Args:
+            samples: ``(work_seconds, wall_seconds)`` pairs, where work is seconds
+                of 1080p H.264-equivalent video decoded in ``wall_seconds``
+        """
+        if not samples:
+            return
+
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO decode_speed_samples (work_seconds, wall_seconds) VALUES (?, ?)
+            """,
+                samples,
+            )
+            # Only recent history is used, older samples describe past load and hardware
+            conn.execute(
+                """
+                DELETE FROM decode_speed_samples
+                WHERE id <= (SELECT MAX(id) FROM decode_speed_samples) - ?
+            """,
+                (_MAX_DECODE_SPEED_SAMPLES,),
+            )
+
+            conn.commit()
+            logger.debug(f"Stored {len(samples)} decode speed samples")
+
+    def get_decode_speed_samples(self, limit: int = 200) -> list[tuple[float, float]]:
+        """Get the most recent decode speed measurements.
+
+        Args:
+            limit: Maximum number of samples to return
+
+        Returns:
+            ``(work_seconds, wall_seconds)`` pairs, oldest first
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT work_seconds, wall_seconds FROM decode_speed_samples
+                ORDER BY id DESC LIMIT ?
+            """,
+                (limit,),
+            )
+            rows = cursor.fetchall()
+
+        return [(row["work_seconds"], row["wall_seconds"]) for row in reversed(rows)]
+
+    @staticmethod
+    def _row_to_fingerprint(row: sqlite3.Row) -> FileFingerprintDatabaseModel:
+        return FileFingerprintDatabaseModel(
+            filename=row["filename"],
+            file_size=row["file_size"],
+            mtime_ns=row["mtime_ns"],
+            inode=row["inode"],
+            device=row["device"],
+            is_corrupt=bool(row["is_corrupt"]),
+            confidence=row["confidence"],
+            scan_mode=row["scan_mode"],
+            verified_at=row["verified_at"],
+        )
+
     def get_database_stats(self) -> DatabaseStats:
         """Get statistics about the database contents.
 
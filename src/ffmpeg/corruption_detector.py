@@ -210,3 +210,51 @@ class CorruptionDetector:
         # Remove unreachable/duplicate error message assignments
         # Remove unused inner function and comments
         return analysis
+
+
+class StreamingCorruptionDetector:
+    """Incremental corruption detector fed one line of FFmpeg stderr at a time.
+
+    Lets a caller stop an FFmpeg process as soon as a definitive corruption
+    pattern appears instead of waiting for the whole file to decode. The
+    collected output is still analyzed with the regular CorruptionDetector once
+    the process ends, so the verdict matches a non-streaming run.
+    """
+
+    def __init__(self, detector: CorruptionDetector, is_quick_scan: bool = False) -> None:
+        """Initialize the streaming detector.
+
+        Args:
+            detector: Detector providing the corruption patterns and final analysis
+            is_quick_scan: Whether the output comes from a quick scan
+        """
+        self.detector = detector
+        self.is_quick_scan = is_quick_scan
+        self.definitive_match: str | None = None
+        self._lines: list[str] = []
+
+    @property
+    def stderr(self) -> str:
+        """Get all stderr output fed so far."""
+        return "".join(self._lines)
+
+    def feed_line(self, line: str) -> str | None:
+        """Consume one line of stderr.
+
+        Args:
+            line: A single line of FFmpeg stderr output
+
+        Returns:
+            The matched corruption text when this line is definitive evidence of
+            corruption, otherwise None
+        """
+        self._lines.append(line)
+        if self.definitive_match is not None:
+            return None
+        for pattern in self.detector.corruption_patterns:
+            match = pattern.search(line)
+            if match:
+                self.definitive_match = match.group(0)
+                logger.debug(f"Definitive corruption in stream: {self.definitive_match}")
+                return self.definitive_match
+        return None
@@ -0,0 +1,116 @@
+"""
+Decode cost estimation and decode speed learning for per-file scan timeouts.
+"""
+
+import logging
+import statistics
+import threading
+from collections import deque
+
+from src.core.models.inspection import VideoFile
+
+logger = logging.getLogger(__name__)
+
+# Decode cost per second of video relative to H.264, by FFmpeg codec name
+CODEC_COST: dict[str, float] = {
+    "mpeg1video": 0.3,
+    "mpeg2video": 0.5,
+    "mpeg4": 0.5,
+    "msmpeg4v3": 0.5,
+    "h263": 0.5,
+    "wmv3": 0.8,
+    "vc1": 1.0,
+    "h264": 1.0,
+    "vp8": 1.0,
+    "vp9": 1.5,
+    "hevc": 2.0,
+    "av1": 2.5,
+}
+
+# Frame size decode work is measured against
+_REFERENCE_PIXELS = 1920 * 1080
+
+# Small frames are still demuxed and decoded frame by frame
+_MIN_PIXEL_FACTOR = 0.1
+
+# Shorter runs are dominated by process startup and say little about decode speed
+_MIN_SAMPLE_WALL_SECONDS = 1.0
+
+
+def decode_work(video_file: VideoFile) -> float:
+    """Estimate the work needed to decode a whole file.
+
+    Work is measured in seconds of 1080p H.264 video, so a 3-hour 4K HEVC
+    file costs 3 * 3600 * 4 * 2 = 86,400 units. Unknown codecs and
+    resolutions count as H.264 at 1080p.
+
+    Args:
+        video_file: File with a known duration
+
+    Returns:
+        Estimated decode work, 0 if the duration is unknown
+    """
+    if video_file.duration <= 0:
+        return 0.0
+    pixels = video_file.width * video_file.height
+    pixel_factor = max(_MIN_PIXEL_FACTOR, pixels / _REFERENCE_PIXELS) if pixels else 1.0
+    codec_factor = CODEC_COST.get(video_file.video_codec, 1.0)
+    return video_file.duration * pixel_factor * codec_factor
+
+
+class DecodeSpeedModel:
+    """Learns how fast this host decodes video from completed scans.
+
+    Speed is the median of recent ``work / wall seconds`` samples, in decode
+    work units (see :func:`decode_work`) per wall-clock second. The median
+    keeps a few files slowed by I/O stalls or contention from skewing it.
+    Until enough samples are collected the configured default is used.
+
+    Samples recorded with :meth:`observe` are kept for persistence until taken
+    with :meth:`take_unsaved`; history loaded with :meth:`load` is not.
+    Methods may be called from several worker threads.
+    """
+
+    def __init__(self, default_speed: float, min_samples: int = 3, max_samples: int = 200):
+        """Initialize the model.
+
+        Args:
+            default_speed: Speed assumed until enough samples are known
+            min_samples: Samples needed before the measured speed is used
+            max_samples: Most recent samples the speed is computed from
+        """
+        self.default_speed = default_speed
+        self.min_samples = min_samples
+        self._ratios: deque[float] = deque(maxlen=max_samples)
+        self._unsaved: list[tuple[float, float]] = []
+        self._lock = threading.Lock()
+
+    def load(self, samples: list[tuple[float, float]]) -> None:
+        """Seed the model with stored ``(work, wall_seconds)`` samples, oldest first."""
+        with self._lock:
+            for work, wall in samples:
+                if wall > 0 and work > 0:
+                    self._ratios.append(work / wall)
+        logger.debug(f"Decode speed model loaded {len(samples)} samples")
+
+    def observe(self, work: float, wall_seconds: float) -> None:
+        """Record the decode work done by one complete decode and how long it took."""
+        if work <= 0 or wall_seconds < _MIN_SAMPLE_WALL_SECONDS:
+            return
+        with self._lock:
+            self._ratios.append(work / wall_seconds)
+            self._unsaved.append((work, wall_seconds))
+
+    def take_unsaved(self) -> list[tuple[float, float]]:
+        """Return the samples observed since the last call, for persistence."""
+        with self._lock:
+            samples, self._unsaved = self._unsaved, []
+        return samples
+
+    @property
+    def speed(self) -> float:
+        """Decode work units processed per wall-clock second."""
+        with self._lock:
+            if len(self._ratios) < self.min_samples:
+                return self.default_speed
+            return statistics.median(self._ratios)
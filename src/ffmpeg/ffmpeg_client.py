@@ -2,38 +2,222 @@
 FFmpeg client for video file inspection and corruption detection.
 """
 
+import asyncio
+import contextlib
 import logging
+import re
 import shutil
 import subprocess
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any
 
 from src.config.config import FFmpegConfig
 from src.core.errors.errors import FFmpegError
 from src.core.models.inspection import VideoFile
-from src.core.models.scanning import ScanResult
-from src.ffmpeg.corruption_detector import CorruptionDetector
+from src.core.models.scanning import IssueCode, ScanMode, ScanResult
+from src.ffmpeg.corruption_detector import CorruptionDetector, StreamingCorruptionDetector
+from src.ffmpeg.decode_speed import DecodeSpeedModel, decode_work
+from src.ffmpeg.packet_probe import PROBE_ENTRIES, PacketStructureAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for FFmpeg to exit after SIGTERM before killing it
+_TERMINATE_GRACE_SECONDS = 5
+
+# "Duration: 01:23:45.67" line of FFmpeg's input summary
+_DURATION_PATTERN = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+
+# "Stream #0:0: Video: h264 (High) ..., 1920x1080 [SAR 1:1 DAR 16:9]" line of the same summary
+_VIDEO_STREAM_PATTERN = re.compile(r"Stream #\d+:\d+.*?: Video: (\w+).*?\b(\d{2,5})x(\d{2,5})\b")
+
+# "out_time_us=5000000" line of FFmpeg's -progress output
+_OUT_TIME_PATTERN = re.compile(r"^out_time_us=(\d+)", re.MULTILINE)
+
+# A tail probe decoding less than this many seconds means the end is unreachable
+_MIN_TAIL_SECONDS = 1.0
+
+# Makes FFmpeg write key=value progress blocks (about every 0.5 s) to stdout
+_PROGRESS_ARGS = ["-nostats", "-progress", "pipe:1"]
+
+# Seconds each segment of a split decode runs past the start of the next one,
+# so the next segment's lead-in up to its first output frame is decoded twice
+_SEGMENT_OVERLAP_SECONDS = 5.0
+
+# Timed errors kept per decode; a badly broken file can log thousands
+_MAX_TIMED_ERRORS = 100
+
+# ionice scheduling class numbers by configured name
+_IONICE_CLASSES = {"best-effort": "2", "idle": "3"}
+
+
+class StallTimeoutExpired(subprocess.TimeoutExpired):
+    """Raised when FFmpeg stops making decoding progress before its timeout.
+
+    Subclasses TimeoutExpired so callers that only handle timeouts still treat
+    a stall as one.
+    """
+
+    def __init__(self, cmd: list[str], stall_timeout: float, stderr: str, position: float):
+        """Initialize the error.
+
+        Args:
+            cmd: Command that stalled
+            stall_timeout: Seconds without progress that triggered the watchdog
+            stderr: FFmpeg output collected before it was killed
+            position: Seconds decoded when progress stopped
+        """
+        super().__init__(cmd, stall_timeout, stderr=stderr)
+        self.position = position
+
+
+class _ProgressWatch:
+    """Follows FFmpeg ``-progress`` output and notices when decoding stops advancing."""
+
+    def __init__(
+        self,
+        stall_timeout: float,
+        on_progress: Callable[[float], None] | None = None,
+        offset: float = 0.0,
+    ) -> None:
+        """Initialize the watch.
+
+        Args:
+            stall_timeout: Seconds ``out_time_us`` may stay unchanged before the
+                run counts as stalled (0 = never)
+            on_progress: Optional callback receiving each new decoded position in seconds
+            offset: Position in the file the decode started at, added to error times
+        """
+        self.stall_timeout = stall_timeout
+        self.on_progress = on_progress
+        self.offset = offset
+        self.position = 0.0
+        self.tripped = False
+        self.errors: list[tuple[float, str]] = []
+        # Position of the first output frame, None until one is written
+        self.first_position: float | None = None
+        # Lines a seeked decode logged before its first output frame
+        self.leading_lines: list[str] = []
+        self._last_advance = time.monotonic()
+
+    @property
+    def holding_leading_errors(self) -> bool:
+        """Whether error lines are held back until it is known who decoded that range.
+
+        A decode seeked into the file starts at a keyframe whose leading frames
+        may reference pictures before the seek point, so what it logs before
+        its first output frame can be spurious.
+        """
+        return self.offset > 0 and self.first_position is None
+
+    def record_error(self, line: str) -> None:
+        """Note an error line together with the file position decoded when it was logged."""
+        message = line.strip()
+        if message and len(self.errors) < _MAX_TIMED_ERRORS:
+            self.errors.append((round(self.offset + self.position, 3), message))
+
+    def release_leading_errors(self, previous: "_ProgressWatch") -> str:
+        """Return the held lines that count, timing them at the seek point.
+
+        The lines are dropped when ``previous``, the decode of the preceding
+        segment, ran past this decode's first output frame: the lead-in was
+        then decoded from a clean start and any real error there was logged
+        by ``previous``. A decode that never wrote a frame keeps its lines.
+        """
+        if not self.leading_lines:
+            return ""
+        covered_until = previous.offset + previous.position
+        if self.first_position is not None and self.offset + self.first_position <= covered_until:
+            logger.debug(
+                f"Dropping {len(self.leading_lines)} lines logged before the first frame "
+                f"after seeking to {self.offset:.3f}s"
+            )
+            return ""
+        for line in self.leading_lines:
+            message = line.strip()
+            if message and len(self.errors) < _MAX_TIMED_ERRORS:
+                self.errors.append((round(self.offset, 3), message))
+        return "".join(self.leading_lines)
+
+    def feed_line(self, line: str) -> None:
+        """Consume one line of progress output."""
+        key, _, value = line.strip().partition("=")
+        # out_time_us is "N/A" or negative until the first frame is written
+        if key != "out_time_us" or not value.isdigit():
+            return
+        position = int(value) / 1_000_000
+        if self.first_position is None:
+            self.first_position = position
+        if position > self.position:
+            self.position = position
+            self._last_advance = time.monotonic()
+            if self.on_progress is not None:
+                self.on_progress(position)
+
+    def seconds_until_stall(self) -> float | None:
+        """Seconds left before the run counts as stalled, None if the watchdog is off."""
+        if self.stall_timeout <= 0:
+            return None
+        return self.stall_timeout - (time.monotonic() - self._last_advance)
+
 
 class FFmpegClient:
     """Client for interacting with FFmpeg to inspect video files."""
 
     config: FFmpegConfig
     detector: CorruptionDetector
+    decode_speed: DecodeSpeedModel
+    progress_listener: Callable[[VideoFile, float], None] | None
     _ffmpeg_path: str | None
+    _priority_prefix: list[str]
 
     def __init__(self, config: FFmpegConfig) -> None:
         """Initialize FFmpeg client."""
         self.config = config
         self.detector = CorruptionDetector()
+        self.decode_speed = DecodeSpeedModel(default_speed=config.default_decode_speed)
+        # Receives (file, seconds decoded) as deep and full scans advance
+        self.progress_listener = None
         self._ffmpeg_path = None
+        self._priority_prefix = self._build_priority_prefix()
 
         # Find FFmpeg command
         self._find_ffmpeg_command()
 
         logger.info(f"FFmpegClient initialized with command: {self._ffmpeg_path}")
 
+    def _build_priority_prefix(self) -> list[str]:
+        """Build the ``ionice``/``nice`` wrapper FFmpeg and ffprobe are launched through.
+
+        Both tools exec the wrapped command, so the launched process is FFmpeg
+        itself and can be stopped as usual. Missing tools are skipped with a
+        warning rather than failing scans.
+        """
+        prefix: list[str] = []
+        if self.config.ionice_class:
+            ionice = shutil.which("ionice")
+            if ionice is None:
+                logger.warning("ionice not found, FFmpeg runs in the default I/O class")
+            else:
+                prefix += [ionice, "-c", _IONICE_CLASSES[self.config.ionice_class]]
+                if self.config.ionice_class == "best-effort":
+                    prefix += ["-n", str(self.config.ionice_level)]
+        if self.config.nice:
+            nice = shutil.which("nice")
+            if nice is None:
+                logger.warning("nice not found, FFmpeg runs at normal CPU priority")
+            else:
+                prefix += [nice, "-n", str(self.config.nice)]
+        if prefix:
+            logger.info(f"FFmpeg processes are launched through: {' '.join(prefix)}")
+        return prefix
+
+    def _launch_command(self, cmd: list[str]) -> list[str]:
+        """Return the command line that starts ``cmd`` at the configured priority."""
+        return [*self._priority_prefix, *cmd] if self._priority_prefix else cmd
+
     def _find_ffmpeg_command(self) -> None:
         """Find and validate FFmpeg command."""
         if self.config.command:
@@ -84,13 +268,312 @@ class FFmpegClient:
         """
         Build FFmpeg command for quick scan.
 
+        Decodes ``quick_window_seconds`` from the start of the file. With
+        ``quick_sample_windows`` above 1 and a known duration, the command
+        instead decodes that many evenly spaced windows from start to end, each
+        opened as its own seeking input so a single FFmpeg process covers the
+        whole sample.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            list[str]: FFmpeg command as list
+        """
+        if self._ffmpeg_path is None:
+            msg = "FFmpeg path is not set."
+            raise FFmpegError(msg)
+        windows = self._sample_windows(video_file.duration)
+        cmd = [str(self._ffmpeg_path), "-v", "error"]
+        for start, length in windows:
+            if start > 0:
+                cmd += ["-ss", f"{start:.3f}"]
+            cmd += ["-t", f"{length:g}", "-i", str(video_file.path)]
+        if len(windows) == 1:
+            return [*cmd, "-f", "null", "-"]
+        for index in range(len(windows)):
+            # Audio packets cut by a seek decode with spurious errors, so seeked
+            # windows check video only; the first window checks every stream.
+            cmd += ["-map", f"{index}:v:0?"]
+            if index == 0:
+                cmd += ["-map", "0:a:0?"]
+            cmd += ["-f", "null", "-"]
+        return cmd
+
+    def _sample_windows(self, duration: float) -> list[tuple[float, float]]:
+        """
+        Choose the (start, length) windows a quick scan decodes.
+
+        Args:
+            duration: Video duration in seconds, 0 if unknown
+
+        Returns:
+            list[tuple[float, float]]: Window start offsets and lengths in seconds
+        """
+        count = self.config.quick_sample_windows
+        length = self.config.quick_window_seconds
+        if count <= 1 or duration <= 0:
+            return [(0.0, length)]
+        if duration <= count * length:
+            # Sampling would overlap, decoding the whole file costs the same
+            return [(0.0, count * length)]
+        step = (duration - length) / (count - 1)
+        return [(i * step, length) for i in range(count)]
+
+    def _needs_duration(self, video_file: VideoFile) -> bool:
+        return self.config.quick_sample_windows > 1 and video_file.duration <= 0
+
+    def _build_duration_probe_command(self, video_file: VideoFile) -> list[str]:
+        if self._ffmpeg_path is None:
+            msg = "FFmpeg path is not set."
+            raise FFmpegError(msg)
+        return [str(self._ffmpeg_path), "-hide_banner", "-i", str(video_file.path)]
+
+    @staticmethod
+    def _parse_duration(output: str) -> float:
+        """Extract the container duration from FFmpeg's input summary, 0 if absent."""
+        match = _DURATION_PATTERN.search(output)
+        if not match:
+            return 0.0
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    def _apply_probe_output(self, video_file: VideoFile, output: str) -> None:
+        """Copy duration, video codec and frame size from FFmpeg's input summary."""
+        video_file.duration = self._parse_duration(output)
+        match = _VIDEO_STREAM_PATTERN.search(output)
+        if match:
+            video_file.video_codec = match.group(1)
+            video_file.width = int(match.group(2))
+            video_file.height = int(match.group(3))
+
+    def _probe_duration(self, video_file: VideoFile) -> None:
+        """Read the duration, video codec and frame size from the file's header.
+
+        The probe is run like a scan, so it stops as soon as FFmpeg reports
+        definitive corruption instead of waiting for a hung process.
+        """
+        try:
+            result = self._run(
+                self._build_duration_probe_command(video_file),
+                self.config.quick_timeout,
+                is_quick=True,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"Duration probe failed for {video_file.path}: {e}")
+            return
+        self._apply_probe_output(video_file, result.stderr)
+
+    async def _probe_duration_async(self, video_file: VideoFile) -> None:
+        """Async variant of :meth:`_probe_duration`."""
+        try:
+            result = await self._run_async(
+                self._build_duration_probe_command(video_file),
+                self.config.quick_timeout,
+                is_quick=True,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"Duration probe failed for {video_file.path}: {e}")
+            return
+        self._apply_probe_output(video_file, result.stderr)
+
+    def _deep_timeout(self, video_file: VideoFile, segments: int = 1) -> float:
+        """Timeout for decoding a whole file.
+
+        The expected decode time is the file's decode work (duration scaled by
+        resolution and codec) divided by the learned decode speed, multiplied
+        by ``timeout_safety_factor``. Falls back to ``deep_timeout`` when
+        adaptive timeouts are off or the duration is unknown. A file decoded in
+        concurrent segments needs the time of one segment.
+        """
+        work = decode_work(video_file) / segments if self.config.adaptive_timeouts else 0.0
+        if work <= 0:
+            return self.config.deep_timeout
+        expected = work / self.decode_speed.speed
+        timeout = max(
+            self.config.min_adaptive_timeout, expected * self.config.timeout_safety_factor
+        )
+        logger.debug(
+            f"Deep scan timeout for {video_file.path}: {timeout:.0f}s "
+            f"({video_file.duration:.0f}s {video_file.video_codec or 'unknown codec'} "
+            f"{video_file.width}x{video_file.height}, expected {expected:.0f}s)"
+        )
+        return timeout
+
+    def _needs_deep_probe(self, video_file: VideoFile, timeout_needed: bool) -> bool:
+        """Whether a whole-file decode needs the duration before it starts.
+
+        The duration drives adaptive timeouts, segment planning and progress
+        reporting.
+        """
+        if video_file.duration > 0:
+            return False
+        adaptive = timeout_needed and self.config.adaptive_timeouts
+        return adaptive or self.config.deep_segments > 1 or self.progress_listener is not None
+
+    def _segment_plan(self, video_file: VideoFile) -> list[tuple[float, float | None]]:
+        """Split a whole-file decode into ``(start, length)`` time segments.
+
+        Files are split into up to ``deep_segments`` equal parts of at least
+        ``min_segment_seconds``; shorter files and files of unknown duration
+        are decoded in one piece. The last segment has no length so it runs
+        to the real end of the file, past a short declared duration.
+        """
+        if video_file.duration <= 0:
+            count = 1
+        else:
+            count = min(
+                self.config.deep_segments,
+                int(video_file.duration // self.config.min_segment_seconds),
+            )
+        if count < 2:
+            return [(0.0, None)]
+        length = video_file.duration / count
+        return [(i * length, length if i < count - 1 else None) for i in range(count)]
+
+    def _build_segment_command(
+        self, video_file: VideoFile, start: float, length: float | None
+    ) -> list[str]:
+        """Build a deep scan command decoding ``length`` seconds from ``start``.
+
+        ``-ss`` before the input seeks to the last keyframe at or before the
+        start and decodes from there. Every segment but the last runs
+        ``_SEGMENT_OVERLAP_SECONDS`` into the next one, so the next segment's
+        lead-in is also decoded from a clean start (see
+        :meth:`_ProgressWatch.release_leading_errors`). All streams are decoded
+        in every segment, as in a single decode.
+        """
+        cmd = self._build_deep_scan_command(video_file)
+        window: list[str] = []
+        if start > 0:
+            window += ["-ss", f"{start:.3f}"]
+        if length is not None:
+            window += ["-t", f"{length + _SEGMENT_OVERLAP_SECONDS:.3f}"]
+        index = cmd.index("-i")
+        return cmd[:index] + window + cmd[index:]
+
+    def _segment_watches(
+        self, video_file: VideoFile, plan: list[tuple[float, float | None]]
+    ) -> list[_ProgressWatch]:
+        """Create one stall watchdog per segment, reporting combined progress to the listener."""
+        listener = self.progress_listener
+        positions = [0.0] * len(plan)
+
+        def reporter(index: int, length: float | None) -> Callable[[float], None] | None:
+            if listener is None:
+                return None
+
+            def on_progress(position: float) -> None:
+                # The overlap into the next segment is not counted twice
+                positions[index] = position if length is None else min(position, length)
+                listener(video_file, sum(positions))
+
+            return on_progress
+
+        return [
+            _ProgressWatch(self.config.stall_timeout, reporter(index, length), offset=start)
+            for index, (start, length) in enumerate(plan)
+        ]
+
+    def _decode_whole(
+        self,
+        video_file: VideoFile,
+        plan: list[tuple[float, float | None]],
+        timeout: float | None,
+        watches: list[_ProgressWatch],
+    ) -> subprocess.CompletedProcess[str]:
+        """Decode a file following a segment plan, running the segments concurrently.
+
+        Raises:
+            subprocess.TimeoutExpired: If any segment times out or stalls, once
+                all segments have finished
+        """
+        commands = [self._build_segment_command(video_file, *segment) for segment in plan]
+        if len(plan) == 1:
+            return self._run(commands[0], timeout, is_quick=False, watch=watches[0])
+        logger.debug(f"Decoding {video_file.path} in {len(plan)} segments")
+        with ThreadPoolExecutor(
+            max_workers=len(plan), thread_name_prefix="ffmpeg-segment"
+        ) as executor:
+            futures = [
+                executor.submit(self._run, cmd, timeout, False, watch)
+                for cmd, watch in zip(commands, watches, strict=True)
+            ]
+            wait(futures)
+        return self._merge_segments([future.result() for future in futures], watches)
+
+    async def _decode_whole_async(
+        self,
+        video_file: VideoFile,
+        plan: list[tuple[float, float | None]],
+        timeout: float | None,
+        watches: list[_ProgressWatch],
+    ) -> subprocess.CompletedProcess[str]:
+        """Async variant of :meth:`_decode_whole`."""
+        commands = [self._build_segment_command(video_file, *segment) for segment in plan]
+        if len(plan) == 1:
+            return await self._run_async(commands[0], timeout, is_quick=False, watch=watches[0])
+        logger.debug(f"Decoding {video_file.path} in {len(plan)} segments")
+        outcomes = await asyncio.gather(
+            *(
+                self._run_async(cmd, timeout, is_quick=False, watch=watch)
+                for cmd, watch in zip(commands, watches, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        results: list[subprocess.CompletedProcess[str]] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return self._merge_segments(results, watches)
+
+    @staticmethod
+    def _merge_segments(
+        results: list[subprocess.CompletedProcess[str]],
+        watches: list[_ProgressWatch],
+    ) -> subprocess.CompletedProcess[str]:
+        """Combine segment runs into one result judged like a single decode.
+
+        Lines a segment logged before its first output frame are kept unless
+        the preceding segment decoded past that frame.
+        """
+        returncode = next((r.returncode for r in results if r.returncode != 0), 0)
+        stderr = "".join(
+            (watch.release_leading_errors(watches[index - 1]) if index > 0 else "")
+            + (result.stderr or "")
+            for index, (result, watch) in enumerate(zip(results, watches, strict=True))
+        )
+        return subprocess.CompletedProcess(results[0].args, returncode, "", stderr)
+
+    def _finish_decode(
+        self,
+        video_file: VideoFile,
+        result: subprocess.CompletedProcess[str],
+        scan: ScanResult,
+        watches: list[_ProgressWatch],
+    ) -> ScanResult:
+        """Attach timed errors to a whole-file decode result and learn from clean runs."""
+        scan.error_timestamps = sorted(error for watch in watches for error in watch.errors)
+        if result.returncode == 0 and not scan.is_corrupt:
+            # Segments run side by side, each doing its share of the work
+            self.decode_speed.observe(decode_work(video_file) / len(watches), scan.inspection_time)
+        return scan
+
+    def _build_tail_probe_command(self, video_file: VideoFile) -> list[str]:
+        """
+        Build FFmpeg command decoding the last ``quick_tail_seconds`` of a file.
+
+        ``-sseof`` seeks relative to the duration declared by the container, so
+        no separate duration probe is needed. Progress is written to stdout,
+        whose final ``out_time_us`` tells how much of the tail was decoded.
+
         Args:
             video_file: Video file to inspect
 
         Returns:
             list[str]: FFmpeg command as list
         """
-        # Assumption: Quick scan reads first 10 seconds, disables audio, minimal output
         if self._ffmpeg_path is None:
             msg = "FFmpeg path is not set."
             raise FFmpegError(msg)
@@ -98,23 +581,137 @@ class FFmpegClient:
             str(self._ffmpeg_path),
             "-v",
             "error",
-            "-t",
-            (
-                str(self.config.quick_scan_duration)
-                if hasattr(self.config, "quick_scan_duration")
-                else "10"
-            ),
+            "-nostats",
+            "-progress",
+            "pipe:1",
+            "-sseof",
+            f"-{self.config.quick_tail_seconds:g}",
             "-i",
             str(video_file.path),
+            "-map",
+            "0:v:0?",
             "-f",
             "null",
             "-",
         ]
 
+    @staticmethod
+    def _parse_out_time(progress: str) -> float:
+        """Return the last output time in seconds reported by -progress, 0 if none."""
+        matches = _OUT_TIME_PATTERN.findall(progress)
+        return int(matches[-1]) / 1_000_000 if matches else 0.0
+
+    def _check_tail(
+        self,
+        video_file: VideoFile,
+        head_result: ScanResult,
+        tail: subprocess.CompletedProcess[str],
+        start_time: float,
+    ) -> ScanResult:
+        """
+        Combine a quick scan result with the outcome of its tail probe.
+
+        A tail that cannot be decoded at all means the data ends before the
+        declared duration: the file is truncated, which is reported as corrupt
+        right away instead of deferring to a deep scan. ``-sseof`` clamps to
+        the start of files shorter than the tail, so files whose declared
+        duration is unknown or shorter than ``quick_tail_seconds`` get no
+        truncation verdict. Errors decoded in the tail are judged like those of
+        the quick scan itself.
+
+        Args:
+            video_file: Video file that was scanned
+            head_result: Result of the quick scan
+            tail: Completed tail probe, stdout holding its progress output
+            start_time: When the quick scan started
+
+        Returns:
+            ScanResult: Final quick scan result
+        """
+        if self._tail_came_up_short(tail) and video_file.duration >= self.config.quick_tail_seconds:
+            logger.info(f"Truncated file, end of declared duration unreachable: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                is_corrupt=True,
+                error_message=(
+                    f"Truncated: last {self.config.quick_tail_seconds:g}s of the declared "
+                    f"duration cannot be decoded"
+                ),
+                ffmpeg_output=head_result.ffmpeg_output + (tail.stderr or ""),
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.QUICK,
+                confidence=0.95,
+                issue_code=IssueCode.TRUNCATED,
+            )
+        tail_result = self._process_ffmpeg_result(
+            video_file, tail, is_quick=True, start_time=start_time
+        )
+        if tail_result.is_corrupt or (tail_result.needs_deep_scan and head_result.is_healthy()):
+            return tail_result
+        head_result.inspection_time = time.time() - start_time
+        return head_result
+
+    def _tail_came_up_short(self, tail: subprocess.CompletedProcess[str]) -> bool:
+        """Whether a tail probe ran cleanly but decoded next to nothing of the tail."""
+        # A failed run says nothing about the duration, its errors are judged separately
+        min_decoded = min(_MIN_TAIL_SECONDS, self.config.quick_tail_seconds / 2)
+        return tail.returncode == 0 and self._parse_out_time(tail.stdout or "") < min_decoded
+
+    def _run_tail_probe(self, video_file: VideoFile) -> subprocess.CompletedProcess[str] | None:
+        """Run the tail probe of a quick scan, None if it could not complete."""
+        try:
+            return subprocess.run(
+                self._launch_command(self._build_tail_probe_command(video_file)),
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                errors="replace",
+                timeout=self.config.quick_timeout,
+                check=False,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Tail probe failed for {video_file.path}: {e}")
+            return None
+
+    async def _run_tail_probe_async(
+        self, video_file: VideoFile
+    ) -> subprocess.CompletedProcess[str] | None:
+        """Async variant of :meth:`_run_tail_probe`."""
+        cmd = self._build_tail_probe_command(video_file)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._launch_command(cmd),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as e:
+            logger.warning(f"Tail probe failed for {video_file.path}: {e}")
+            return None
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=self.config.quick_timeout
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.warning(f"Tail probe timed out for {video_file.path}")
+            return None
+        return subprocess.CompletedProcess(
+            cmd,
+            process.returncode or 0,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
     def inspect_quick(self, video_file: VideoFile) -> ScanResult:
         """
         Perform quick inspection of video file (limited time scan).
 
+        Unless the quick scan already found corruption, the last
+        ``quick_tail_seconds`` of the declared duration are decoded as well, so
+        truncated files are caught without a deep scan.
+
         Args:
             video_file: Video file to inspect
 
@@ -122,20 +719,29 @@ class FFmpegClient:
             ScanResult: Quick inspection results
         """
         logger.debug(f"Quick scan: {video_file.path}")
+        start_time = time.time()
+        if self._needs_duration(video_file):
+            self._probe_duration(video_file)
 
         # Build FFmpeg command for quick scan
         cmd = self._build_quick_scan_command(video_file)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self.config.quick_timeout,
-                check=False,  # Don't raise on non-zero exit
-            )
+            result = self._run(cmd, self.config.quick_timeout, is_quick=True)
 
-            return self._process_ffmpeg_result(video_file, result, is_quick=True)
+            scan_result = self._process_ffmpeg_result(
+                video_file, result, is_quick=True, start_time=start_time
+            )
+            if scan_result.is_corrupt or self.config.quick_tail_seconds <= 0:
+                return scan_result
+            tail = self._run_tail_probe(video_file)
+            if tail is None:
+                return scan_result
+            if self._tail_came_up_short(tail) and video_file.duration <= 0:
+                # Only short tails need the declared duration to tell a short clip
+                # from a truncated file
+                self._probe_duration(video_file)
+            return self._check_tail(video_file, scan_result, tail, start_time)
 
         except subprocess.TimeoutExpired:
             logger.warning(f"Quick scan timeout: {video_file.path}")
@@ -143,6 +749,8 @@ class FFmpegClient:
                 video_file=video_file,
                 needs_deep_scan=True,
                 error_message="Quick scan timed out - needs deep scan",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.QUICK,
             )
         except Exception as e:
             logger.exception(f"Quick scan failed: {video_file.path}")
@@ -150,43 +758,342 @@ class FFmpegClient:
                 video_file=video_file,
                 needs_deep_scan=True,
                 error_message=f"Quick scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.QUICK,
             )
 
-    def inspect_deep(self, video_file: VideoFile, timeout: int | None = None) -> ScanResult:
+    def _build_keyframe_scan_command(self, video_file: VideoFile) -> list[str]:
+        """
+        Build FFmpeg command for keyframe scan.
+
+        The decoder skips every frame except keyframes, so the whole file is
+        demuxed and each GOP's keyframe decoded at a fraction of a full decode.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            list[str]: FFmpeg command as list
+        """
+        if self._ffmpeg_path is None:
+            msg = "FFmpeg path is not set."
+            raise FFmpegError(msg)
+        return [
+            str(self._ffmpeg_path),
+            "-v",
+            "error",
+            "-skip_frame",
+            "nokey",
+            "-i",
+            str(video_file.path),
+            "-map",
+            "0:v:0?",
+            "-f",
+            "null",
+            "-",
+        ]
+
+    def inspect_keyframe(self, video_file: VideoFile) -> ScanResult:
+        """
+        Perform keyframe-only inspection of the whole video stream.
+
+        Intended for cheap triage: like a quick scan, anything suspicious is
+        flagged for a deep scan rather than trusted as final.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Keyframe inspection results
+        """
+        logger.debug(f"Keyframe scan: {video_file.path}")
+        return self._inspect_triage(
+            video_file,
+            self._build_keyframe_scan_command,
+            self.config.keyframe_timeout,
+            ScanMode.KEYFRAME,
+        )
+
+    def _build_bitstream_scan_command(self, video_file: VideoFile) -> list[str]:
+        """
+        Build FFmpeg command for bitstream scan.
+
+        Packets are stream-copied to the null muxer, so every packet of the file
+        is demuxed and parsed without being decoded. Strict error detection makes
+        the demuxer verify checksums and report malformed packets.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            list[str]: FFmpeg command as list
+        """
+        if self._ffmpeg_path is None:
+            msg = "FFmpeg path is not set."
+            raise FFmpegError(msg)
+        return [
+            str(self._ffmpeg_path),
+            "-v",
+            "error",
+            "-err_detect",
+            "crccheck+bitstream+buffer",
+            "-i",
+            str(video_file.path),
+            "-map",
+            "0:v?",
+            "-map",
+            "0:a?",
+            "-c",
+            "copy",
+            "-f",
+            "null",
+            "-",
+        ]
+
+    def inspect_bitstream(self, video_file: VideoFile) -> ScanResult:
+        """
+        Validate the packet structure of the whole file without decoding.
+
+        Catches container and packet damage at close to disk speed, but not
+        corruption inside otherwise well-formed packets, so suspicious files
+        are flagged for a deep scan like in a quick scan.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Bitstream inspection results
+        """
+        logger.debug(f"Bitstream scan: {video_file.path}")
+        return self._inspect_triage(
+            video_file,
+            self._build_bitstream_scan_command,
+            self.config.bitstream_timeout,
+            ScanMode.BITSTREAM,
+        )
+
+    def _inspect_triage(
+        self,
+        video_file: VideoFile,
+        build_command: Callable[[VideoFile], list[str]],
+        timeout: float,
+        scan_mode: ScanMode,
+    ) -> ScanResult:
+        """Run a triage scan whose inconclusive outcomes defer to a deep scan."""
+        start_time = time.time()
+        label = scan_mode.value.capitalize()
+        try:
+            result = self._run(build_command(video_file), timeout, is_quick=True)
+            return self._process_ffmpeg_result(
+                video_file, result, is_quick=True, start_time=start_time, scan_mode=scan_mode
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{label} scan timeout: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"{label} scan timed out - needs deep scan", start_time, scan_mode
+            )
+        except Exception as e:
+            logger.exception(f"{label} scan failed: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"{label} scan failed: {e}", start_time, scan_mode
+            )
+
+    @staticmethod
+    def _triage_failure(
+        video_file: VideoFile, message: str, start_time: float, scan_mode: ScanMode
+    ) -> ScanResult:
+        return ScanResult(
+            video_file=video_file,
+            needs_deep_scan=True,
+            error_message=message,
+            inspection_time=time.time() - start_time,
+            scan_mode=scan_mode,
+        )
+
+    def _get_ffprobe_command(self) -> str:
+        """Return the ffprobe executable shipped alongside the FFmpeg in use."""
+        return self._ffmpeg_path.replace("ffmpeg", "ffprobe") if self._ffmpeg_path else "ffprobe"
+
+    def _build_probe_command(self, video_file: VideoFile) -> list[str]:
+        """
+        Build ffprobe command listing packet and stream metadata.
+
+        Uses the compact writer, one line per packet, so the output can be
+        validated as it streams instead of being parsed as one JSON document.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            list[str]: ffprobe command as list
+        """
+        return [
+            self._get_ffprobe_command(),
+            "-v",
+            "error",
+            "-show_entries",
+            PROBE_ENTRIES,
+            "-of",
+            "compact",
+            str(video_file.path),
+        ]
+
+    def inspect_probe(self, video_file: VideoFile) -> ScanResult:
+        """
+        Validate container structure from packet metadata without decoding.
+
+        Checks DTS ordering, keyframe index, declared versus actual duration and
+        stream sanity. Reads only container structure, so it is far cheaper than
+        a deep scan while still covering the whole file, which lets it catch
+        truncation that a head-only quick scan misses.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Probe inspection results
+        """
+        logger.debug(f"Probe scan: {video_file.path}")
+        start_time = time.time()
+        analyzer = PacketStructureAnalyzer()
+        try:
+            returncode, stderr = self._run_probe(
+                self._build_probe_command(video_file), self.config.probe_timeout, analyzer
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Probe scan timeout: {video_file.path}")
+            return self._triage_failure(
+                video_file, "Probe scan timed out - needs deep scan", start_time, ScanMode.PROBE
+            )
+        except Exception as e:
+            logger.exception(f"Probe scan failed: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"Probe scan failed: {e}", start_time, ScanMode.PROBE
+            )
+        return self._process_probe_result(video_file, analyzer, returncode, stderr, start_time)
+
+    def _run_probe(
+        self, cmd: list[str], timeout: float | None, analyzer: PacketStructureAnalyzer
+    ) -> tuple[int, str]:
+        """
+        Run ffprobe, feeding its stdout to the analyzer line by line.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds, or None for no timeout
+            analyzer: Analyzer consuming the compact output
+
+        Returns:
+            tuple[int, str]: Exit code and stderr output
+        """
+        timed_out = threading.Event()
+        stderr_chunks: list[str] = []
+
+        with subprocess.Popen(
+            self._launch_command(cmd),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        ) as process:
+
+            def on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            # ffprobe blocks if either pipe fills up, so stderr is drained separately
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_chunks.append(
+                    process.stderr.read() if process.stderr else ""
+                ),
+                daemon=True,
+            )
+            stderr_reader.start()
+            timer = threading.Timer(timeout, on_timeout) if timeout is not None else None
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            try:
+                if process.stdout is not None:
+                    for line in process.stdout:
+                        analyzer.feed_line(line)
+                returncode = process.wait()
+                stderr_reader.join()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+        stderr = "".join(stderr_chunks)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout or 0, stderr=stderr)
+        return returncode, stderr
+
+    def _process_probe_result(
+        self,
+        video_file: VideoFile,
+        analyzer: PacketStructureAnalyzer,
+        returncode: int,
+        stderr: str,
+        start_time: float,
+    ) -> ScanResult:
+        """Combine ffprobe's error output with the structural findings into a result."""
+        analysis = analyzer.analyze(
+            self.detector.analyze_ffmpeg_output(stderr, returncode, is_quick_scan=True)
+        )
+        return ScanResult(
+            video_file=video_file,
+            is_corrupt=analysis.is_corrupt,
+            needs_deep_scan=analysis.needs_deep_scan,
+            error_message=analysis.error_message,
+            ffmpeg_output=stderr,
+            inspection_time=time.time() - start_time,
+            scan_mode=ScanMode.PROBE,
+            confidence=analysis.confidence,
+        )
+
+    def inspect_deep(self, video_file: VideoFile, timeout: float | None = None) -> ScanResult:
         """
         Perform deep inspection of video file (full scan).
 
+        Long files are decoded in concurrent time segments when
+        ``deep_segments`` is above 1; the verdict is taken from the combined
+        output, as if the file had been decoded in one run.
+
         Args:
             video_file: Video file to inspect
-            timeout: Timeout in seconds. If None, no timeout is applied.
+            timeout: Timeout in seconds. If None, the timeout is derived from the
+                file (see :meth:`_deep_timeout`), probing its duration if unknown.
 
         Returns:
             ScanResult: Deep inspection results
         """
         logger.debug(f"Deep scan: {video_file.path}")
 
-        # Build FFmpeg command for deep scan
-        cmd = self._build_deep_scan_command(video_file)
-
-        # Use configured timeout if none provided
+        if self._needs_deep_probe(video_file, timeout_needed=timeout is None):
+            self._probe_duration(video_file)
+        plan = self._segment_plan(video_file)
         if timeout is None:
-            timeout = self.config.deep_timeout
+            timeout = self._deep_timeout(video_file, len(plan))
+        watches = self._segment_watches(video_file, plan)
+        start_time = time.time()
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
+            result = self._decode_whole(video_file, plan, timeout, watches)
+            scan = self._process_ffmpeg_result(
+                video_file, result, is_quick=False, start_time=start_time
             )
-            return self._process_ffmpeg_result(video_file, result, is_quick=False)
+            return self._finish_decode(video_file, result, scan, watches)
+        except StallTimeoutExpired as e:
+            return self._stalled_result(video_file, e, start_time, ScanMode.DEEP)
         except subprocess.TimeoutExpired:
             logger.warning(f"Deep scan timeout: {video_file.path}")
             return ScanResult(
                 video_file=video_file,
                 needs_deep_scan=False,
                 error_message="Deep scan timed out",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.DEEP,
             )
         except Exception as e:
             logger.exception(f"Deep scan failed: {video_file.path}")
@@ -194,6 +1101,8 @@ class FFmpegClient:
                 video_file=video_file,
                 needs_deep_scan=False,
                 error_message=f"Deep scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.DEEP,
             )
 
     def _build_deep_scan_command(self, video_file: VideoFile) -> list[str]:
@@ -213,6 +1122,7 @@ class FFmpegClient:
             str(self._ffmpeg_path),
             "-v",
             "error",
+            *_PROGRESS_ARGS,
             "-i",
             str(video_file.path),
             "-f",
@@ -220,6 +1130,31 @@ class FFmpegClient:
             "-",
         ]
 
+    def _stalled_result(
+        self,
+        video_file: VideoFile,
+        error: StallTimeoutExpired,
+        start_time: float,
+        scan_mode: ScanMode,
+    ) -> ScanResult:
+        """Result for a decode killed by the stall watchdog; the file gets no verdict."""
+        logger.warning(
+            f"{scan_mode.value.capitalize()} scan stalled at {error.position:.1f}s: "
+            f"{video_file.path}"
+        )
+        return ScanResult(
+            video_file=video_file,
+            needs_deep_scan=False,
+            stalled=True,
+            error_message=(
+                f"Scan stalled: no decoding progress for {error.timeout:.0f}s "
+                f"at {error.position:.1f}s"
+            ),
+            ffmpeg_output=error.stderr or "",
+            inspection_time=time.time() - start_time,
+            scan_mode=scan_mode,
+        )
+
     def inspect_full(self, video_file: VideoFile) -> ScanResult:
         """
         Perform full inspection of video file without timeout.
@@ -232,25 +1167,499 @@ class FFmpegClient:
         """
         logger.debug(f"Full scan (no timeout): {video_file.path}")
 
-        # Build FFmpeg command for full scan (same as deep scan)
-        cmd = self._build_deep_scan_command(video_file)
+        # Same decode as a deep scan, without timeout
+        if self._needs_deep_probe(video_file, timeout_needed=False):
+            self._probe_duration(video_file)
+        plan = self._segment_plan(video_file)
+        watches = self._segment_watches(video_file, plan)
+        start_time = time.time()
 
         try:
-            # Run without timeout
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=None,
-                check=False,
+            result = self._decode_whole(video_file, plan, None, watches)
+            scan = self._process_ffmpeg_result(
+                video_file, result, is_quick=False, start_time=start_time, scan_mode=ScanMode.FULL
             )
-            return self._process_ffmpeg_result(video_file, result, is_quick=False)
+            return self._finish_decode(video_file, result, scan, watches)
+        except StallTimeoutExpired as e:
+            return self._stalled_result(video_file, e, start_time, ScanMode.FULL)
         except Exception as e:
             logger.exception(f"Full scan failed: {video_file.path}")
             return ScanResult(
                 video_file=video_file,
                 needs_deep_scan=False,
                 error_message=f"Full scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.FULL,
+            )
+
+    def _run(
+        self,
+        cmd: list[str],
+        timeout: float | None,
+        is_quick: bool,
+        watch: _ProgressWatch | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Run an FFmpeg command, streaming stderr through the corruption detector.
+
+        With ``early_abort`` enabled, FFmpeg is stopped as soon as a definitive
+        corruption pattern shows up, so a badly broken file does not have to be
+        decoded to the end. Otherwise behaves like subprocess.run: the process is
+        killed and subprocess.TimeoutExpired is raised on timeout.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds, or None for no timeout
+            is_quick: Whether this is a quick scan
+            watch: Progress watch for commands writing ``-progress`` output to
+                stdout; the process is killed and StallTimeoutExpired raised
+                when it reports a stall
+
+        Returns:
+            subprocess.CompletedProcess[str]: Completed process with stderr output
+        """
+        stream = StreamingCorruptionDetector(self.detector, is_quick)
+        timed_out = threading.Event()
+        finished = threading.Event()
+
+        with subprocess.Popen(
+            self._launch_command(cmd),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE if watch is not None else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        ) as process:
+
+            def on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, on_timeout) if timeout is not None else None
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            monitors = self._start_progress_monitors(process, watch, finished) if watch else []
+            try:
+                if process.stderr is not None:
+                    for line in process.stderr:
+                        if watch is not None:
+                            if watch.holding_leading_errors:
+                                watch.leading_lines.append(line)
+                                continue
+                            watch.record_error(line)
+                        if stream.feed_line(line) and self.config.early_abort:
+                            logger.info(f"Stopping FFmpeg early: {stream.definitive_match}")
+                            self._terminate(process)
+                            break
+                returncode = process.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                finished.set()
+                for monitor in monitors:
+                    monitor.join()
+
+        if watch is not None and watch.tripped:
+            raise StallTimeoutExpired(cmd, watch.stall_timeout, stream.stderr, watch.position)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout or 0, stderr=stream.stderr)
+        return subprocess.CompletedProcess(cmd, returncode, "", stream.stderr)
+
+    def _start_progress_monitors(
+        self,
+        process: subprocess.Popen[str],
+        watch: _ProgressWatch,
+        finished: threading.Event,
+    ) -> list[threading.Thread]:
+        """Start threads reading FFmpeg's progress output and killing it once it stalls."""
+
+        def read_progress() -> None:
+            if process.stdout is not None:
+                for line in process.stdout:
+                    watch.feed_line(line)
+
+        def watchdog() -> None:
+            while (remaining := watch.seconds_until_stall()) is not None:
+                if remaining <= 0:
+                    watch.tripped = True
+                    logger.warning(f"FFmpeg made no progress for {watch.stall_timeout:.0f}s")
+                    process.kill()
+                    return
+                if finished.wait(remaining):
+                    return
+
+        monitors = [
+            threading.Thread(target=read_progress, name="ffmpeg-progress", daemon=True),
+            threading.Thread(target=watchdog, name="ffmpeg-watchdog", daemon=True),
+        ]
+        for monitor in monitors:
+            monitor.start()
+        return monitors
+
+    def _terminate(self, process: subprocess.Popen[str]) -> None:
+        """Stop an FFmpeg process, killing it if it ignores SIGTERM."""
+        process.terminate()
+        try:
+            process.wait(timeout=_TERMINATE_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    async def _run_async(
+        self,
+        cmd: list[str],
+        timeout: float | None,
+        is_quick: bool,
+        watch: _ProgressWatch | None = None,
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Run an FFmpeg command without blocking the event loop.
+
+        Same semantics as _run: stderr is streamed through the corruption detector
+        with early abort, and the process is killed and subprocess.TimeoutExpired
+        raised on timeout. The process is also killed if the awaiting task is
+        cancelled.
+
+        Args:
+            cmd: Command to execute
+            timeout: Timeout in seconds, or None for no timeout
+            is_quick: Whether this is a quick scan
+            watch: Progress watch for commands writing ``-progress`` output to
+                stdout; the process is killed and StallTimeoutExpired raised
+                when it reports a stall
+
+        Returns:
+            subprocess.CompletedProcess[str]: Completed process with stderr output
+        """
+        stream = StreamingCorruptionDetector(self.detector, is_quick)
+        process = await asyncio.create_subprocess_exec(
+            *self._launch_command(cmd),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE if watch is not None else asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        monitors = (
+            [
+                asyncio.create_task(self._read_progress_async(process, watch)),
+                asyncio.create_task(self._stall_watchdog_async(process, watch)),
+            ]
+            if watch is not None
+            else []
+        )
+
+        async def consume() -> int:
+            if process.stderr is not None:
+                async for raw_line in process.stderr:
+                    line = raw_line.decode(errors="replace")
+                    if watch is not None:
+                        if watch.holding_leading_errors:
+                            watch.leading_lines.append(line)
+                            continue
+                        watch.record_error(line)
+                    if stream.feed_line(line) and self.config.early_abort:
+                        logger.info(f"Stopping FFmpeg early: {stream.definitive_match}")
+                        process.terminate()
+                        try:
+                            return await asyncio.wait_for(
+                                process.wait(), timeout=_TERMINATE_GRACE_SECONDS
+                            )
+                        except TimeoutError:
+                            process.kill()
+                            break
+            return await process.wait()
+
+        try:
+            returncode = await asyncio.wait_for(consume(), timeout=timeout)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout or 0, stderr=stream.stderr) from None
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        finally:
+            for monitor in monitors:
+                monitor.cancel()
+            await asyncio.gather(*monitors, return_exceptions=True)
+
+        if watch is not None and watch.tripped:
+            raise StallTimeoutExpired(cmd, watch.stall_timeout, stream.stderr, watch.position)
+        return subprocess.CompletedProcess(cmd, returncode, "", stream.stderr)
+
+    @staticmethod
+    async def _read_progress_async(
+        process: asyncio.subprocess.Process, watch: _ProgressWatch
+    ) -> None:
+        """Feed FFmpeg's progress output to the watch."""
+        if process.stdout is not None:
+            async for raw_line in process.stdout:
+                watch.feed_line(raw_line.decode(errors="replace"))
+
+    @staticmethod
+    async def _stall_watchdog_async(
+        process: asyncio.subprocess.Process, watch: _ProgressWatch
+    ) -> None:
+        """Kill FFmpeg once the watch reports no progress for its stall timeout."""
+        while (remaining := watch.seconds_until_stall()) is not None:
+            if remaining <= 0:
+                watch.tripped = True
+                logger.warning(f"FFmpeg made no progress for {watch.stall_timeout:.0f}s")
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                return
+            await asyncio.sleep(remaining)
+
+    async def inspect_quick_async(self, video_file: VideoFile) -> ScanResult:
+        """
+        Perform quick inspection of video file without blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Quick inspection results
+        """
+        logger.debug(f"Quick scan (async): {video_file.path}")
+        start_time = time.time()
+
+        try:
+            if self._needs_duration(video_file):
+                await self._probe_duration_async(video_file)
+            cmd = self._build_quick_scan_command(video_file)
+            result = await self._run_async(cmd, self.config.quick_timeout, is_quick=True)
+            scan_result = self._process_ffmpeg_result(
+                video_file, result, is_quick=True, start_time=start_time
+            )
+            if scan_result.is_corrupt or self.config.quick_tail_seconds <= 0:
+                return scan_result
+            tail = await self._run_tail_probe_async(video_file)
+            if tail is None:
+                return scan_result
+            if self._tail_came_up_short(tail) and video_file.duration <= 0:
+                await self._probe_duration_async(video_file)
+            return self._check_tail(video_file, scan_result, tail, start_time)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Quick scan timeout: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                needs_deep_scan=True,
+                error_message="Quick scan timed out - needs deep scan",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.QUICK,
+            )
+        except Exception as e:
+            logger.exception(f"Quick scan failed: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                needs_deep_scan=True,
+                error_message=f"Quick scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.QUICK,
+            )
+
+    async def inspect_keyframe_async(self, video_file: VideoFile) -> ScanResult:
+        """
+        Perform keyframe-only inspection without blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Keyframe inspection results
+        """
+        logger.debug(f"Keyframe scan (async): {video_file.path}")
+        return await self._inspect_triage_async(
+            video_file,
+            self._build_keyframe_scan_command,
+            self.config.keyframe_timeout,
+            ScanMode.KEYFRAME,
+        )
+
+    async def inspect_bitstream_async(self, video_file: VideoFile) -> ScanResult:
+        """
+        Validate the packet structure of the whole file without blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Bitstream inspection results
+        """
+        logger.debug(f"Bitstream scan (async): {video_file.path}")
+        return await self._inspect_triage_async(
+            video_file,
+            self._build_bitstream_scan_command,
+            self.config.bitstream_timeout,
+            ScanMode.BITSTREAM,
+        )
+
+    async def _inspect_triage_async(
+        self,
+        video_file: VideoFile,
+        build_command: Callable[[VideoFile], list[str]],
+        timeout: float,
+        scan_mode: ScanMode,
+    ) -> ScanResult:
+        """Async variant of :meth:`_inspect_triage`."""
+        start_time = time.time()
+        label = scan_mode.value.capitalize()
+        try:
+            result = await self._run_async(build_command(video_file), timeout, is_quick=True)
+            return self._process_ffmpeg_result(
+                video_file, result, is_quick=True, start_time=start_time, scan_mode=scan_mode
+            )
+        except subprocess.TimeoutExpired:
+            logger.warning(f"{label} scan timeout: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"{label} scan timed out - needs deep scan", start_time, scan_mode
+            )
+        except Exception as e:
+            logger.exception(f"{label} scan failed: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"{label} scan failed: {e}", start_time, scan_mode
+            )
+
+    async def inspect_probe_async(self, video_file: VideoFile) -> ScanResult:
+        """
+        Validate container structure without blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Probe inspection results
+        """
+        logger.debug(f"Probe scan (async): {video_file.path}")
+        start_time = time.time()
+        analyzer = PacketStructureAnalyzer()
+        cmd = self._build_probe_command(video_file)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._launch_command(cmd),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except Exception as e:
+            logger.exception(f"Probe scan failed: {video_file.path}")
+            return self._triage_failure(
+                video_file, f"Probe scan failed: {e}", start_time, ScanMode.PROBE
+            )
+
+        async def read_stderr() -> bytes:
+            return await process.stderr.read() if process.stderr is not None else b""
+
+        async def consume() -> tuple[int, bytes]:
+            # ffprobe blocks if either pipe fills up, so stderr is drained concurrently
+            stderr_task = asyncio.ensure_future(read_stderr())
+            if process.stdout is not None:
+                async for raw_line in process.stdout:
+                    analyzer.feed_line(raw_line.decode(errors="replace"))
+            return await process.wait(), await stderr_task
+
+        try:
+            returncode, stderr = await asyncio.wait_for(
+                consume(), timeout=self.config.probe_timeout
+            )
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+            logger.warning(f"Probe scan timeout: {video_file.path}")
+            return self._triage_failure(
+                video_file, "Probe scan timed out - needs deep scan", start_time, ScanMode.PROBE
+            )
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+        return self._process_probe_result(
+            video_file, analyzer, returncode, stderr.decode(errors="replace"), start_time
+        )
+
+    async def inspect_deep_async(
+        self, video_file: VideoFile, timeout: float | None = None
+    ) -> ScanResult:
+        """
+        Perform deep inspection of video file without blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+            timeout: Timeout in seconds. If None, the timeout is derived from the
+                file (see :meth:`_deep_timeout`), probing its duration if unknown.
+
+        Returns:
+            ScanResult: Deep inspection results
+        """
+        logger.debug(f"Deep scan (async): {video_file.path}")
+        if self._needs_deep_probe(video_file, timeout_needed=timeout is None):
+            await self._probe_duration_async(video_file)
+        plan = self._segment_plan(video_file)
+        if timeout is None:
+            timeout = self._deep_timeout(video_file, len(plan))
+        watches = self._segment_watches(video_file, plan)
+        start_time = time.time()
+
+        try:
+            result = await self._decode_whole_async(video_file, plan, timeout, watches)
+            scan = self._process_ffmpeg_result(
+                video_file, result, is_quick=False, start_time=start_time
+            )
+            return self._finish_decode(video_file, result, scan, watches)
+        except StallTimeoutExpired as e:
+            return self._stalled_result(video_file, e, start_time, ScanMode.DEEP)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Deep scan timeout: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                needs_deep_scan=False,
+                error_message="Deep scan timed out",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.DEEP,
+            )
+        except Exception as e:
+            logger.exception(f"Deep scan failed: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                needs_deep_scan=False,
+                error_message=f"Deep scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.DEEP,
+            )
+
+    async def inspect_full_async(self, video_file: VideoFile) -> ScanResult:
+        """
+        Perform full inspection of video file without timeout or blocking the event loop.
+
+        Args:
+            video_file: Video file to inspect
+
+        Returns:
+            ScanResult: Full inspection results
+        """
+        logger.debug(f"Full scan (async, no timeout): {video_file.path}")
+        if self._needs_deep_probe(video_file, timeout_needed=False):
+            await self._probe_duration_async(video_file)
+        plan = self._segment_plan(video_file)
+        watches = self._segment_watches(video_file, plan)
+        start_time = time.time()
+
+        try:
+            result = await self._decode_whole_async(video_file, plan, None, watches)
+            scan = self._process_ffmpeg_result(
+                video_file, result, is_quick=False, start_time=start_time, scan_mode=ScanMode.FULL
+            )
+            return self._finish_decode(video_file, result, scan, watches)
+        except StallTimeoutExpired as e:
+            return self._stalled_result(video_file, e, start_time, ScanMode.FULL)
+        except Exception as e:
+            logger.exception(f"Full scan failed: {video_file.path}")
+            return ScanResult(
+                video_file=video_file,
+                needs_deep_scan=False,
+                error_message=f"Full scan failed: {e}",
+                inspection_time=time.time() - start_time,
+                scan_mode=ScanMode.FULL,
             )
 
     def test_installation(self) -> dict[str, Any]:
@@ -316,9 +1725,7 @@ class FFmpegClient:
                     pass
 
         # Test FFprobe (usually comes with FFmpeg)
-        ffprobe_cmd = (
-            self._ffmpeg_path.replace("ffmpeg", "ffprobe") if self._ffmpeg_path else "ffprobe"
-        )
+        ffprobe_cmd = self._get_ffprobe_command()
         try:
             probe_result = subprocess.run(
                 [ffprobe_cmd, "-version"],
@@ -338,6 +1745,8 @@ class FFmpegClient:
         video_file: VideoFile,
         result: subprocess.CompletedProcess[str],
         is_quick: bool,
+        start_time: float | None = None,
+        scan_mode: ScanMode | None = None,
     ) -> ScanResult:
         """
         Process the result of an FFmpeg subprocess run.
@@ -346,6 +1755,8 @@ class FFmpegClient:
             video_file: Video file that was scanned
             result: CompletedProcess from subprocess.run
             is_quick: Whether this was a quick scan
+            start_time: When the FFmpeg run started, used for inspection_time
+            scan_mode: Scan mode to record; defaults to QUICK or DEEP based on is_quick
 
         Returns:
             ScanResult: The scan result object
@@ -359,8 +1770,17 @@ class FFmpegClient:
         if result.returncode != 0 and not error_message:
             error_message = error_output.strip() or "FFmpeg reported errors"
 
+        if scan_mode is None:
+            scan_mode = ScanMode.QUICK if is_quick else ScanMode.DEEP
+
         return ScanResult(
             video_file=video_file,
+            is_corrupt=analysis.is_corrupt,
             needs_deep_scan=analysis.needs_deep_scan,
             error_message=error_message or "",
+            ffmpeg_output=error_output,
+            inspection_time=time.time() - start_time if start_time is not None else 0.0,
+            scan_mode=scan_mode,
+            deep_scan_completed=not is_quick,
+            confidence=analysis.confidence,
         )
@@ -0,0 +1,194 @@
+"""
+Container structure validation from ffprobe packet metadata.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from src.ffmpeg.corruption_detector import CorruptionAnalysis
+
+logger = logging.getLogger(__name__)
+
+# Fields requested from ffprobe; everything else is left out to keep output small
+PROBE_ENTRIES = (
+    "packet=stream_index,pts_time,dts_time,duration_time,flags"
+    ":stream=index,codec_type"
+    ":format=nb_streams,start_time,duration"
+)
+
+
+@dataclass
+class _StreamState:
+    """Running statistics for one stream's packets."""
+
+    codec_type: str = ""
+    declared: bool = False
+    packets: int = 0
+    keyframes: int = 0
+    dts_regressions: int = 0
+    last_dts: float | None = None
+    end_time: float | None = None
+
+
+def _parse_float(value: str | None) -> float | None:
+    if value is None or value == "N/A":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class PacketStructureAnalyzer:
+    """Validates container structure from ``ffprobe -of compact`` output.
+
+    Lines are consumed one at a time so files with millions of packets are
+    checked in constant memory. Checks performed once all output is read:
+
+    - DTS must increase within each stream
+    - Every video stream must have keyframes, otherwise the file has no usable
+      index and cannot be seeked
+    - The last packet must end close to the duration declared by the container;
+      a shortfall means the file was truncated
+    - The container must declare streams, packets must belong to a declared
+      stream, and every audio and video stream must have packets
+    """
+
+    def __init__(self, truncation_tolerance: float = 0.05, min_truncation_seconds: float = 2.0):
+        """Initialize the analyzer.
+
+        Args:
+            truncation_tolerance: Fraction of the declared duration the last
+                packet may fall short by before the file counts as truncated
+            min_truncation_seconds: Shortfall in seconds always tolerated, which
+                absorbs rounding on short files
+        """
+        self.truncation_tolerance = truncation_tolerance
+        self.min_truncation_seconds = min_truncation_seconds
+        self._streams: dict[int, _StreamState] = {}
+        self._declared_streams: int | None = None
+        self._declared_duration: float | None = None
+        self._start_time = 0.0
+
+    def feed_line(self, line: str) -> None:
+        """Consume one line of compact ffprobe output.
+
+        Args:
+            line: A single ``section|key=value|...`` line
+        """
+        section, _, rest = line.strip().partition("|")
+        if not rest:
+            return
+        fields = dict(item.partition("=")[::2] for item in rest.split("|"))
+        if section == "packet":
+            self._feed_packet(fields)
+        elif section == "stream":
+            index = fields.get("index", "")
+            if index.isdigit():
+                stream = self._stream(int(index))
+                stream.declared = True
+                stream.codec_type = fields.get("codec_type", "")
+        elif section == "format":
+            nb_streams = fields.get("nb_streams", "")
+            self._declared_streams = int(nb_streams) if nb_streams.isdigit() else None
+            self._declared_duration = _parse_float(fields.get("duration"))
+            self._start_time = _parse_float(fields.get("start_time")) or 0.0
+
+    def _stream(self, index: int) -> _StreamState:
+        return self._streams.setdefault(index, _StreamState())
+
+    def _feed_packet(self, fields: dict[str, str]) -> None:
+        index = fields.get("stream_index", "")
+        if not index.isdigit():
+            return
+        stream = self._stream(int(index))
+        stream.packets += 1
+        if "K" in fields.get("flags", ""):
+            stream.keyframes += 1
+
+        dts = _parse_float(fields.get("dts_time"))
+        if dts is not None:
+            if stream.last_dts is not None and dts < stream.last_dts:
+                stream.dts_regressions += 1
+            stream.last_dts = dts
+
+        pts = _parse_float(fields.get("pts_time"))
+        if pts is not None:
+            end = pts + (_parse_float(fields.get("duration_time")) or 0.0)
+            if stream.end_time is None or end > stream.end_time:
+                stream.end_time = end
+
+    def analyze(self, base: CorruptionAnalysis) -> CorruptionAnalysis:
+        """Add structural findings to the analysis of ffprobe's own error output.
+
+        Args:
+            base: Analysis of ffprobe's stderr and exit code
+
+        Returns:
+            CorruptionAnalysis: Combined analysis
+        """
+        definitive: list[str] = []
+        suspicious: list[str] = []
+
+        if not self._declared_streams and not any(s.declared for s in self._streams.values()):
+            definitive.append("no streams found")
+        for index, stream in sorted(self._streams.items()):
+            if not stream.declared:
+                definitive.append(f"packets for undeclared stream {index}")
+                continue
+            if stream.packets == 0:
+                # Subtitle or data tracks may legitimately be empty
+                if stream.codec_type in ("video", "audio"):
+                    definitive.append(f"{stream.codec_type} stream {index} has no packets")
+                continue
+            if stream.dts_regressions:
+                suspicious.append(
+                    f"non-monotonic dts in stream {index} ({stream.dts_regressions} packets)"
+                )
+            if stream.codec_type == "video" and stream.keyframes == 0:
+                suspicious.append(f"missing index: no keyframes in video stream {index}")
+
+        truncation = self._truncation()
+        if truncation:
+            definitive.append(truncation)
+
+        issues = list(base.detected_issues or [])
+        issues.extend(definitive + suspicious)
+        analysis = CorruptionAnalysis(
+            is_corrupt=base.is_corrupt,
+            needs_deep_scan=base.needs_deep_scan,
+            error_message=base.error_message,
+            confidence=base.confidence,
+            detected_issues=issues,
+        )
+        if definitive:
+            analysis.is_corrupt = True
+            analysis.needs_deep_scan = False
+            analysis.confidence = max(analysis.confidence, 0.8)
+            analysis.error_message = f"Structural corruption: {', '.join(definitive[:3])}"
+        elif suspicious and not analysis.is_corrupt:
+            analysis.needs_deep_scan = True
+            analysis.confidence = max(analysis.confidence, 0.6)
+            analysis.error_message = (
+                f"Structural issues: {', '.join(suspicious[:3])} - needs deep scan"
+            )
+        logger.debug(f"Packet structure issues: {definitive + suspicious}")
+        return analysis
+
+    def _truncation(self) -> str | None:
+        """Describe how far packets fall short of the declared duration, if they do."""
+        if not self._declared_duration:
+            return None
+        ends = [s.end_time for s in self._streams.values() if s.end_time is not None]
+        if not ends:
+            return None
+        covered = max(ends) - self._start_time
+        missing = self._declared_duration - covered
+        allowed = max(
+            self.min_truncation_seconds, self._declared_duration * self.truncation_tolerance
+        )
+        if missing <= allowed:
+            return None
+        return (
+            f"truncated: packets end at {covered:.1f}s of {self._declared_duration:.1f}s declared"
+        )
@@ -1,6 +1,7 @@
 """Database-only output storage for CLI results."""
 
 import logging
+import time
 from typing import Any
 
 from src.config.config import AppConfig
@@ -20,9 +21,7 @@ class OutputFormatter:
         try:
             from src.database.service import DatabaseService
 
-            self._database_service = DatabaseService(
-                config.database.path, config.database.auto_cleanup_days
-            )
+            self._database_service = DatabaseService.from_config(config.database)
             logger.info(f"Database storage initialized at {config.database.path}")
         except ImportError as e:
             msg = f"Database dependencies not available: {e}"
@@ -32,10 +31,59 @@ class OutputFormatter:
             logger.exception("Failed to initialize database service")
             raise
 
+    def begin_scan(self, directory: Any, scan_mode: Any) -> int:
+        """
+        Register a scan before it runs so results can be stored as they complete.
+
+        Args:
+            directory: Directory being scanned
+            scan_mode: Scan mode being used
+
+        Returns:
+            Scan ID in database
+        """
+        from src.database.models import ScanDatabaseModel
+
+        db_service = self.get_database_service()
+        scan_id: int = db_service.store_scan(
+            ScanDatabaseModel(
+                directory=str(directory),
+                scan_mode=scan_mode.value,
+                started_at=time.time(),
+                total_files=0,
+                processed_files=0,
+                corrupt_files=0,
+                healthy_files=0,
+                success_rate=0.0,
+                scan_time=0.0,
+            )
+        )
+        return scan_id
+
+    def create_result_sink(self, scan_id: int) -> Any:
+        """
+        Create a write-behind sink storing individual results for a scan.
+
+        Args:
+            scan_id: Scan ID returned by begin_scan
+
+        Returns:
+            ScanResultSink writing to the database
+        """
+        from src.database.result_sink import ScanResultSink
+
+        return ScanResultSink(
+            self.get_database_service(),
+            scan_id,
+            batch_size=self.config.database.result_batch_size,
+            flush_interval=self.config.database.result_flush_interval,
+        )
+
     def store_scan_results(
         self,
         summary: Any,
         scan_results: list[Any] | None = None,
+        scan_id: int | None = None,
     ) -> int:
         """
         Store scan results in database.
@@ -43,6 +91,8 @@ class OutputFormatter:
         Args:
             summary: Scan summary object with results
             scan_results: Optional list of individual scan results
+            scan_id: Scan registered with begin_scan to finalize instead of
+                creating a new scan record
 
         Returns:
             Scan ID in database
@@ -52,14 +102,20 @@ class OutputFormatter:
             logger.error(msg)
             raise RuntimeError(msg)
 
-        return self._store_scan_in_database(summary, scan_results)
+        return self._store_scan_in_database(summary, scan_results, scan_id)
 
-    def _store_scan_in_database(self, summary: Any, scan_results: list[Any] | None = None) -> int:
+    def _store_scan_in_database(
+        self,
+        summary: Any,
+        scan_results: list[Any] | None = None,
+        scan_id: int | None = None,
+    ) -> int:
         """Store scan summary and results in database.
 
         Args:
             summary: Scan summary object
             scan_results: Optional list of individual scan results
+            scan_id: Existing scan record to update with the summary
 
         Returns:
             Scan ID
@@ -76,7 +132,10 @@ class OutputFormatter:
 
             # Convert summary to database model
             db_scan = ScanDatabaseModel.from_scan_summary(summary)
-            scan_id = self._database_service.store_scan(db_scan)
+            if scan_id is None:
+                scan_id = self._database_service.store_scan(db_scan)
+            else:
+                self._database_service.update_scan(scan_id, db_scan)
 
             # Store individual results if provided
             if scan_results:
@@ -27,7 +27,7 @@ def test_full_scan_mode_in_choices():
     """Test that FULL mode is included in scan mode choices."""
     scan_modes = [mode.value for mode in ScanMode]
     assert "full" in scan_modes
-    assert len(scan_modes) == 4  # QUICK, DEEP, HYBRID, FULL
+    assert len(scan_modes) == 8  # QUICK, DEEP, HYBRID, FULL, KEYFRAME, BITSTREAM, PROBE, ZEROBLOCK
 
 
 def test_ffmpeg_client_inspect_full_runs(tmp_path):
@@ -0,0 +1,237 @@
+"""
+Unit tests for the adaptive concurrency controller and load throttle.
+"""
+
+import pytest
+
+from src.core.concurrency import (
+    ConcurrencyController,
+    IoWaitSampler,
+    LoadThrottle,
+    SystemLoad,
+    SystemLoadSampler,
+)
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanResult
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeIoWait(IoWaitSampler):
+    """I/O wait source returning a set value."""
+
+    def __init__(self, value: float | None = None) -> None:
+        self.value = value
+
+    def sample(self) -> float | None:
+        return self.value
+
+
+class _FakeLoad(SystemLoadSampler):
+    """Load source returning set values, counting samples taken."""
+
+    def __init__(self, load_per_cpu: float | None = None, io_pressure: float | None = None):
+        self.load = SystemLoad(load_per_cpu, None, io_pressure)
+        self.calls = 0
+
+    def sample(self) -> SystemLoad:
+        self.calls += 1
+        return self.load
+
+
+class _Harness:
+    """Controller driven by a fake clock, completing files of a fixed size."""
+
+    def __init__(self, tmp_path, io_wait=None, **kwargs):
+        self.now = 0.0
+        self.io_wait = _FakeIoWait(io_wait)
+        kwargs.setdefault("min_workers", 1)
+        kwargs.setdefault("max_workers", 8)
+        self.controller = ConcurrencyController(
+            window=10.0, io_wait=self.io_wait, clock=lambda: self.now, **kwargs
+        )
+        path = tmp_path / "video.mp4"
+        path.write_bytes(bytes(1000))
+        self.result = ScanResult(video_file=VideoFile(path=path, duration=60.0))
+
+    def window(self, files: int, seconds: float = 10.0):
+        """Complete files over one window and return the controller's decision."""
+        for _ in range(files):
+            self.controller.observe(self.result)
+        self.now += seconds
+        return self.controller.update()
+
+
+class TestConcurrencyController:
+    """Test ConcurrencyController class"""
+
+    def test_rejects_invalid_bounds(self):
+        """Test that min_workers must lie between 1 and max_workers"""
+        with pytest.raises(ValueError, match="min_workers"):
+            ConcurrencyController(4, 2, io_wait=_FakeIoWait())
+
+    def test_increases_while_throughput_improves(self, tmp_path):
+        """Test additive increase while each window beats the previous one"""
+        harness = _Harness(tmp_path)
+
+        assert harness.controller.limit == 1
+        assert harness.window(2).reason == "first window"
+        assert harness.window(4).limit == 3
+        decision = harness.window(6)
+
+        assert decision.previous == 3
+        assert decision.limit == 4
+        assert decision.reason == "throughput improved"
+        assert decision.bytes_per_second == pytest.approx(600.0)
+        assert decision.video_seconds_per_second == pytest.approx(36.0)
+        assert len(harness.controller.decisions) == 3
+
+    def test_backs_off_when_throughput_plateaus(self, tmp_path):
+        """Test multiplicative decrease when an increase bought nothing, then probing"""
+        harness = _Harness(tmp_path)
+        harness.controller.limit = 4
+        harness.window(8)
+
+        cut = harness.window(8)
+        probe = harness.window(8)
+
+        assert (cut.previous, cut.limit, cut.reason) == (5, 3, "throughput plateaued")
+        assert probe.limit == 4
+        assert probe.reason == "probing after a cut"
+
+    def test_backs_off_on_high_io_wait(self, tmp_path):
+        """Test that I/O wait above the threshold cuts the limit despite better throughput"""
+        harness = _Harness(tmp_path, max_io_wait=0.3)
+        harness.controller.limit = 4
+        harness.io_wait.value = 0.5
+
+        decision = harness.window(8)
+
+        assert decision.limit == 3
+        assert decision.io_wait == 0.5
+        assert "I/O wait" in decision.reason
+
+    def test_stays_within_bounds(self, tmp_path):
+        """Test that the limit never leaves [min_workers, max_workers]"""
+        harness = _Harness(tmp_path, min_workers=2, max_workers=3)
+
+        limits = [harness.window(files).limit for files in (4, 8, 16)]
+        harness.io_wait.value = 1.0
+        limits += [harness.window(16).limit for _ in range(3)]
+
+        assert limits == [3, 3, 3, 2, 2, 2]
+
+    def test_waits_for_enough_completions(self, tmp_path):
+        """Test that windows are stretched while fewer files than workers complete"""
+        harness = _Harness(tmp_path, min_workers=4)
+
+        assert harness.window(1) is None
+        assert harness.window(0) is None
+        decision = harness.window(0, seconds=20.0)
+
+        assert decision is not None
+        assert decision.bytes_per_second == pytest.approx(25.0)
+
+
+class TestIoWaitSampler:
+    """Test IoWaitSampler class"""
+
+    def test_reports_iowait_share_between_samples(self, tmp_path):
+        """Test that the I/O wait fraction is computed from /proc/stat deltas"""
+        stat = tmp_path / "stat"
+        stat.write_text("cpu  100 0 100 700 100 0 0 0 0 0\ncpu0 1 2 3\n")
+        sampler = IoWaitSampler(stat)
+        stat.write_text("cpu  150 0 150 800 300 0 0 0 0 0\ncpu0 1 2 3\n")
+
+        assert sampler.sample() == pytest.approx(0.5)
+        assert sampler.sample() is None
+
+    def test_missing_statistics_are_unknown(self, tmp_path):
+        """Test that an unreadable source reports no I/O wait"""
+        assert IoWaitSampler(tmp_path / "missing").sample() is None
+
+
+class TestLoadThrottle:
+    """Test LoadThrottle class"""
+
+    def _throttle(self, sampler, **kwargs):
+        kwargs.setdefault("max_load_per_cpu", 1.0)
+        return LoadThrottle(8, interval=0, sampler=sampler, clock=lambda: 0.0, **kwargs)
+
+    def test_halves_limit_until_paused_while_busy(self):
+        """Test that each check above a threshold halves the limit down to a pause"""
+        throttle = self._throttle(_FakeLoad(load_per_cpu=2.0))
+
+        limits = []
+        for _ in range(5):
+            throttle.update()
+            limits.append(throttle.limit)
+
+        assert limits == [4, 2, 1, 0, 0]
+        assert throttle.paused
+
+    def test_resumes_one_at_a_time_once_load_drops(self):
+        """Test that the limit only grows once load is well below the threshold"""
+        sampler = _FakeLoad(load_per_cpu=0.9)
+        throttle = self._throttle(sampler)
+        throttle.limit = 0
+
+        throttle.update()
+        assert throttle.limit == 0
+
+        sampler.load = SystemLoad(0.5, None, None)
+        throttle.update()
+        throttle.update()
+        assert throttle.limit == 2
+
+    def test_checks_once_per_interval(self):
+        """Test that the load is sampled at most every interval seconds"""
+        now = 0.0
+        sampler = _FakeLoad(load_per_cpu=2.0)
+        throttle = LoadThrottle(
+            8, max_load_per_cpu=1.0, interval=5.0, sampler=sampler, clock=lambda: now
+        )
+
+        throttle.update()
+        throttle.update()
+        now = 5.0
+        throttle.update()
+
+        assert sampler.calls == 2
+        assert throttle.limit == 2
+
+    def test_ignores_unset_thresholds_and_missing_metrics(self):
+        """Test that only configured metrics the host exposes are compared"""
+        throttle = self._throttle(
+            _FakeLoad(load_per_cpu=10.0, io_pressure=None), max_load_per_cpu=0.0, max_io_pressure=20
+        )
+
+        throttle.update()
+
+        assert throttle.enabled
+        assert throttle.limit == 8
+        assert not self._throttle(_FakeLoad(), max_load_per_cpu=0.0).enabled
+
+
+class TestSystemLoadSampler:
+    """Test SystemLoadSampler class"""
+
+    def test_reads_load_average_and_pressure(self, tmp_path):
+        """Test that load is divided by the CPU count and PSI avg10 is parsed"""
+        (tmp_path / "cpu").write_text(
+            "some avg10=12.50 avg60=3.00 avg300=1.00 total=100\n"
+            "full avg10=0.00 avg60=0.00 avg300=0.00 total=0\n"
+        )
+        (tmp_path / "io").write_text("some avg10=40.00 avg60=1.00 avg300=0.50 total=5\n")
+        sampler = SystemLoadSampler(tmp_path, load_average=lambda: (4.0, 1.0, 1.0), cpu_count=2)
+
+        assert sampler.sample() == SystemLoad(2.0, 12.5, 40.0)
+
+    def test_missing_pressure_is_unknown(self, tmp_path):
+        """Test that hosts without PSI report no pressure"""
+        sampler = SystemLoadSampler(tmp_path / "missing", load_average=lambda: (1.0, 1.0, 1.0))
+
+        load = sampler.sample()
+
+        assert load.cpu_pressure is None
+        assert load.io_pressure is None
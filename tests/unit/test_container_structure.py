@@ -0,0 +1,205 @@
+"""
+Unit tests for in-process MP4 and Matroska container structure validation.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.container_structure import ContainerStructureValidator
+
+pytestmark = pytest.mark.unit
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+
+
+def _box(box_type: bytes, payload: bytes = b"", size: int | None = None) -> bytes:
+    return (size if size is not None else 8 + len(payload)).to_bytes(4, "big") + box_type + payload
+
+
+def _element(element_id: int, data: bytes = b"", size: bytes | None = None) -> bytes:
+    id_bytes = element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+    if size is None:
+        size = b"\x01" + len(data).to_bytes(7, "big")
+    return id_bytes + size + data
+
+
+EBML_HEADER = _element(0x1A45DFA3, _element(0x4282, b"matroska"))
+INFO = _element(0x1549A966, _element(0x2AD7B1, b"\x0f\x42\x40"))
+CLUSTER = _element(0x1F43B675, _element(0xE7, b"\x00") + _element(0xA3, bytes(32)))
+CUES = _element(0x1C53BB6B, _element(0xBB, bytes(8)))
+
+
+def _seek_head(target_id: int, position: int) -> bytes:
+    seek = _element(0x53AB, target_id.to_bytes(4, "big")) + _element(
+        0x53AC, position.to_bytes(4, "big")
+    )
+    return _element(0x114D9B74, _element(0x4DBB, seek))
+
+
+def _mkv(children: bytes, size: bytes | None = None) -> bytes:
+    return EBML_HEADER + _element(0x18538067, children, size=size)
+
+
+def _validate(tmp_path: Path, data: bytes, name: str = "video.bin"):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return ContainerStructureValidator().validate(path)
+
+
+FTYP = _box(b"ftyp", b"isom" + bytes(4))
+MOOV = _box(b"moov", _box(b"mvhd", bytes(100)) + _box(b"trak", _box(b"tkhd", bytes(84))))
+
+
+class TestMP4Structure:
+    """Test ISO-BMFF box validation"""
+
+    def test_intact_file_is_valid(self, tmp_path):
+        """Test that a complete box chain passes"""
+        report = _validate(tmp_path, FTYP + MOOV + _box(b"mdat", bytes(500)))
+
+        assert report.container == "mp4"
+        assert report.is_valid
+
+    def test_mdat_to_end_of_file_is_valid(self, tmp_path):
+        """Test that a size 0 box extending to the end of the file passes"""
+        report = _validate(tmp_path, FTYP + MOOV + _box(b"mdat", bytes(500), size=0))
+
+        assert report.is_valid
+
+    def test_truncated_mdat_is_detected(self, tmp_path):
+        """Test that a box running past the end of the file is reported"""
+        data = FTYP + MOOV + _box(b"mdat", bytes(500))
+
+        report = _validate(tmp_path, data[:-200])
+
+        assert not report.is_valid
+        assert "truncated" in report.issues[0]
+        assert "mdat" in report.issues[0]
+
+    def test_large_size_box_is_followed(self, tmp_path):
+        """Test that 64-bit box sizes are honoured"""
+        mdat = (1).to_bytes(4, "big") + b"mdat" + (16 + 100).to_bytes(8, "big") + bytes(100)
+
+        report = _validate(tmp_path, FTYP + mdat + MOOV)
+
+        assert report.is_valid
+
+    def test_missing_moov_is_detected(self, tmp_path):
+        """Test that a file without a movie header box is reported"""
+        report = _validate(tmp_path, FTYP + _box(b"mdat", bytes(500)))
+
+        assert report.issues == ["missing moov box"]
+
+    def test_moov_child_overrunning_parent_is_detected(self, tmp_path):
+        """Test that boxes inside moov must fit inside it"""
+        moov = _box(b"moov", _box(b"trak", bytes(20), size=200))
+
+        report = _validate(tmp_path, FTYP + moov + _box(b"mdat", bytes(500)))
+
+        assert "overruns its parent" in report.issues[0]
+
+    def test_garbage_between_boxes_is_detected(self, tmp_path):
+        """Test that a broken box chain before the moov is reported"""
+        garbage = b"\x00\x00\x00\x10\xff\xfe\x00\x01" + bytes(8)
+
+        report = _validate(tmp_path, FTYP + garbage + MOOV)
+
+        assert report.issues[0].startswith("invalid box")
+
+    def test_trailing_bytes_after_moov_are_ignored(self, tmp_path):
+        """Test that zero padding or junk after the last box is not reported"""
+        intact = FTYP + _box(b"mdat", bytes(500)) + MOOV
+
+        assert _validate(tmp_path, intact + bytes(1000)).is_valid
+        assert _validate(tmp_path, intact + b"\xff\xfe\x00\x01\x00\x01\x02\x03").is_valid
+
+    @pytest.mark.parametrize("leading_box", [b"uuid", b"styp", b"sidx"])
+    def test_files_leading_with_other_top_level_boxes_are_validated(self, tmp_path, leading_box):
+        """Test that vendor and segmented exports are recognized as MP4"""
+        data = _box(leading_box, bytes(16)) + MOOV + _box(b"mdat", bytes(500))
+
+        report = _validate(tmp_path, data)
+
+        assert report.container == "mp4"
+        assert report.is_valid
+
+    def test_media_segment_without_moov_is_valid(self, tmp_path):
+        """Test that a styp media segment does not need its own moov"""
+        data = (
+            _box(b"styp", b"msdh" + bytes(4)) + _box(b"moof", bytes(40)) + _box(b"mdat", bytes(500))
+        )
+
+        assert _validate(tmp_path, data).is_valid
+
+
+class TestMatroskaStructure:
+    """Test EBML element validation"""
+
+    def test_intact_file_is_valid(self, tmp_path):
+        """Test that a complete Segment passes"""
+        seek_head = _seek_head(0x1C53BB6B, 0)
+        position = len(seek_head) + len(INFO) + 2 * len(CLUSTER)
+        children = _seek_head(0x1C53BB6B, position) + INFO + CLUSTER + CLUSTER + CUES
+
+        report = _validate(tmp_path, _mkv(children))
+
+        assert report.container == "matroska"
+        assert report.is_valid
+
+    def test_truncated_segment_is_detected(self, tmp_path):
+        """Test that a Segment larger than the file is reported"""
+        data = _mkv(INFO + CLUSTER + CLUSTER)
+
+        report = _validate(tmp_path, data[:-20])
+
+        assert "truncated: Segment" in report.issues[0]
+
+    def test_truncated_cluster_in_unknown_size_segment_is_detected(self, tmp_path):
+        """Test that a Cluster cut off at the end of a live recording is reported"""
+        data = _mkv(INFO + CLUSTER + CLUSTER, size=UNKNOWN_SIZE)
+
+        report = _validate(tmp_path, data[:-20])
+
+        assert "truncated: Cluster" in report.issues[0]
+
+    def test_seek_head_pointing_past_end_is_detected(self, tmp_path):
+        """Test that a missing Cues element referenced by the SeekHead is reported"""
+        children = _seek_head(0x1C53BB6B, 10_000) + INFO + CLUSTER
+
+        report = _validate(tmp_path, _mkv(children, size=UNKNOWN_SIZE))
+
+        assert "SeekHead points to Cues" in report.issues[0]
+
+    def test_broken_cluster_chain_is_detected(self, tmp_path):
+        """Test that garbage between Clusters is reported"""
+        report = _validate(tmp_path, _mkv(INFO + CLUSTER + b"\x80\x80" + CLUSTER))
+
+        assert "broken element chain" in report.issues[0]
+
+    def test_unknown_size_cluster_is_left_to_the_decoder(self, tmp_path):
+        """Test that unknown-size Clusters end the walk without an issue"""
+        cluster = _element(0x1F43B675, _element(0xE7, b"\x00"), size=UNKNOWN_SIZE)
+
+        report = _validate(tmp_path, _mkv(INFO + cluster, size=UNKNOWN_SIZE))
+
+        assert report.is_valid
+
+
+class TestUnvalidatedFiles:
+    """Test files the validator does not understand"""
+
+    def test_other_formats_are_not_validated(self, tmp_path):
+        """Test that unknown containers pass without a verdict"""
+        report = _validate(tmp_path, b"RIFF" + bytes(100) + b"AVI LIST")
+
+        assert report.container == ""
+        assert report.is_valid
+
+    def test_empty_and_missing_files_are_not_validated(self, tmp_path):
+        """Test that files without data to map pass without a verdict"""
+        validator = ContainerStructureValidator()
+        (tmp_path / "empty.mp4").touch()
+
+        assert validator.validate(tmp_path / "empty.mp4").is_valid
+        assert validator.validate(tmp_path / "missing.mp4").is_valid
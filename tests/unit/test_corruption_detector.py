@@ -4,7 +4,11 @@ Unit tests for corruption detector module.
 
 import pytest
 
-from src.ffmpeg.corruption_detector import CorruptionAnalysis, CorruptionDetector
+from src.ffmpeg.corruption_detector import (
+    CorruptionAnalysis,
+    CorruptionDetector,
+    StreamingCorruptionDetector,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -132,3 +136,31 @@ class TestCorruptionDetector:
         assert analysis.confidence > 0.5
         assert analysis.detected_issues is not None
         assert len(analysis.detected_issues) > 1
+
+
+class TestStreamingCorruptionDetector:
+    """Test StreamingCorruptionDetector class"""
+
+    def test_clean_lines_are_not_definitive(self):
+        """Test that warnings alone never trigger an early abort"""
+        stream = StreamingCorruptionDetector(CorruptionDetector())
+
+        assert stream.feed_line("Past duration 0.99 too large\n") is None
+        assert stream.definitive_match is None
+
+    def test_first_corruption_line_is_reported_once(self):
+        """Test that only the first definitive match is reported"""
+        stream = StreamingCorruptionDetector(CorruptionDetector())
+
+        assert stream.feed_line("frame=1\n") is None
+        assert stream.feed_line("moov atom not found\n") == "moov atom not found"
+        assert stream.feed_line("invalid nal unit size\n") is None
+        assert stream.definitive_match == "moov atom not found"
+
+    def test_stderr_keeps_all_lines(self):
+        """Test that fed output is preserved for the final analysis"""
+        stream = StreamingCorruptionDetector(CorruptionDetector())
+        stream.feed_line("first\n")
+        stream.feed_line("moov atom not found\n")
+
+        assert stream.stderr == "first\nmoov atom not found\n"
@@ -10,6 +10,7 @@ from src.core.models.inspection import VideoFile
 from src.core.models.scanning import ScanMode, ScanResult, ScanSummary
 from src.database.models import (
     DatabaseQueryFilter,
+    FileFingerprintDatabaseModel,
     ScanDatabaseModel,
     ScanResultDatabaseModel,
 )
@@ -432,6 +433,97 @@ class TestDatabaseService:
         assert temp_db.get_scan(old_scan_id) is None
         assert temp_db.get_scan(recent_scan_id) is not None
 
+    def test_store_and_retrieve_file_fingerprints(self, temp_db, tmp_path):
+        """Test storing fingerprints and replacing them with newer verdicts."""
+        video_path = tmp_path / "movie.mp4"
+        video_path.write_bytes(b"data")
+        stat_result = video_path.stat()
+        result = ScanResult(video_file=VideoFile(path=video_path), scan_mode=ScanMode.QUICK)
+
+        temp_db.store_file_fingerprints(
+            [FileFingerprintDatabaseModel.from_scan_result(result, stat_result)]
+        )
+        corrupt = ScanResult(
+            video_file=VideoFile(path=video_path), is_corrupt=True, scan_mode=ScanMode.DEEP
+        )
+        temp_db.store_file_fingerprints(
+            [FileFingerprintDatabaseModel.from_scan_result(corrupt, stat_result)]
+        )
+
+        fingerprints = temp_db.get_file_fingerprints([str(video_path), "/missing.mp4"])
+        assert list(fingerprints) == [str(video_path)]
+        assert fingerprints[str(video_path)].is_corrupt
+        assert fingerprints[str(video_path)].scan_mode == "deep"
+        assert fingerprints[str(video_path)].matches(stat_result)
+
+        video_path.write_bytes(b"changed data")
+        assert not fingerprints[str(video_path)].matches(video_path.stat())
+
+        assert list(temp_db.get_file_fingerprints_under(str(tmp_path))) == [str(video_path)]
+        assert temp_db.get_file_fingerprints_under(str(tmp_path / "other")) == {}
+
+    def test_store_and_retrieve_decode_speed_samples(self, temp_db):
+        """Test that the most recent decode speed samples are returned oldest first."""
+        assert temp_db.get_decode_speed_samples() == []
+
+        temp_db.store_decode_speed_samples([(100.0, 10.0), (200.0, 40.0)])
+        temp_db.store_decode_speed_samples([(300.0, 30.0)])
+
+        assert temp_db.get_decode_speed_samples() == [(100.0, 10.0), (200.0, 40.0), (300.0, 30.0)]
+        assert temp_db.get_decode_speed_samples(limit=2) == [(200.0, 40.0), (300.0, 30.0)]
+
+    def test_get_inspection_times_under(self, temp_db):
+        """Test that the latest timing per file is returned for one scan mode."""
+
+        def result(scan_id, filename, inspection_time, scan_mode="deep"):
+            return ScanResultDatabaseModel(
+                scan_id=scan_id,
+                filename=filename,
+                file_size=1000,
+                is_corrupt=False,
+                confidence=0.9,
+                inspection_time=inspection_time,
+                scan_mode=scan_mode,
+                status="HEALTHY",
+                created_at=time.time(),
+            )
+
+        scan_ids = [
+            temp_db.store_scan(
+                ScanDatabaseModel(
+                    directory="/videos",
+                    scan_mode="deep",
+                    started_at=time.time(),
+                    total_files=2,
+                    processed_files=2,
+                    corrupt_files=0,
+                    healthy_files=2,
+                    success_rate=100.0,
+                    scan_time=10.0,
+                )
+            )
+            for _ in range(2)
+        ]
+        temp_db.store_scan_results(
+            scan_ids[0],
+            [
+                result(scan_ids[0], "/videos/a.mp4", 50.0),
+                result(scan_ids[0], "/videos/b.mp4", 5.0, scan_mode="quick"),
+                result(scan_ids[0], "/other/c.mp4", 7.0),
+            ],
+        )
+        temp_db.store_scan_results(
+            scan_ids[1],
+            [result(scan_ids[1], "/videos/a.mp4", 80.0), result(scan_ids[1], "/videos/d.mp4", 0.0)],
+        )
+
+        assert temp_db.get_inspection_times_under("/videos", "deep") == {
+            "/videos/a.mp4": (1000, 80.0)
+        }
+        assert temp_db.get_inspection_times_under("/videos/", "quick") == {
+            "/videos/b.mp4": (1000, 5.0)
+        }
+
 
 @pytest.mark.unit
 class TestDatabaseIntegrationWithOutput:
@@ -519,3 +611,39 @@ class TestDatabaseIntegrationWithOutput:
         assert recent_scans[0].total_files == 10
         assert recent_scans[0].corrupt_files == 2
         assert recent_scans[0].healthy_files == 8
+
+    def test_begin_scan_then_finalize_updates_same_record(self, temp_db_config):
+        """Test that results streamed during a scan belong to the finalized scan."""
+        from src.output import OutputFormatter
+
+        config, _db_path = temp_db_config
+        formatter = OutputFormatter(config)
+
+        scan_id = formatter.begin_scan(Path("/test/videos"), ScanMode.QUICK)
+        with formatter.create_result_sink(scan_id) as sink:
+            for i in range(3):
+                sink.add(
+                    ScanResult(
+                        video_file=VideoFile(path=Path(f"/test/videos/v{i}.mp4")),
+                        is_corrupt=i == 0,
+                        scan_mode=ScanMode.QUICK,
+                    )
+                )
+
+        summary = ScanSummary(
+            directory=Path("/test/videos"),
+            total_files=3,
+            processed_files=3,
+            corrupt_files=1,
+            healthy_files=2,
+            scan_mode=ScanMode.QUICK,
+            scan_time=1.0,
+            started_at=time.time(),
+            completed_at=time.time(),
+        )
+        assert formatter.store_scan_results(summary=summary, scan_id=scan_id) == scan_id
+
+        db_service = formatter.get_database_service()
+        assert db_service.get_database_stats().total_scans == 1
+        assert db_service.get_scan(scan_id).corrupt_files == 1
+        assert len(db_service.get_scan_results(scan_id)) == 3
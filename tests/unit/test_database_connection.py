@@ -0,0 +1,90 @@
+"""Unit tests for per-thread SQLite connection management."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from src.database.connection import ConnectionManager
+from src.database.service import DatabaseService
+
+pytestmark = pytest.mark.unit
+
+
+class TestConnectionManager:
+    """Test connection reuse and tuning."""
+
+    def test_connection_is_tuned(self, tmp_path):
+        """Test that connections use WAL and the configured pragmas."""
+        manager = ConnectionManager(
+            tmp_path / "test.db", cache_size_kib=1024, mmap_size_mb=1, busy_timeout_ms=250
+        )
+        conn = manager.connection()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 250
+        manager.close()
+
+    def test_connection_reused_per_thread(self, tmp_path):
+        """Test that a thread keeps its connection and other threads get their own."""
+        manager = ConnectionManager(tmp_path / "test.db")
+        main_conn = manager.connection()
+        other: list[sqlite3.Connection] = []
+
+        thread = threading.Thread(target=lambda: other.append(manager.connection()))
+        thread.start()
+        thread.join()
+
+        assert manager.connection() is main_conn
+        assert other[0] is not main_conn
+        manager.close()
+
+    def test_close_closes_all_connections(self, tmp_path):
+        """Test that close releases connections and later calls reopen."""
+        manager = ConnectionManager(tmp_path / "test.db")
+        conn = manager.connection()
+        manager.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert manager.connection() is not conn
+        manager.close()
+
+
+class TestDatabaseServiceConnections:
+    """Test DatabaseService behavior on persistent connections."""
+
+    def test_failed_operation_is_rolled_back(self, tmp_path):
+        """Test that a failure does not leave an open transaction on the shared connection."""
+        service = DatabaseService(tmp_path / "test.db")
+
+        def fail_mid_transaction() -> None:
+            with service._get_connection() as conn:
+                conn.execute("DELETE FROM scans")
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            fail_mid_transaction()
+
+        with service._get_connection() as conn:
+            assert not conn.in_transaction
+        service.close()
+
+    def test_reader_not_blocked_by_open_write(self, tmp_path):
+        """Test that WAL lets another thread read while a write transaction is open."""
+        service = DatabaseService(tmp_path / "test.db", busy_timeout_ms=100)
+        read_results: list[int] = []
+
+        with service._get_connection() as conn:
+            conn.execute("DELETE FROM scans")
+            thread = threading.Thread(
+                target=lambda: read_results.append(service.get_database_stats().total_scans)
+            )
+            thread.start()
+            thread.join()
+            conn.rollback()
+
+        assert read_results == [0]
+        service.close()
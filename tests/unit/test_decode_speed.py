@@ -0,0 +1,91 @@
+"""
+Unit tests for decode work estimation and decode speed learning.
+"""
+
+import pytest
+
+from src.core.models.inspection import VideoFile
+from src.ffmpeg.decode_speed import DecodeSpeedModel, decode_work
+
+pytestmark = pytest.mark.unit
+
+
+class TestDecodeWork:
+    """Test decode_work function"""
+
+    def test_unknown_duration_has_no_work(self):
+        """Test that files without a probed duration cannot be estimated"""
+        assert decode_work(VideoFile(path="movie.mp4")) == 0.0
+
+    def test_reference_video_costs_its_duration(self):
+        """Test that 1080p H.264 is the unit of work"""
+        video = VideoFile(
+            path="movie.mp4", duration=60, video_codec="h264", width=1920, height=1080
+        )
+
+        assert decode_work(video) == 60
+
+    def test_resolution_and_codec_scale_work(self):
+        """Test that 4K HEVC costs eight times as much as 1080p H.264"""
+        video = VideoFile(
+            path="movie.mkv", duration=60, video_codec="hevc", width=3840, height=2160
+        )
+
+        assert decode_work(video) == 480
+
+    def test_unknown_stream_counts_as_reference(self):
+        """Test that unknown codecs and missing frame sizes count as 1080p H.264"""
+        video = VideoFile(path="movie.avi", duration=60, video_codec="rawvideo")
+
+        assert decode_work(video) == 60
+
+    def test_tiny_frames_have_a_floor(self):
+        """Test that very small frames still cost a fraction of the reference"""
+        video = VideoFile(path="clip.mp4", duration=100, video_codec="h264", width=16, height=16)
+
+        assert decode_work(video) == pytest.approx(10)
+
+
+class TestDecodeSpeedModel:
+    """Test DecodeSpeedModel class"""
+
+    def test_default_speed_until_enough_samples(self):
+        """Test that the configured default is used with too little history"""
+        model = DecodeSpeedModel(default_speed=4.0, min_samples=3)
+        model.observe(100, 10)
+        model.observe(100, 10)
+
+        assert model.speed == 4.0
+
+    def test_speed_is_median_of_samples(self):
+        """Test that one stalled decode does not skew the learned speed"""
+        model = DecodeSpeedModel(default_speed=4.0, min_samples=3)
+        for work, wall in ((100, 10), (120, 10), (100, 500)):
+            model.observe(work, wall)
+
+        assert model.speed == 10
+
+    def test_short_runs_are_ignored(self):
+        """Test that startup-dominated runs are not recorded"""
+        model = DecodeSpeedModel(default_speed=4.0)
+        model.observe(10, 0.2)
+        model.observe(0, 5)
+
+        assert model.take_unsaved() == []
+
+    def test_loaded_history_is_not_saved_again(self):
+        """Test that only newly observed samples are handed out for persistence"""
+        model = DecodeSpeedModel(default_speed=4.0, min_samples=2)
+        model.load([(200.0, 10.0), (400.0, 20.0)])
+        model.observe(300.0, 10.0)
+
+        assert model.speed == 20
+        assert model.take_unsaved() == [(300.0, 10.0)]
+        assert model.take_unsaved() == []
+
+    def test_only_recent_samples_count(self):
+        """Test that old samples drop out of the window"""
+        model = DecodeSpeedModel(default_speed=4.0, min_samples=1, max_samples=2)
+        model.load([(10.0, 10.0), (50.0, 10.0), (50.0, 10.0)])
+
+        assert model.speed == 5
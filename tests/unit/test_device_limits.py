@@ -0,0 +1,39 @@
+"""
+Unit tests for per-device concurrency caps.
+"""
+
+import pytest
+
+from src.core.device_limits import UNKNOWN_DEVICE, DeviceLimits
+from src.core.models.inspection import VideoFile
+
+pytestmark = pytest.mark.unit
+
+
+class TestDeviceLimits:
+    """Test DeviceLimits class"""
+
+    def test_caps_apply_to_the_mount_points_device(self, tmp_path):
+        """Test that a cap configured by path applies to files on the same device"""
+        (tmp_path / "sub").mkdir()
+        limits = DeviceLimits({str(tmp_path): 2}, default_cap=5)
+
+        device = limits.device_of(VideoFile(path=tmp_path / "sub" / "movie.mkv"))
+
+        assert device == tmp_path.stat().st_dev
+        assert limits.cap(device) == 2
+        assert limits.cap(device + 1) == 5
+        assert limits.enabled
+
+    def test_unreadable_cap_paths_are_ignored(self, tmp_path):
+        """Test that caps for missing mount points are skipped"""
+        limits = DeviceLimits({str(tmp_path / "missing"): 2})
+
+        assert not limits.enabled
+        assert limits.cap(tmp_path.stat().st_dev) == 0
+
+    def test_unreadable_directories_map_to_unknown_device(self, tmp_path):
+        """Test that files in missing directories share the unknown device"""
+        limits = DeviceLimits(default_cap=1)
+
+        assert limits.device_of(VideoFile(path=tmp_path / "gone" / "a.mp4")) == UNKNOWN_DEVICE
@@ -0,0 +1,81 @@
+"""
+Unit tests for the background discovery stream.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.discovery import DiscoveryStream
+from src.core.models.inspection import VideoFile
+
+pytestmark = pytest.mark.unit
+
+
+def _video_files(count: int):
+    for i in range(count):
+        yield VideoFile(path=Path(f"/videos/file{i}.mp4"))
+
+
+class TestDiscoveryStream:
+    """Test DiscoveryStream class"""
+
+    def test_yields_all_files_in_walk_order(self):
+        """Test that every discovered file is handed out once, in order"""
+        with DiscoveryStream(_video_files(50), maxsize=4) as stream:
+            files = [vf for vf in stream if vf is not None]
+
+        assert [vf.path.name for vf in files] == [f"file{i}.mp4" for i in range(50)]
+        assert stream.discovered_count == 50
+        assert stream.is_complete
+
+    def test_first_file_available_before_walk_finishes(self):
+        """Test that consumers get files while the walk is still running"""
+        release = threading.Event()
+
+        def slow_walk():
+            yield VideoFile(path=Path("/videos/first.mp4"))
+            release.wait(5)
+            yield VideoFile(path=Path("/videos/second.mp4"))
+
+        with DiscoveryStream(slow_walk(), poll_interval=0.01) as stream:
+            items = iter(stream)
+            first = next(items)
+            assert first.path.name == "first.mp4"
+            assert not stream.is_complete
+            assert next(items) is None
+            release.set()
+            rest = [vf for vf in items if vf is not None]
+
+        assert [vf.path.name for vf in rest] == ["second.mp4"]
+        assert stream.is_complete
+
+    def test_walk_is_bounded_by_queue_size(self):
+        """Test that the walk does not run far ahead of the consumer"""
+        with DiscoveryStream(_video_files(100), maxsize=5, poll_interval=0.01) as stream:
+            time.sleep(0.1)
+            # Queue holds maxsize files plus one blocked in put
+            assert stream.discovered_count <= 6
+            assert len([vf for vf in stream if vf is not None]) == 100
+
+    def test_close_stops_blocked_walk(self):
+        """Test that closing an unconsumed stream ends the walk"""
+        stream = DiscoveryStream(_video_files(100), maxsize=1, poll_interval=0.01).start()
+        stream.close()
+
+        assert not stream.is_complete
+        assert stream.discovered_count < 100
+
+    def test_walk_error_ends_stream(self):
+        """Test that a failing walk still terminates iteration"""
+
+        def failing_walk():
+            yield VideoFile(path=Path("/videos/ok.mp4"))
+            raise OSError("mount went away")
+
+        with DiscoveryStream(failing_walk()) as stream:
+            files = [vf for vf in stream if vf is not None]
+
+        assert len(files) == 1
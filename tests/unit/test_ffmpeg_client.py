@@ -0,0 +1,750 @@
+"""
+Unit tests for FFmpegClient using a stub ffmpeg executable.
+"""
+
+import asyncio
+import os
+import shutil
+import stat
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.config.config import FFmpegConfig
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import IssueCode, ScanMode
+from src.ffmpeg.ffmpeg_client import FFmpegClient
+
+pytestmark = pytest.mark.unit
+
+
+def _make_stub_ffmpeg(directory: Path, body: str) -> Path:
+    """Write an executable shell script standing in for ffmpeg."""
+    script = directory / "ffmpeg"
+    script.write_text(f"#!/bin/sh\n{body}\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return script
+
+
+def _make_client(ffmpeg_path: Path, **config_overrides) -> FFmpegClient:
+    """Create an FFmpegClient pointed at a stub without probing the system."""
+    with patch.object(FFmpegClient, "_find_ffmpeg_command"):
+        client = FFmpegClient(FFmpegConfig(**config_overrides))
+    client._ffmpeg_path = str(ffmpeg_path)
+    return client
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    path = tmp_path / "movie.mp4"
+    path.write_bytes(b"\x00" * 16)
+    return VideoFile(path=path)
+
+
+class TestFFmpegClientResults:
+    """Test verdicts produced from FFmpeg output"""
+
+    def test_inspect_deep_reports_corruption(self, tmp_path, video_file):
+        """Test that corruption found by the detector is reflected in the result"""
+        stub = _make_stub_ffmpeg(tmp_path, 'echo "moov atom not found" >&2; exit 1')
+        client = _make_client(stub)
+
+        result = client.inspect_deep(video_file)
+
+        assert result.is_corrupt
+        assert result.confidence > 0.5
+        assert result.scan_mode == ScanMode.DEEP
+        assert result.deep_scan_completed
+        assert "moov atom not found" in result.ffmpeg_output
+
+    def test_inspect_quick_clean_file(self, tmp_path, video_file):
+        """Test that a clean run yields a healthy quick result"""
+        stub = _make_stub_ffmpeg(tmp_path, 'echo "out_time_us=5000000"; exit 0')
+        client = _make_client(stub)
+
+        result = client.inspect_quick(video_file)
+
+        assert not result.is_corrupt
+        assert not result.needs_deep_scan
+        assert result.scan_mode == ScanMode.QUICK
+
+
+class TestFFmpegClientSampledQuickScan:
+    """Test quick scans decoding several windows spread over the file"""
+
+    def test_single_window_decodes_file_start(self, tmp_path, video_file):
+        """Test that the default quick scan decodes the first window only"""
+        client = _make_client(tmp_path / "ffmpeg")
+
+        cmd = client._build_quick_scan_command(video_file)
+
+        assert cmd[1:] == ["-v", "error", "-t", "10", "-i", str(video_file.path), "-f", "null", "-"]
+
+    def test_windows_spread_from_start_to_tail(self, tmp_path, video_file):
+        """Test that K windows start at the beginning and end at the tail"""
+        client = _make_client(tmp_path / "ffmpeg", quick_sample_windows=5, quick_window_seconds=4)
+        video_file.duration = 404.0
+
+        windows = client._sample_windows(video_file.duration)
+        cmd = client._build_quick_scan_command(video_file)
+
+        assert windows == [(0.0, 4), (100.0, 4), (200.0, 4), (300.0, 4), (400.0, 4)]
+        assert cmd.count("-i") == 5
+        assert cmd.count("null") == 5
+        assert cmd[cmd.index("-ss") + 1] == "100.000"
+        assert cmd.count("-map") == 6  # video of every window plus audio of the first
+
+    def test_short_file_is_decoded_whole(self, tmp_path):
+        """Test that overlapping windows collapse into one"""
+        client = _make_client(tmp_path / "ffmpeg", quick_sample_windows=5, quick_window_seconds=4)
+
+        assert client._sample_windows(15.0) == [(0.0, 20)]
+        assert client._sample_windows(0.0) == [(0.0, 4)]
+
+    def test_duration_probed_before_sampling(self, tmp_path, video_file):
+        """Test that the duration is read from FFmpeg's input summary"""
+        stub = _make_stub_ffmpeg(
+            tmp_path,
+            'case "$*" in *-hide_banner*) echo "  Duration: 00:10:00.50, start: 0" >&2; exit 1;; esac\n'
+            'echo "$*" > "$(dirname "$0")/args"; exit 0',
+        )
+        client = _make_client(stub, quick_sample_windows=3, quick_tail_seconds=0)
+
+        result = client.inspect_quick(video_file)
+
+        assert not result.is_corrupt
+        assert video_file.duration == 600.5
+        assert (tmp_path / "args").read_text().count("-ss") == 2
+
+    def test_unknown_duration_falls_back_to_start(self, tmp_path, video_file):
+        """Test that a failed probe still runs a head-only quick scan"""
+        stub = _make_stub_ffmpeg(tmp_path, 'echo "$*" >> "$(dirname "$0")/args"; exit 0')
+        client = _make_client(stub, quick_sample_windows=3, quick_tail_seconds=0)
+
+        result = asyncio.run(client.inspect_quick_async(video_file))
+
+        assert not result.is_corrupt
+        assert "-ss" not in (tmp_path / "args").read_text()
+
+
+class TestFFmpegClientTailProbe:
+    """Test quick scans decoding the end of the declared duration"""
+
+    def test_command_seeks_relative_to_end(self, tmp_path, video_file):
+        """Test that the tail probe seeks from the declared end and reports progress"""
+        client = _make_client(tmp_path / "ffmpeg", quick_tail_seconds=5)
+
+        cmd = client._build_tail_probe_command(video_file)
+
+        assert cmd[cmd.index("-sseof") + 1] == "-5"
+        assert cmd[cmd.index("-progress") + 1] == "pipe:1"
+
+    def test_unreachable_tail_is_corrupt(self, tmp_path, video_file):
+        """Test that a tail that decodes nothing marks the file truncated"""
+        stub = _make_stub_ffmpeg(
+            tmp_path,
+            'case "$*" in *-sseof*) echo "out_time_us=N/A"; echo "progress=end";;\n'
+            '*-hide_banner*) echo "  Duration: 00:10:00.00, start: 0" >&2; exit 1;; esac',
+        )
+        client = _make_client(stub)
+
+        result = client.inspect_quick(video_file)
+
+        assert result.is_corrupt
+        assert not result.needs_deep_scan
+        assert result.confidence >= 0.9
+        assert result.issue_code == IssueCode.TRUNCATED
+
+    def test_short_clip_is_not_truncation(self, tmp_path, video_file):
+        """Test that a clip shorter than the tail, decoded whole, stays healthy"""
+        stub = _make_stub_ffmpeg(
+            tmp_path,
+            'case "$*" in *-sseof*) echo "out_time_us=960000"; echo "progress=end";;\n'
+            '*-hide_banner*) echo "  Duration: 00:00:01.00, start: 0" >&2; exit 1;; esac',
+        )
+        client = _make_client(stub, quick_tail_seconds=5)
+
+        result = asyncio.run(client.inspect_quick_async(video_file))
+
+        assert result.is_healthy()
+        assert result.issue_code is None
+        assert video_file.duration == 1.0
+
+    def test_unknown_duration_is_not_truncation(self, tmp_path, video_file):
+        """Test that a short tail is not judged when the declared duration is unknown"""
+        stub = _make_stub_ffmpeg(
+            tmp_path, 'case "$*" in *-sseof*) echo "out_time_us=N/A"; echo "progress=end";; esac'
+        )
+        client = _make_client(stub)
+
+        result = client.inspect_quick(video_file)
+
+        assert result.issue_code != IssueCode.TRUNCATED
+
+    def test_reachable_tail_keeps_quick_verdict(self, tmp_path, video_file):
+        """Test that a fully decoded tail leaves the quick result unchanged"""
+        stub = _make_stub_ffmpeg(
+            tmp_path, 'case "$*" in *-sseof*) echo "out_time_us=5000000";; esac; exit 0'
+        )
+        client = _make_client(stub)
+
+        result = asyncio.run(client.inspect_quick_async(video_file))
+
+        assert result.is_healthy()
+        assert result.issue_code is None
+
+    def test_tail_skipped_when_quick_scan_finds_corruption(self, tmp_path, video_file):
+        """Test that no tail probe runs for files already found corrupt"""
+        stub = _make_stub_ffmpeg(
+            tmp_path, 'echo "$*" >> "$(dirname "$0")/args"; echo "moov atom not found" >&2; exit 1'
+        )
+        client = _make_client(stub)
+
+        result = client.inspect_quick(video_file)
+
+        assert result.is_corrupt
+        assert "-sseof" not in (tmp_path / "args").read_text()
+
+    def test_failed_tail_probe_is_not_truncation(self, tmp_path, video_file):
+        """Test that a tail probe that cannot run does not count as truncation"""
+        stub = _make_stub_ffmpeg(tmp_path, 'case "$*" in *-sseof*) exit 1;; esac; exit 0')
+        client = _make_client(stub)
+
+        result = client.inspect_quick(video_file)
+
+        assert result.issue_code != IssueCode.TRUNCATED
+
+
+class TestFFmpegClientAdaptiveTimeout:
+    """Test deep scan timeouts derived from each file"""
+
+    PROBE = (
+        'case "$*" in *-hide_banner*) echo "  Duration: 01:00:00.00, start: 0" >&2; '
+        'echo "  Stream #0:0: Video: hevc (Main), yuv420p, 3840x2160, 24 fps" >&2; exit 1;; esac'
+    )
+
+    def test_timeout_scales_with_decode_work(self, tmp_path):
+        """Test that long, high resolution files get proportionally more time"""
+        client = _make_client(tmp_path / "ffmpeg", default_decode_speed=4, timeout_safety_factor=3)
+        video = VideoFile(
+            path=tmp_path / "movie.mkv", duration=3600, video_codec="hevc", width=3840, height=2160
+        )
+
+        assert client._deep_timeout(video) == 3600 * 8 / 4 * 3
+
+    def test_short_files_get_the_minimum_timeout(self, tmp_path):
+        """Test that tiny clips do not wait for the fixed deep timeout"""
+        client = _make_client(tmp_path / "ffmpeg", min_adaptive_timeout=30)
+        video = VideoFile(path=tmp_path / "clip.mp4", duration=5, video_codec="h264")
+
+        assert client._deep_timeout(video) == 30
+
+    def test_fixed_timeout_without_duration_or_when_disabled(self, tmp_path, video_file):
+        """Test the fallback to deep_timeout"""
+        client = _make_client(tmp_path / "ffmpeg", deep_timeout=1800)
+        assert client._deep_timeout(video_file) == 1800
+
+        client = _make_client(tmp_path / "ffmpeg", deep_timeout=1800, adaptive_timeouts=False)
+        video_file.duration = 10
+        assert client._deep_timeout(video_file) == 1800
+
+    def test_deep_scan_probes_stream_and_learns_speed(self, tmp_path, video_file):
+        """Test that the probed stream drives the timeout and clean runs are measured"""
+        stub = _make_stub_ffmpeg(tmp_path, f"{self.PROBE}\nsleep 1.1; exit 0")
+        client = _make_client(stub)
+
+        with patch.object(client, "_run", wraps=client._run) as run:
+            result = client.inspect_deep(video_file)
+
+        assert not result.is_corrupt
+        assert (video_file.video_codec, video_file.width, video_file.height) == ("hevc", 3840, 2160)
+        assert run.call_args.args[1] == client._deep_timeout(video_file)
+        [(work, wall)] = client.decode_speed.take_unsaved()
+        assert work == 3600 * 8
+        assert wall >= 1.0
+
+    def test_corrupt_run_is_not_measured(self, tmp_path, video_file):
+        """Test that aborted decodes do not count as decode speed samples"""
+        stub = _make_stub_ffmpeg(
+            tmp_path, f'{self.PROBE}\necho "invalid nal unit size" >&2; sleep 1.1; exit 1'
+        )
+        client = _make_client(stub)
+
+        result = asyncio.run(client.inspect_deep_async(video_file))
+
+        assert result.is_corrupt
+        assert client.decode_speed.take_unsaved() == []
+
+
+class TestFFmpegClientStallWatchdog:
+    """Test stopping deep and full scans that stop making progress"""
+
+    STALL = 'echo "out_time_us=500000"; exec sleep 10'
+    STEADY = 'for i in 1 2 3 4 5 6; do echo "out_time_us=${i}00000"; sleep 0.3; done; exit 0'
+
+    def test_command_reports_progress_on_stdout(self, tmp_path, video_file):
+        """Test that whole-file decodes write -progress output"""
+        client = _make_client(tmp_path / "ffmpeg")
+
+        cmd = client._build_deep_scan_command(video_file)
+
+        assert cmd[cmd.index("-progress") + 1] == "pipe:1"
+        assert "-nostats" in cmd
+
+    def test_stalled_deep_scan_is_killed(self, tmp_path, video_file):
+        """Test that a hung FFmpeg is stopped long before the deep timeout"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STALL), stall_timeout=1)
+
+        start = time.monotonic()
+        result = client.inspect_deep(video_file, timeout=60)
+
+        assert time.monotonic() - start < 5
+        assert result.stalled
+        assert not result.is_corrupt
+        assert result.status == "STALLED"
+        assert "at 0.5s" in result.error_message
+
+    def test_stalled_full_scan_async_is_killed(self, tmp_path, video_file):
+        """Test that the watchdog also guards full scans, which have no timeout"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STALL), stall_timeout=1)
+
+        start = time.monotonic()
+        result = asyncio.run(client.inspect_full_async(video_file))
+
+        assert time.monotonic() - start < 5
+        assert result.stalled
+        assert result.scan_mode == ScanMode.FULL
+
+    def test_steady_progress_is_not_a_stall(self, tmp_path, video_file):
+        """Test that a decode advancing more often than the stall window completes"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STEADY), stall_timeout=1)
+        positions: list[float] = []
+        client.progress_listener = lambda _video_file, position: positions.append(position)
+
+        result = client.inspect_deep(video_file, timeout=60)
+
+        assert not result.stalled
+        assert not result.error_message
+        assert positions == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+
+    def test_watchdog_disabled(self, tmp_path, video_file):
+        """Test that a stall timeout of 0 leaves only the overall timeout"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STALL), stall_timeout=0)
+
+        result = asyncio.run(client.inspect_deep_async(video_file, timeout=1))
+
+        assert not result.stalled
+        assert result.error_message == "Deep scan timed out"
+
+
+class TestFFmpegClientSegmentedDecode:
+    """Test decoding long files in concurrent time segments"""
+
+    STUB = (
+        'echo "$*" >> "$(dirname "$0")/args"\n'
+        'case "$*" in *"-ss 60.000"*) echo "out_time_us=5000000"; sleep 0.5; '
+        'echo "invalid nal unit size" >&2; exit 1;; esac\n'
+        "exit 0"
+    )
+
+    def test_plan_splits_long_files_only(self, tmp_path):
+        """Test that segments are at least min_segment_seconds long"""
+        client = _make_client(tmp_path / "ffmpeg", deep_segments=4, min_segment_seconds=600)
+
+        assert client._segment_plan(VideoFile(path="a.mkv", duration=2400)) == [
+            (0.0, 600.0),
+            (600.0, 600.0),
+            (1200.0, 600.0),
+            (1800.0, None),
+        ]
+        assert client._segment_plan(VideoFile(path="a.mkv", duration=1000)) == [(0.0, None)]
+        assert client._segment_plan(VideoFile(path="a.mkv")) == [(0.0, None)]
+
+    def test_segment_command_seeks_before_input(self, tmp_path, video_file):
+        """Test that segments seek on the input and run into the next one"""
+        client = _make_client(tmp_path / "ffmpeg")
+
+        first = client._build_segment_command(video_file, 0.0, 600.0)
+        middle = client._build_segment_command(video_file, 600.0, 600.0)
+        last = client._build_segment_command(video_file, 1200.0, None)
+
+        assert "-ss" not in first
+        assert middle[middle.index("-ss") : middle.index("-i")] == [
+            "-ss",
+            "600.000",
+            "-t",
+            "605.000",
+        ]
+        assert "-t" not in last
+        # Every segment decodes the same streams as a single decode
+        assert "-map" not in first + middle + last
+
+    def test_segmented_deep_scan_merges_findings(self, tmp_path, video_file):
+        """Test that corruption in one segment decides the verdict and is timed in the file"""
+        client = _make_client(
+            _make_stub_ffmpeg(tmp_path, self.STUB), deep_segments=3, min_segment_seconds=60
+        )
+        video_file.duration = 180.0
+
+        result = client.inspect_deep(video_file, timeout=30)
+
+        assert result.is_corrupt
+        assert result.scan_mode == ScanMode.DEEP
+        assert result.error_timestamps == [(65.0, "invalid nal unit size")]
+        assert len((tmp_path / "args").read_text().splitlines()) == 3
+
+    @pytest.mark.parametrize("segments", [1, 3])
+    def test_clean_file_verdict_does_not_depend_on_segments(self, tmp_path, video_file, segments):
+        """Test that lead-in errors of a seeked segment the previous one covered are dropped"""
+        client = _make_client(
+            _make_stub_ffmpeg(
+                tmp_path,
+                'case "$*" in *"-ss "*) echo "Missing reference picture" >&2; sleep 0.3;; esac\n'
+                'echo "out_time_us=0"\n'
+                'case "$*" in *"-t 65.000"*) echo "out_time_us=65000000";; esac\n'
+                "exit 0",
+            ),
+            deep_segments=segments,
+            min_segment_seconds=60,
+        )
+        video_file.duration = 180.0
+
+        result = client.inspect_deep(video_file, timeout=30)
+
+        assert not result.is_corrupt
+        assert result.error_timestamps == []
+
+    @pytest.mark.parametrize("segments", [1, 3])
+    def test_late_audio_corruption_found_with_any_segments(self, tmp_path, video_file, segments):
+        """Test that a late error in a non-video stream gives the same verdict when split"""
+        error = "Error while decoding stream #0:1: Invalid data found when processing input"
+        client = _make_client(
+            _make_stub_ffmpeg(
+                tmp_path,
+                'case "$*" in\n'
+                '  *"-map 0:v"*|*"-ss 60.000"*|*"-t 65.000"*) ;;\n'
+                f'  *"-ss 120.000"*) echo "out_time_us=30000000"; sleep 0.3; echo "{error}" >&2;;\n'
+                f'  *) echo "out_time_us=150000000"; sleep 0.3; echo "{error}" >&2;;\n'
+                "esac",
+            ),
+            deep_segments=segments,
+            min_segment_seconds=60,
+        )
+        video_file.duration = 180.0
+
+        result = client.inspect_deep(video_file, timeout=30)
+
+        assert result.is_corrupt
+        assert result.error_timestamps == [(150.0, error)]
+
+    def test_segment_failing_before_its_first_frame_counts(self, tmp_path, video_file):
+        """Test that lines logged by a seeked segment that never writes a frame are kept"""
+        client = _make_client(
+            _make_stub_ffmpeg(
+                tmp_path,
+                'case "$*" in *"-ss 60.000"*) echo "decode_slice_header error" >&2; exit 0;; esac\n'
+                'case "$*" in *"-t 65.000"*) echo "out_time_us=65000000";; esac\n'
+                "exit 0",
+            ),
+            deep_segments=3,
+            min_segment_seconds=60,
+        )
+        video_file.duration = 180.0
+
+        result = client.inspect_deep(video_file, timeout=30)
+
+        assert result.is_corrupt
+        assert result.error_timestamps == [(60.0, "decode_slice_header error")]
+
+    def test_segmented_full_scan_async_clean_file(self, tmp_path, video_file):
+        """Test that clean segments give a healthy verdict"""
+        client = _make_client(
+            _make_stub_ffmpeg(tmp_path, 'echo "$*" >> "$(dirname "$0")/args"; exit 0'),
+            deep_segments=2,
+            min_segment_seconds=60,
+        )
+        video_file.duration = 180.0
+
+        result = asyncio.run(client.inspect_full_async(video_file))
+
+        assert not result.is_corrupt
+        assert result.scan_mode == ScanMode.FULL
+        assert "-ss 90.000 -i" in (tmp_path / "args").read_text()
+
+
+class TestFFmpegClientKeyframeScan:
+    """Test keyframe-only triage scans"""
+
+    def test_command_skips_non_keyframes_of_video_stream(self, tmp_path, video_file):
+        """Test that the decoder option precedes the input and only video is mapped"""
+        client = _make_client(tmp_path / "ffmpeg")
+
+        cmd = client._build_keyframe_scan_command(video_file)
+
+        assert cmd.index("-skip_frame") < cmd.index("-i")
+        assert cmd[cmd.index("-skip_frame") + 1] == "nokey"
+        assert cmd[cmd.index("-map") + 1] == "0:v:0?"
+
+    def test_inspect_keyframe_flags_corruption(self, tmp_path, video_file):
+        """Test that corruption found on a keyframe is reported in KEYFRAME mode"""
+        stub = _make_stub_ffmpeg(tmp_path, 'echo "invalid nal unit size" >&2; exit 1')
+        client = _make_client(stub)
+
+        result = client.inspect_keyframe(video_file)
+
+        assert result.is_corrupt
+        assert result.scan_mode == ScanMode.KEYFRAME
+        assert not result.deep_scan_completed
+
+    def test_inspect_keyframe_async_timeout_needs_deep_scan(self, tmp_path, video_file):
+        """Test that a keyframe timeout defers the verdict to a deep scan"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, "exec sleep 10"), keyframe_timeout=1)
+
+        result = asyncio.run(client.inspect_keyframe_async(video_file))
+
+        assert result.needs_deep_scan
+        assert result.scan_mode == ScanMode.KEYFRAME
+
+
+class TestFFmpegClientBitstreamScan:
+    """Test packet-level scans that copy streams without decoding"""
+
+    def test_command_copies_packets_with_strict_checks(self, tmp_path, video_file):
+        """Test that packets are copied to the null muxer with error detection on input"""
+        client = _make_client(tmp_path / "ffmpeg")
+
+        cmd = client._build_bitstream_scan_command(video_file)
+
+        assert cmd.index("-err_detect") < cmd.index("-i")
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert cmd[-3:] == ["-f", "null", "-"]
+
+    def test_inspect_bitstream_reports_malformed_packets(self, tmp_path, video_file):
+        """Test that demuxer errors feed the corruption detector"""
+        stub = _make_stub_ffmpeg(
+            tmp_path, 'echo "Invalid data found when processing input" >&2; exit 1'
+        )
+        client = _make_client(stub)
+
+        result = client.inspect_bitstream(video_file)
+
+        assert result.is_corrupt
+        assert result.scan_mode == ScanMode.BITSTREAM
+
+    def test_inspect_bitstream_async_clean_file(self, tmp_path, video_file):
+        """Test that a clean async run yields a healthy result"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, "exit 0"))
+
+        result = asyncio.run(client.inspect_bitstream_async(video_file))
+
+        assert not result.is_corrupt
+        assert not result.needs_deep_scan
+        assert result.scan_mode == ScanMode.BITSTREAM
+
+
+class TestFFmpegClientProbeScan:
+    """Test container structure scans using ffprobe packet metadata"""
+
+    TRUNCATED_OUTPUT = "\n".join(
+        [
+            *(
+                f"packet|stream_index=0|pts_time={i}.0|dts_time={i}.0|duration_time=1.0|flags=K_"
+                for i in range(10)
+            ),
+            "stream|index=0|codec_type=video",
+            "format|nb_streams=1|start_time=0.000000|duration=60.000000",
+        ]
+    )
+
+    def _make_stub_ffprobe(self, directory: Path, output: str) -> Path:
+        (directory / "probe_output").write_text(output + "\n")
+        script = directory / "ffprobe"
+        script.write_text(f'#!/bin/sh\ncat "{directory / "probe_output"}"\n')
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        return directory / "ffmpeg"
+
+    def test_inspect_probe_detects_truncation(self, tmp_path, video_file):
+        """Test that ffprobe output is streamed through the structure analyzer"""
+        client = _make_client(self._make_stub_ffprobe(tmp_path, self.TRUNCATED_OUTPUT))
+
+        result = client.inspect_probe(video_file)
+
+        assert result.is_corrupt
+        assert result.scan_mode == ScanMode.PROBE
+        assert "truncated" in result.error_message
+
+    def test_inspect_probe_async_matches_sync(self, tmp_path, video_file):
+        """Test that the async probe reaches the same verdict"""
+        client = _make_client(self._make_stub_ffprobe(tmp_path, self.TRUNCATED_OUTPUT))
+
+        result = asyncio.run(client.inspect_probe_async(video_file))
+
+        assert result.is_corrupt
+        assert "truncated" in result.error_message
+
+    def test_inspect_probe_timeout_needs_deep_scan(self, tmp_path, video_file):
+        """Test that a hanging ffprobe is killed and deferred to a deep scan"""
+        script = tmp_path / "ffprobe"
+        script.write_text("#!/bin/sh\nexec sleep 10\n")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+        client = _make_client(tmp_path / "ffmpeg", probe_timeout=1)
+
+        start = time.monotonic()
+        result = client.inspect_probe(video_file)
+
+        assert time.monotonic() - start < 5
+        assert result.needs_deep_scan
+        assert "timed out" in result.error_message
+
+
+class TestFFmpegClientEarlyAbort:
+    """Test stopping FFmpeg on the first definitive corruption"""
+
+    STUB = 'echo "moov atom not found" >&2; exec sleep 10'
+
+    def test_inspect_deep_stops_on_corruption(self, tmp_path, video_file):
+        """Test that a deep scan returns as soon as corruption is certain"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STUB))
+
+        start = time.monotonic()
+        result = client.inspect_deep(video_file)
+
+        assert time.monotonic() - start < 5
+        assert result.is_corrupt
+        assert "moov atom not found" in result.ffmpeg_output
+
+    def test_inspect_deep_async_stops_on_corruption(self, tmp_path, video_file):
+        """Test that async inspection aborts early as well"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STUB))
+
+        start = time.monotonic()
+        result = asyncio.run(client.inspect_deep_async(video_file))
+
+        assert time.monotonic() - start < 5
+        assert result.is_corrupt
+
+    def test_early_abort_disabled_runs_to_timeout(self, tmp_path, video_file):
+        """Test that disabling early abort lets FFmpeg keep running"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, self.STUB), early_abort=False)
+
+        result = client.inspect_deep(video_file, timeout=1)
+
+        assert result.error_message == "Deep scan timed out"
+
+    def test_inspect_quick_timeout_needs_deep_scan(self, tmp_path, video_file):
+        """Test that a sync quick timeout kills ffmpeg and asks for a deep scan"""
+        client = _make_client(_make_stub_ffmpeg(tmp_path, "exec sleep 10"), quick_timeout=1)
+
+        start = time.monotonic()
+        result = client.inspect_quick(video_file)
+
+        assert time.monotonic() - start < 5
+        assert result.needs_deep_scan
+        assert "timed out" in result.error_message
+
+
+class TestFFmpegClientPriority:
+    """Test launching FFmpeg at a lower CPU and I/O priority"""
+
+    def test_default_priority_launches_command_as_is(self, tmp_path):
+        """Test that no wrapper is added unless a priority is configured"""
+        client = _make_client(tmp_path / "ffmpeg")
+        cmd = ["ffmpeg", "-i", "movie.mp4"]
+
+        assert client._launch_command(cmd) is cmd
+
+    @pytest.mark.skipif(
+        shutil.which("nice") is None or shutil.which("ionice") is None,
+        reason="nice and ionice are required",
+    )
+    def test_wraps_command_in_ionice_and_nice(self, tmp_path):
+        """Test that the configured classes are passed to ionice and nice"""
+        client = _make_client(
+            tmp_path / "ffmpeg", nice=10, ionice_class="best-effort", ionice_level=5
+        )
+
+        cmd = client._launch_command(["ffmpeg"])
+
+        assert cmd == [
+            shutil.which("ionice"),
+            "-c",
+            "2",
+            "-n",
+            "5",
+            shutil.which("nice"),
+            "-n",
+            "10",
+            "ffmpeg",
+        ]
+
+    @pytest.mark.skipif(shutil.which("nice") is None, reason="nice is required")
+    def test_ffmpeg_runs_at_configured_niceness(self, tmp_path, video_file):
+        """Test that the launched process itself runs at the lower priority"""
+        niceness = tmp_path / "niceness"
+        client = _make_client(_make_stub_ffmpeg(tmp_path, f'nice > "{niceness}"'), nice=10)
+
+        client.inspect_deep(video_file)
+
+        assert int(niceness.read_text()) == min(19, os.nice(0) + 10)
+
+
+class TestFFmpegClientAsync:
+    """Test asyncio-based inspection methods"""
+
+    def test_inspect_deep_async_reports_corruption(self, tmp_path, video_file):
+        """Test async deep inspection matches the sync verdict"""
+        stub = _make_stub_ffmpeg(tmp_path, 'echo "invalid nal unit size" >&2; exit 1')
+        client = _make_client(stub)
+
+        result = asyncio.run(client.inspect_deep_async(video_file))
+
+        assert result.is_corrupt
+        assert result.scan_mode == ScanMode.DEEP
+
+    def test_inspect_full_async_marks_full_mode(self, tmp_path, video_file):
+        """Test async full inspection records FULL mode"""
+        stub = _make_stub_ffmpeg(tmp_path, "exit 0")
+        client = _make_client(stub)
+
+        result = asyncio.run(client.inspect_full_async(video_file))
+
+        assert not result.is_corrupt
+        assert result.scan_mode == ScanMode.FULL
+
+    def test_inspect_quick_async_timeout_needs_deep_scan(self, tmp_path, video_file):
+        """Test that a quick timeout kills ffmpeg and asks for a deep scan"""
+        stub = _make_stub_ffmpeg(tmp_path, "exec sleep 10")
+        client = _make_client(stub, quick_timeout=1)
+
+        start = time.monotonic()
+        result = asyncio.run(client.inspect_quick_async(video_file))
+
+        assert time.monotonic() - start < 5
+        assert result.needs_deep_scan
+        assert "timed out" in result.error_message
+
+    def test_inspect_deep_async_timeout(self, tmp_path, video_file):
+        """Test that a deep timeout is reported without marking the file corrupt"""
+        stub = _make_stub_ffmpeg(tmp_path, "exec sleep 10")
+        client = _make_client(stub)
+
+        result = asyncio.run(client.inspect_deep_async(video_file, timeout=1))
+
+        assert not result.is_corrupt
+        assert result.error_message == "Deep scan timed out"
+
+    def test_async_inspections_do_not_block_event_loop(self, tmp_path, video_file):
+        """Test that several inspections overlap on one event loop"""
+        stub = _make_stub_ffmpeg(tmp_path, "sleep 0.5; exit 0")
+        client = _make_client(stub)
+
+        async def run_many():
+            return await asyncio.gather(*(client.inspect_deep_async(video_file) for _ in range(4)))
+
+        start = time.monotonic()
+        results = asyncio.run(run_many())
+
+        assert len(results) == 4
+        assert time.monotonic() - start < 1.5
@@ -0,0 +1,96 @@
+"""
+Unit tests for the parallel directory walker.
+"""
+
+import pytest
+
+from src.core.file_walker import VideoFileWalker
+
+pytestmark = pytest.mark.unit
+
+EXTENSIONS = [".mp4", ".MKV"]
+
+
+@pytest.fixture
+def library(tmp_path):
+    """Create a small library with nested, hidden and excluded directories."""
+    for rel in (
+        "a.mp4",
+        "b.MP4",
+        "notes.txt",
+        "show/s01/e01.mkv",
+        "show/s01/e02.mkv",
+        "show/extras/poster.jpg",
+        ".hidden/secret.mp4",
+        "@eaDir/thumb.mp4",
+        "movie.trickplay/tile.mp4",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return tmp_path
+
+
+def _names(walker, root):
+    return sorted(p.relative_to(root).as_posix() for p in walker.walk(root))
+
+
+class TestVideoFileWalker:
+    """Test VideoFileWalker class"""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_recursive_walk_prunes_hidden_and_excluded(self, library, max_workers):
+        """Test that matching files are found and pruned directories skipped"""
+        walker = VideoFileWalker(
+            EXTENSIONS, exclude_dirs=["@eaDir", "*.trickplay"], max_workers=max_workers
+        )
+
+        assert _names(walker, library) == [
+            "a.mp4",
+            "b.MP4",
+            "show/s01/e01.mkv",
+            "show/s01/e02.mkv",
+        ]
+
+    def test_non_recursive_walk(self, library):
+        """Test that only the top level is listed without recursion"""
+        walker = VideoFileWalker(EXTENSIONS, recursive=False)
+
+        assert _names(walker, library) == ["a.mp4", "b.MP4"]
+
+    def test_hidden_directories_included_when_not_skipped(self, library):
+        """Test that hidden pruning can be turned off"""
+        walker = VideoFileWalker(EXTENSIONS, skip_hidden=False)
+
+        assert ".hidden/secret.mp4" in _names(walker, library)
+
+    def test_symlinked_directory_not_followed(self, library, tmp_path_factory):
+        """Test that directory symlinks are not descended into"""
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "elsewhere.mp4").touch()
+        (library / "link").symlink_to(outside, target_is_directory=True)
+
+        names = _names(VideoFileWalker(EXTENSIONS), library)
+
+        assert not any(name.startswith("link/") for name in names)
+
+    def test_missing_directory_yields_nothing(self, tmp_path):
+        """Test that a missing root is treated as empty"""
+        assert list(VideoFileWalker(EXTENSIONS).walk(tmp_path / "missing")) == []
+
+    def test_count(self, library):
+        """Test counting matching files"""
+        assert VideoFileWalker(EXTENSIONS, exclude_dirs=["@eaDir"]).count(library) == 5
+
+    def test_consumer_can_stop_early(self, tmp_path):
+        """Test that abandoning the walk shuts down the thread pool cleanly"""
+        for i in range(20):
+            sub = tmp_path / f"dir{i}"
+            sub.mkdir()
+            (sub / "video.mp4").touch()
+
+        walk = VideoFileWalker(EXTENSIONS).walk(tmp_path)
+        first = next(walk)
+        walk.close()
+
+        assert first.name == "video.mp4"
@@ -10,6 +10,9 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.cli.handlers import ListHandler, ScanHandler, TraktHandler, UtilityHandler
+from src.config.config import DatabaseConfig
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanMode, ScanResult, ScanSummary
 
 pytestmark = pytest.mark.unit
 
@@ -33,11 +36,63 @@ class TestScanHandler(unittest.TestCase):
         # Mock config
         mock_config = Mock()
         mock_config.output.default_output_dir = self.temp_path / "output"
+        mock_config.database = DatabaseConfig(path=self.temp_path / "scans.db")
 
         with patch("src.cli.handlers.VideoScanner"):
             handler = ScanHandler(mock_config)
             assert handler.config == mock_config
 
+    def _make_handler(self, results):
+        """Create a scan handler whose scanner reports the given results."""
+        mock_config = Mock()
+        mock_config.output.default_output_dir = self.temp_path / "output"
+        mock_config.database = DatabaseConfig(path=self.temp_path / "scans.db")
+        mock_config.logging.level = "QUIET"
+
+        def scan_directory(**kwargs):
+            for result in results:
+                kwargs["result_callback"](result)
+            return ScanSummary(
+                directory=self.temp_path,
+                total_files=len(results),
+                processed_files=len(results),
+                corrupt_files=0,
+                healthy_files=len(results),
+                scan_mode=ScanMode.QUICK,
+                scan_time=0.0,
+            )
+
+        with patch("src.cli.handlers.VideoScanner"):
+            handler = ScanHandler(mock_config)
+        handler.scanner.scan_directory.side_effect = scan_directory
+        handler.output_formatter = Mock()
+        handler.output_formatter.begin_scan.return_value = 7
+        return handler
+
+    def test_empty_scan_leaves_no_scan_record(self):
+        """Test that the scan record is only created once a file was inspected"""
+        handler = self._make_handler([])
+
+        assert handler.run_scan(self.temp_path, ScanMode.QUICK) is None
+        handler.output_formatter.begin_scan.assert_not_called()
+        handler.output_formatter.store_scan_results.assert_not_called()
+
+    def test_scan_record_opened_with_first_result(self):
+        """Test that results stream into one scan record that is then finalized"""
+        results = [
+            ScanResult(video_file=VideoFile(path=self.temp_path / f"v{i}.mp4")) for i in range(2)
+        ]
+        handler = self._make_handler(results)
+        sink = handler.output_formatter.create_result_sink.return_value
+
+        summary = handler.run_scan(self.temp_path, ScanMode.QUICK)
+
+        assert summary is not None
+        handler.output_formatter.begin_scan.assert_called_once_with(self.temp_path, ScanMode.QUICK)
+        assert sink.add.call_count == 2
+        sink.close.assert_called_once()
+        assert handler.output_formatter.store_scan_results.call_args.kwargs["scan_id"] == 7
+
 
 class TestListHandler(unittest.TestCase):
     """Test ListHandler class"""
@@ -50,6 +105,7 @@ class TestListHandler(unittest.TestCase):
         # Mock config
         self.mock_config = Mock()
         self.mock_config.output.default_output_dir = self.temp_path / "output"
+        self.mock_config.database = DatabaseConfig(path=self.temp_path / "scans.db")
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -74,6 +130,7 @@ class TestUtilityHandler(unittest.TestCase):
         # Mock config
         self.mock_config = Mock()
         self.mock_config.output.default_output_dir = self.temp_path / "output"
+        self.mock_config.database = DatabaseConfig(path=self.temp_path / "scans.db")
 
     def tearDown(self):
         """Clean up test fixtures"""
@@ -106,6 +163,7 @@ class TestTraktHandler(unittest.TestCase):
         # Mock config
         mock_config = Mock()
         mock_config.output.default_output_dir = self.temp_path / "output"
+        mock_config.database = DatabaseConfig(path=self.temp_path / "scans.db")
         mock_config.trakt.client_id = "test_id"
         mock_config.trakt.client_secret = "test_secret"
 
@@ -120,6 +178,7 @@ class TestHandlerErrorHandling(unittest.TestCase):
         """Test base handler error handling"""
         mock_config = Mock()
         mock_config.output.default_output_dir = Path("/tmp")
+        mock_config.database = DatabaseConfig(path=Path(tempfile.mkdtemp()) / "scans.db")
 
         with patch("src.cli.handlers.VideoScanner"):
             handler = ScanHandler(mock_config)
@@ -0,0 +1,122 @@
+"""
+Unit tests for container structure validation from ffprobe packet metadata.
+"""
+
+import pytest
+
+from src.ffmpeg.corruption_detector import CorruptionAnalysis
+from src.ffmpeg.packet_probe import PacketStructureAnalyzer
+
+pytestmark = pytest.mark.unit
+
+STREAMS = [
+    "stream|index=0|codec_type=video",
+    "stream|index=1|codec_type=audio",
+]
+
+
+def _packet(stream: int, t: float, dts: float | None = None, key: bool = False) -> str:
+    flags = "K__" if key else "___"
+    dts_time = t if dts is None else dts
+    return (
+        f"packet|stream_index={stream}|pts_time={t:.6f}|dts_time={dts_time:.6f}"
+        f"|duration_time=0.040000|flags={flags}"
+    )
+
+
+def _clean_packets(seconds: int = 20) -> list[str]:
+    lines = []
+    for i in range(seconds * 25):
+        t = i * 0.04
+        lines.append(_packet(0, t, key=i % 50 == 0))
+        lines.append(_packet(1, t, key=True))
+    return lines
+
+
+def _analyze(lines: list[str]) -> CorruptionAnalysis:
+    analyzer = PacketStructureAnalyzer()
+    for line in lines:
+        analyzer.feed_line(line + "\n")
+    return analyzer.analyze(CorruptionAnalysis(confidence=0.9))
+
+
+def _format(duration: float = 20.0, nb_streams: int = 2) -> str:
+    return f"format|nb_streams={nb_streams}|start_time=0.000000|duration={duration:.6f}"
+
+
+class TestPacketStructureAnalyzer:
+    """Test structural checks on packet metadata"""
+
+    def test_clean_structure(self):
+        """Test that a well-formed file yields no findings"""
+        analysis = _analyze(_clean_packets() + STREAMS + [_format()])
+
+        assert not analysis.is_corrupt
+        assert not analysis.needs_deep_scan
+        assert analysis.detected_issues == []
+
+    def test_truncation_is_corruption(self):
+        """Test that packets ending well before the declared duration mean truncation"""
+        analysis = _analyze(_clean_packets(seconds=12) + STREAMS + [_format(duration=20.0)])
+
+        assert analysis.is_corrupt
+        assert "truncated" in analysis.error_message
+
+    def test_small_duration_shortfall_tolerated(self):
+        """Test that rounding between declared and packet duration is not flagged"""
+        analysis = _analyze(_clean_packets(seconds=20) + STREAMS + [_format(duration=21.0)])
+
+        assert not analysis.is_corrupt
+
+    def test_dts_regression_needs_deep_scan(self):
+        """Test that DTS going backwards flags the file for a deep scan"""
+        lines = _clean_packets()
+        lines.insert(100, _packet(0, 1.0, dts=0.2))
+
+        analysis = _analyze(lines + STREAMS + [_format()])
+
+        assert not analysis.is_corrupt
+        assert analysis.needs_deep_scan
+        assert "non-monotonic dts in stream 0" in analysis.error_message
+
+    def test_video_without_keyframes_reports_missing_index(self):
+        """Test that a video stream without keyframes is reported as unindexed"""
+        lines = [_packet(0, i * 0.04) for i in range(500)]
+
+        analysis = _analyze([*lines, STREAMS[0], _format(nb_streams=1)])
+
+        assert analysis.needs_deep_scan
+        assert any("missing index" in issue for issue in analysis.detected_issues)
+
+    def test_stream_sanity(self):
+        """Test that missing streams, empty A/V streams and stray packets are corruption"""
+        assert _analyze([_format(duration=0, nb_streams=0)]).is_corrupt
+
+        empty_audio = _analyze([_packet(0, 0.0, key=True), *STREAMS, _format(duration=0)])
+        assert empty_audio.is_corrupt
+        assert "audio stream 1 has no packets" in empty_audio.error_message
+
+        stray = _analyze([*_clean_packets(), _packet(5, 1.0), *STREAMS, _format()])
+        assert "packets for undeclared stream 5" in stray.detected_issues
+
+    def test_empty_subtitle_stream_is_allowed(self):
+        """Test that an empty subtitle track is not treated as damage"""
+        lines = [*_clean_packets(), *STREAMS, "stream|index=2|codec_type=subtitle"]
+
+        analysis = _analyze([*lines, _format(nb_streams=3)])
+
+        assert not analysis.is_corrupt
+
+    def test_probe_errors_are_kept(self):
+        """Test that findings from ffprobe's own output survive the structural checks"""
+        analyzer = PacketStructureAnalyzer()
+        for line in [*_clean_packets(), *STREAMS, _format()]:
+            analyzer.feed_line(line)
+        base = CorruptionAnalysis(
+            is_corrupt=True, confidence=0.9, detected_issues=["invalid data found"]
+        )
+
+        analysis = analyzer.analyze(base)
+
+        assert analysis.is_corrupt
+        assert analysis.detected_issues == ["invalid data found"]
@@ -0,0 +1,110 @@
+"""
+Unit tests for the pre-filter ruling out files before FFmpeg runs.
+"""
+
+import os
+
+import pytest
+
+from src.core.models.scanning import IssueCode
+from src.core.prefilter import FilePrefilter
+
+pytestmark = pytest.mark.unit
+
+MKV_HEAD = b"\x1a\x45\xdf\xa3" + bytes(60)
+MP4_HEAD = (32).to_bytes(4, "big") + b"ftypisom" + bytes(20)
+
+
+def _check(tmp_path, name: str, data: bytes):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return FilePrefilter().check(path)
+
+
+class TestFilePrefilter:
+    """Test FilePrefilter class"""
+
+    def test_valid_headers_pass(self, tmp_path):
+        """Test that files starting with their container signature pass"""
+        assert _check(tmp_path, "a.mkv", MKV_HEAD) is None
+        assert _check(tmp_path, "b.mp4", MP4_HEAD) is None
+
+    @pytest.mark.parametrize("leading_box", [b"uuid", b"styp", b"sidx", b"moof"])
+    def test_mp4_leading_with_other_top_level_boxes_passes(self, tmp_path, leading_box):
+        """Test that vendor and segmented MP4 exports are not reported as mis-typed"""
+        head = (24).to_bytes(4, "big") + leading_box + bytes(40)
+
+        assert _check(tmp_path, "a.mp4", head) is None
+
+    def test_other_container_than_extension_passes(self, tmp_path):
+        """Test that a misnamed but valid container is left to the decoder"""
+        assert _check(tmp_path, "a.avi", MKV_HEAD) is None
+
+    def test_unknown_extension_passes(self, tmp_path):
+        """Test that files without an expected signature are not judged"""
+        assert _check(tmp_path, "a.vob", b"some proprietary header") is None
+
+    def test_resyncable_streams_pass_with_leading_garbage(self, tmp_path):
+        """Test that MPEG streams are not judged by their first bytes"""
+        assert _check(tmp_path, "a.mpeg", b"\x0a\x89\xed\x7a" + bytes(60)) is None
+
+    def test_empty_file(self, tmp_path):
+        """Test that zero-length files are flagged"""
+        finding = _check(tmp_path, "a.mkv", b"")
+
+        assert finding is not None
+        assert finding.code == IssueCode.EMPTY_FILE
+        assert finding.confidence == 1.0
+
+    def test_html_page_saved_as_video(self, tmp_path):
+        """Test that an HTML error page with a video extension is flagged"""
+        finding = _check(tmp_path, "a.mkv", b"\n  <!DOCTYPE html><html><body>404</body></html>")
+
+        assert finding is not None
+        assert finding.code == IssueCode.TYPE_MISMATCH
+        assert "HTML" in finding.message
+        assert ".mkv" in finding.message
+
+    def test_unrecognized_content(self, tmp_path):
+        """Test that content matching no container is flagged for known extensions"""
+        finding = _check(tmp_path, "a.mp4", b"\xde\xad\xbe\xef" * 100)
+
+        assert finding is not None
+        assert finding.code == IssueCode.TYPE_MISMATCH
+
+    def test_zero_filled_header(self, tmp_path):
+        """Test that a file starting with zeros is flagged"""
+        finding = _check(tmp_path, "a.mkv", bytes(8192) + MKV_HEAD)
+
+        assert finding is not None
+        assert finding.code == IssueCode.ZERO_FILLED
+
+    @pytest.mark.skipif(not hasattr(os, "SEEK_DATA"), reason="SEEK_DATA not supported")
+    def test_sparse_file(self, tmp_path):
+        """Test that a file that is mostly holes is flagged"""
+        path = tmp_path / "a.mkv"
+        with path.open("wb") as f:
+            f.write(MKV_HEAD)
+            f.truncate(64 * 1024 * 1024)
+        with path.open("rb") as f:
+            hole = os.lseek(f.fileno(), 0, os.SEEK_HOLE)
+        if hole >= 64 * 1024 * 1024:
+            pytest.skip("Filesystem does not report holes")
+
+        finding = FilePrefilter().check(path)
+
+        assert finding is not None
+        assert finding.code == IssueCode.SPARSE_FILE
+
+    def test_sparse_threshold(self, tmp_path):
+        """Test that hole detection respects the configured fraction"""
+        path = tmp_path / "a.mkv"
+        with path.open("wb") as f:
+            f.write(MKV_HEAD)
+            f.truncate(64 * 1024 * 1024)
+
+        assert FilePrefilter(max_hole_fraction=1.0).check(path) is None
+
+    def test_missing_file_passes(self, tmp_path):
+        """Test that unreadable files are left to the decoder"""
+        assert FilePrefilter().check(tmp_path / "missing.mkv") is None
@@ -0,0 +1,88 @@
+"""
+Unit tests for the write-behind scan result sink.
+"""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanMode, ScanResult
+from src.database.result_sink import ScanResultSink
+from src.database.service import DatabaseService
+
+pytestmark = pytest.mark.unit
+
+
+def _result(i: int) -> ScanResult:
+    return ScanResult(
+        video_file=VideoFile(path=Path(f"/videos/v{i}.mp4")), scan_mode=ScanMode.QUICK
+    )
+
+
+class TestScanResultSink:
+    """Test batching and flushing of scan results"""
+
+    def test_flushes_full_batches(self):
+        """Test that results are written in batch_size transactions"""
+        db = MagicMock()
+        with ScanResultSink(db, scan_id=7, batch_size=2, flush_interval=60) as sink:
+            for i in range(5):
+                sink.add(_result(i))
+
+        batch_sizes = [len(c.args[1]) for c in db.store_scan_results.call_args_list]
+        assert batch_sizes == [2, 2, 1]
+        assert all(c.args[0] == 7 for c in db.store_scan_results.call_args_list)
+        assert sink.written_count == 5
+
+    def test_flushes_partial_batch_after_interval(self):
+        """Test that a partial batch is written once flush_interval elapses"""
+        db = MagicMock()
+        sink = ScanResultSink(db, scan_id=1, batch_size=100, flush_interval=0.1)
+        try:
+            sink.add(_result(0))
+            deadline = time.monotonic() + 5
+            while not db.store_scan_results.called and time.monotonic() < deadline:
+                time.sleep(0.02)
+            assert db.store_scan_results.called
+        finally:
+            sink.close()
+
+    def test_add_does_not_wait_for_writes(self):
+        """Test that a slow database never blocks the scan loop"""
+        release = threading.Event()
+        db = MagicMock()
+        db.store_scan_results.side_effect = lambda *_args: release.wait(5)
+        sink = ScanResultSink(db, scan_id=1, batch_size=1, flush_interval=60)
+        try:
+            start = time.monotonic()
+            for i in range(50):
+                sink.add(_result(i))
+            assert time.monotonic() - start < 1
+        finally:
+            release.set()
+            sink.close()
+        assert sink.written_count == 50
+
+    def test_write_failure_is_logged_and_writer_continues(self):
+        """Test that a failed batch does not stop later batches"""
+        db = MagicMock()
+        db.store_scan_results.side_effect = [RuntimeError("disk full"), None]
+        with ScanResultSink(db, scan_id=1, batch_size=1, flush_interval=60) as sink:
+            sink.add(_result(0))
+            sink.add(_result(1))
+
+        assert db.store_scan_results.call_count == 2
+        assert sink.written_count == 1
+
+    def test_writes_to_database(self, tmp_path):
+        """Test results end up in the scan_results table"""
+        db = DatabaseService(tmp_path / "scans.db")
+        with ScanResultSink(db, scan_id=1, batch_size=2) as sink:
+            for i in range(3):
+                sink.add(_result(i))
+
+        assert len(db.get_scan_results(1)) == 3
@@ -0,0 +1,99 @@
+"""
+Unit tests for the append-only resume journal.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanMode, ScanResult
+from src.core.resume_journal import ResumeEntry, ResumeJournal
+
+pytestmark = pytest.mark.unit
+
+
+def _result(name: str, **kwargs) -> ScanResult:
+    return ScanResult(video_file=VideoFile(path=Path(f"/videos/{name}")), **kwargs)
+
+
+class TestResumeJournal:
+    """Test ResumeJournal class"""
+
+    def test_load_missing_journal(self, tmp_path):
+        """Test that a missing journal loads as empty"""
+        assert ResumeJournal(tmp_path / "resume.jsonl").load() == {}
+
+    def test_records_round_trip_with_verdicts(self, tmp_path):
+        """Test that recorded verdicts are restored on load"""
+        path = tmp_path / "resume.jsonl"
+        with ResumeJournal(path) as journal:
+            journal.open()
+            journal.record(_result("a.mp4", is_corrupt=True, scan_mode=ScanMode.DEEP))
+            journal.record(_result("b.mp4", needs_deep_scan=True))
+
+        entries = ResumeJournal(path).load()
+
+        assert entries["/videos/a.mp4"] == ResumeEntry(
+            path="/videos/a.mp4", is_corrupt=True, scan_mode="deep"
+        )
+        assert entries["/videos/b.mp4"].needs_deep_scan
+        assert not entries["/videos/b.mp4"].is_corrupt
+
+    def test_records_are_appended(self, tmp_path):
+        """Test that each record adds one line instead of rewriting the file"""
+        path = tmp_path / "resume.jsonl"
+        journal = ResumeJournal(path)
+        journal.open()
+        journal.record(_result("a.mp4"))
+        size_after_first = path.stat().st_size
+        journal.record(_result("b.mp4"))
+        journal.close()
+
+        assert path.stat().st_size == 2 * size_after_first
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_load_compacts_duplicates_and_torn_lines(self, tmp_path):
+        """Test that the last record wins and a crash-torn line is dropped"""
+        path = tmp_path / "resume.jsonl"
+        journal = ResumeJournal(path)
+        journal.open()
+        journal.record(_result("a.mp4", needs_deep_scan=True))
+        journal.record(_result("a.mp4", is_corrupt=True, scan_mode=ScanMode.DEEP))
+        journal.close()
+        with path.open("a") as f:
+            f.write('{"path": "/videos/b.mp')
+
+        entries = ResumeJournal(path).load()
+
+        assert list(entries) == ["/videos/a.mp4"]
+        assert entries["/videos/a.mp4"].is_corrupt
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_open_truncate_discards_previous_records(self, tmp_path):
+        """Test that a fresh scan starts an empty journal"""
+        path = tmp_path / "resume.jsonl"
+        journal = ResumeJournal(path)
+        journal.open()
+        journal.record(_result("a.mp4"))
+        journal.close()
+
+        journal.open(truncate=True)
+        journal.close()
+
+        assert ResumeJournal(path).load() == {}
+
+    def test_record_requires_open_journal(self, tmp_path):
+        """Test that recording before open is an error"""
+        with pytest.raises(RuntimeError, match="not open"):
+            ResumeJournal(tmp_path / "resume.jsonl").record(_result("a.mp4"))
+
+    def test_remove_deletes_journal(self, tmp_path):
+        """Test that remove closes and deletes the file"""
+        path = tmp_path / "resume.jsonl"
+        journal = ResumeJournal(path)
+        journal.open()
+        journal.record(_result("a.mp4"))
+        journal.remove()
+
+        assert not path.exists()
@@ -0,0 +1,404 @@
+"""
+Unit tests for the concurrent scan engine.
+"""
+
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import pytest
+
+from src.core.concurrency import (
+    ConcurrencyController,
+    LoadThrottle,
+    SystemLoad,
+    SystemLoadSampler,
+)
+from src.core.device_limits import DeviceLimits
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanResult
+from src.core.scan_engine import FollowUpStage, ScanEngine
+
+pytestmark = pytest.mark.unit
+
+
+def _video_files(count: int) -> list[VideoFile]:
+    return [VideoFile(path=Path(f"/videos/file{i}.mp4")) for i in range(count)]
+
+
+class _DirectoryDevices(DeviceLimits):
+    """Limits treating each top-level directory as a separate device."""
+
+    def device_of(self, video_file: VideoFile) -> int:
+        return 1 if video_file.path.parts[1] == "nas" else 2
+
+
+class TestScanEngine:
+    """Test ScanEngine class"""
+
+    def test_rejects_invalid_worker_count(self):
+        """Test that at least one worker is required"""
+        with pytest.raises(ValueError, match="max_workers"):
+            ScanEngine(max_workers=0)
+
+    def test_delivers_every_result(self):
+        """Test that each file is inspected exactly once"""
+        engine = ScanEngine(max_workers=4)
+        results: list[ScanResult] = []
+
+        delivered = engine.run(
+            _video_files(20),
+            lambda vf: ScanResult(video_file=vf),
+            results.append,
+        )
+
+        assert delivered == 20
+        assert sorted(str(r.video_file.path) for r in results) == sorted(
+            str(vf.path) for vf in _video_files(20)
+        )
+
+    def test_runs_inspections_concurrently_up_to_limit(self):
+        """Test that inspections overlap but never exceed max_workers"""
+        engine = ScanEngine(max_workers=3)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return ScanResult(video_file=video_file)
+
+        engine.run(_video_files(12), inspect, lambda _result: None)
+
+        assert peak == 3
+
+    def test_results_delivered_on_calling_thread(self):
+        """Test that on_result runs on the thread that called run()"""
+        engine = ScanEngine(max_workers=4)
+        threads: set[int] = set()
+
+        engine.run(
+            _video_files(8),
+            lambda vf: ScanResult(video_file=vf),
+            lambda _result: threads.add(threading.get_ident()),
+        )
+
+        assert threads == {threading.get_ident()}
+
+    def test_stop_prevents_new_dispatch(self):
+        """Test that a stop request keeps pending files from starting"""
+        stop = threading.Event()
+        engine = ScanEngine(max_workers=2, should_stop=stop.is_set)
+        inspected: list[VideoFile] = []
+
+        def on_result(result: ScanResult) -> None:
+            inspected.append(result.video_file)
+            stop.set()
+
+        delivered = engine.run(_video_files(10), lambda vf: ScanResult(video_file=vf), on_result)
+
+        # Work already dispatched finishes, nothing new starts afterwards
+        assert 1 <= delivered <= 2
+        assert len(inspected) == delivered
+
+    def test_failed_inspection_is_skipped(self):
+        """Test that an exception in one inspection does not stop the engine"""
+        engine = ScanEngine(max_workers=2)
+        results: list[ScanResult] = []
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            if video_file.path.name == "file3.mp4":
+                raise RuntimeError("boom")
+            return ScanResult(video_file=video_file)
+
+        delivered = engine.run(_video_files(6), inspect, results.append)
+
+        assert delivered == 5
+        assert all(r.video_file.path.name != "file3.mp4" for r in results)
+
+    def test_starved_input_keeps_delivering_results(self):
+        """Test that a None from the input does not block result delivery"""
+        engine = ScanEngine(max_workers=2, poll_interval=0.01)
+        delivered_before_next_file: list[int] = []
+        results: list[ScanResult] = []
+
+        def source():
+            yield from _video_files(1)
+            # Nothing ready for a while; the first result must still arrive
+            for _ in range(50):
+                if results:
+                    break
+                yield None
+            delivered_before_next_file.append(len(results))
+            yield VideoFile(path=Path("/videos/late.mp4"))
+
+        delivered = engine.run(source(), lambda vf: ScanResult(video_file=vf), results.append)
+
+        assert delivered == 2
+        assert delivered_before_next_file == [1]
+
+    def test_precheck_results_skip_workers(self):
+        """Test that files answered by the precheck are never inspected"""
+        engine = ScanEngine(max_workers=2)
+        inspected: list[str] = []
+        results: list[ScanResult] = []
+
+        def precheck(video_file: VideoFile) -> ScanResult | None:
+            if video_file.path.name in ("file1.mp4", "file4.mp4"):
+                return ScanResult(video_file=video_file, is_corrupt=True)
+            return None
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            inspected.append(video_file.path.name)
+            return ScanResult(video_file=video_file)
+
+        delivered = engine.run(_video_files(5), inspect, results.append, precheck=precheck)
+
+        assert delivered == 5
+        assert sorted(inspected) == ["file0.mp4", "file2.mp4", "file3.mp4"]
+        assert sum(r.is_corrupt for r in results) == 2
+
+    def test_idle_callback_runs_on_calling_thread_during_long_inspections(self):
+        """Test that on_idle fires while an inspection is still running"""
+        engine = ScanEngine(max_workers=1, poll_interval=0.01)
+        idle_threads: list[threading.Thread] = []
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            time.sleep(0.2)
+            return ScanResult(video_file=video_file)
+
+        engine.run(
+            _video_files(1),
+            inspect,
+            lambda result: None,
+            on_idle=lambda: idle_threads.append(threading.current_thread()),
+        )
+
+        assert len(idle_threads) > 3
+        assert set(idle_threads) == {threading.current_thread()}
+
+    def test_follow_up_starts_while_first_stage_is_running(self):
+        """Test that selected files are re-inspected before the first stage finishes"""
+        engine = ScanEngine(max_workers=1)
+        first_stage_done: list[str] = []
+        started_after: list[int] = []
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            time.sleep(0.02)
+            first_stage_done.append(video_file.path.name)
+            return ScanResult(
+                video_file=video_file, needs_deep_scan=video_file.path.name == "file0.mp4"
+            )
+
+        def follow_up_inspect(video_file: VideoFile) -> ScanResult:
+            started_after.append(len(first_stage_done))
+            return ScanResult(video_file=video_file, is_corrupt=True)
+
+        follow_up_results: list[ScanResult] = []
+        stage = FollowUpStage(
+            inspect=follow_up_inspect,
+            on_result=follow_up_results.append,
+            select=lambda result: result.needs_deep_scan,
+        )
+
+        delivered = engine.run(_video_files(6), inspect, lambda _result: None, follow_up=stage)
+
+        assert delivered == 6
+        assert stage.completed == 1
+        assert [r.video_file.path.name for r in follow_up_results] == ["file0.mp4"]
+        assert started_after[0] < 6
+
+    def test_follow_up_runs_seeded_files_within_its_own_budget(self):
+        """Test that pending follow-ups run on their own pool, at most max_workers at once"""
+        engine = ScanEngine(max_workers=1)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def follow_up_inspect(video_file: VideoFile) -> ScanResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return ScanResult(video_file=video_file)
+
+        stage = FollowUpStage(
+            inspect=follow_up_inspect,
+            on_result=lambda _result: None,
+            select=lambda _result: False,
+            max_workers=2,
+            pending=deque(_video_files(6)),
+        )
+
+        delivered = engine.run(
+            [], lambda vf: ScanResult(video_file=vf), lambda _result: None, follow_up=stage
+        )
+
+        assert delivered == 0
+        assert stage.completed == 6
+        assert peak == 2
+
+    def test_follow_up_takes_files_handed_over_by_another_thread(self):
+        """Test that files put on the incoming queue during a run get follow-ups"""
+        engine = ScanEngine(max_workers=1, poll_interval=0.01)
+        inspected: list[str] = []
+        stage = FollowUpStage(
+            inspect=lambda vf: ScanResult(video_file=vf),
+            on_result=lambda result: inspected.append(result.video_file.path.name),
+            select=lambda _result: False,
+        )
+        walker = threading.Thread(
+            target=lambda: [stage.incoming.put(video_file) for video_file in _video_files(20)]
+        )
+
+        def source():
+            walker.start()
+            while walker.is_alive():
+                yield None
+            yield from _video_files(1)
+
+        engine.run(source(), lambda vf: ScanResult(video_file=vf), lambda _r: None, follow_up=stage)
+
+        assert stage.completed == 20
+        assert sorted(inspected) == sorted(vf.path.name for vf in _video_files(20))
+
+    def test_stop_leaves_queued_follow_ups_pending(self):
+        """Test that a stop request keeps unstarted follow-ups in the queue"""
+        stop = threading.Event()
+        engine = ScanEngine(max_workers=1, should_stop=stop.is_set)
+
+        def follow_up_inspect(video_file: VideoFile) -> ScanResult:
+            stop.set()
+            return ScanResult(video_file=video_file)
+
+        stage = FollowUpStage(
+            inspect=follow_up_inspect,
+            on_result=lambda _result: None,
+            select=lambda _result: True,
+            pending=deque(_video_files(3)),
+        )
+
+        engine.run(
+            _video_files(3), lambda vf: ScanResult(video_file=vf), lambda _r: None, follow_up=stage
+        )
+
+        assert stage.completed == 1
+        assert len(stage.pending) >= 2
+
+    def test_device_caps_interleave_work_across_devices(self):
+        """Test that a capped device is not exceeded while other devices keep working"""
+        engine = ScanEngine(max_workers=3, device_limits=_DirectoryDevices(default_cap=1))
+        video_files = [VideoFile(path=Path(f"/nas/file{i}.mp4")) for i in range(4)] + [
+            VideoFile(path=Path(f"/ssd/file{i}.mp4")) for i in range(2)
+        ]
+        lock = threading.Lock()
+        running = {"nas": 0, "ssd": 0}
+        peak = {"nas": 0, "ssd": 0}
+        order: list[str] = []
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            device = video_file.path.parts[1]
+            with lock:
+                order.append(str(video_file.path))
+                running[device] += 1
+                peak[device] = max(peak[device], running[device])
+            time.sleep(0.02)
+            with lock:
+                running[device] -= 1
+            return ScanResult(video_file=video_file)
+
+        delivered = engine.run(video_files, inspect, lambda _result: None)
+
+        assert delivered == 6
+        assert peak == {"nas": 1, "ssd": 1}
+        # Files on the idle device start before the capped device's backlog
+        assert order.index("/ssd/file0.mp4") < order.index("/nas/file1.mp4")
+
+    def test_device_caps_apply_to_follow_up_stage(self):
+        """Test that both stages share the per-device slots"""
+        engine = ScanEngine(max_workers=2, device_limits=_DirectoryDevices(default_cap=1))
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return ScanResult(video_file=video_file, needs_deep_scan=True)
+
+        stage = FollowUpStage(
+            inspect=inspect,
+            on_result=lambda _result: None,
+            select=lambda result: result.needs_deep_scan,
+            max_workers=2,
+        )
+        video_files = [VideoFile(path=Path(f"/nas/file{i}.mp4")) for i in range(3)]
+
+        delivered = engine.run(video_files, inspect, lambda _result: None, follow_up=stage)
+
+        assert delivered == 3
+        assert stage.completed == 3
+        assert peak == 1
+
+    def test_controller_limit_caps_running_inspections(self):
+        """Test that only the controller's limit of inspections run at once"""
+        engine = ScanEngine(max_workers=8, controller=ConcurrencyController(2, 8, window=60.0))
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return ScanResult(video_file=video_file)
+
+        delivered = engine.run(_video_files(8), inspect, lambda _result: None)
+
+        assert delivered == 8
+        assert peak == 2
+
+    def test_throttle_pauses_launches_until_load_drops(self):
+        """Test that no inspection starts while the throttle is paused"""
+
+        class BusyThenIdle(SystemLoadSampler):
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def sample(self) -> SystemLoad:
+                self.calls += 1
+                return SystemLoad(2.0 if self.calls <= 3 else 0.1, None, None)
+
+        sampler = BusyThenIdle()
+        throttle = LoadThrottle(2, max_load_per_cpu=1.0, interval=0, sampler=sampler)
+        throttle.limit = 0
+        engine = ScanEngine(max_workers=2, poll_interval=0.01, throttle=throttle)
+        samples_at_start: list[int] = []
+
+        def inspect(video_file: VideoFile) -> ScanResult:
+            samples_at_start.append(sampler.calls)
+            return ScanResult(video_file=video_file)
+
+        delivered = engine.run(_video_files(4), inspect, lambda _result: None)
+
+        assert delivered == 4
+        assert min(samples_at_start) == 4
@@ -3,6 +3,8 @@ Unit tests for video scanner module.
 """
 
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -10,7 +12,8 @@ from unittest.mock import Mock, patch
 import pytest
 
 from src.core.models.inspection import VideoFile
-from src.core.models.scanning import ScanMode, ScanResult, ScanSummary
+from src.core.models.scanning import IssueCode, ScanMode, ScanOrder, ScanResult, ScanSummary
+from src.core.resume_journal import ResumeJournal
 from src.core.scanner import VideoScanner
 
 pytestmark = pytest.mark.unit
@@ -29,7 +32,35 @@ class TestVideoScanner(unittest.TestCase):
         self.mock_config.output.default_output_dir = self.temp_path / "output"
         self.mock_config.scan.extensions = [".mp4", ".avi", ".mkv"]
         self.mock_config.scan.recursive = True
+        self.mock_config.scan.max_workers = 2
+        self.mock_config.scan.resume_fsync_interval = 0
+        self.mock_config.scan.incremental_max_age_days = 30
+        self.mock_config.scan.discovery_queue_size = 1000
+        self.mock_config.scan.skip_hidden_dirs = True
+        self.mock_config.scan.exclude_dirs = []
+        self.mock_config.scan.discovery_workers = 2
+        self.mock_config.scan.deep_workers = 2
+        self.mock_config.scan.device_workers = {}
+        self.mock_config.scan.default_device_workers = 0
+        self.mock_config.scan.adaptive_workers = False
+        self.mock_config.scan.max_load_per_cpu = 0.0
+        self.mock_config.scan.max_cpu_pressure = 0.0
+        self.mock_config.scan.max_io_pressure = 0.0
+        self.mock_config.scan.load_check_interval = 5.0
+        self.mock_config.scan.prefilter = False
+        self.mock_config.scan.max_hole_fraction = 0.5
+        self.mock_config.scan.structure_check = True
+        self.mock_config.scan.zero_block_min_run = 8
+        self.mock_config.database.path = self.temp_path / "scans.db"
+        self.mock_config.database.auto_cleanup_days = 0
+        self.mock_config.database.cache_size_kib = 2048
+        self.mock_config.database.mmap_size_mb = 0
+        self.mock_config.database.busy_timeout_ms = 5000
+        self.mock_config.database.statement_cache_size = 128
         self.mock_config.ffmpeg.command = Path("/usr/bin/ffmpeg")
+        self.mock_config.ffmpeg.nice = 0
+        self.mock_config.ffmpeg.ionice_class = ""
+        self.mock_config.ffmpeg.ionice_level = 7
         self.mock_config.processing.max_workers = 2
 
     def tearDown(self):
@@ -56,30 +87,6 @@ class TestVideoScanner(unittest.TestCase):
             assert "scan_resume_" in resume_path.name
             assert ".json" in resume_path.name
 
-    def test_save_and_load_resume_state(self):
-        """Test saving and loading resume state"""
-        with patch("src.core.scanner.load_config", return_value=self.mock_config):
-            scanner = VideoScanner()
-            resume_path = self.temp_path / "test_resume.json"
-            processed_files = {"file1.mp4", "file2.avi"}
-
-            # Save state
-            scanner._save_resume_state(resume_path, processed_files)
-            assert resume_path.exists()
-
-            # Load state
-            loaded_files = scanner._load_resume_state(resume_path)
-            assert loaded_files == processed_files
-
-    def test_load_resume_state_nonexistent(self):
-        """Test loading resume state when file doesn't exist"""
-        with patch("src.core.scanner.load_config", return_value=self.mock_config):
-            scanner = VideoScanner()
-            nonexistent_path = self.temp_path / "nonexistent.json"
-
-            loaded_files = scanner._load_resume_state(nonexistent_path)
-            assert loaded_files == set()
-
     def test_find_video_files(self):
         """Test finding video files in directory"""
         # Create test video files
@@ -209,3 +216,488 @@ class TestVideoScanner(unittest.TestCase):
             except (FileNotFoundError, OSError):
                 # Expected error for non-existent directory
                 pass
+
+    def _fake_inspect(self, corrupt_names=(), suspicious_names=()):
+        """Build a fake _inspect_file that classifies files by name."""
+        calls = []
+
+        def inspect(_ffmpeg_client, video_file, scan_mode):
+            calls.append((video_file.path.name, scan_mode))
+            if scan_mode == ScanMode.QUICK and video_file.path.name in suspicious_names:
+                return ScanResult(video_file=video_file, needs_deep_scan=True, scan_mode=scan_mode)
+            is_corrupt = video_file.path.name in corrupt_names
+            return ScanResult(
+                video_file=video_file,
+                is_corrupt=is_corrupt,
+                error_message="moov atom not found" if is_corrupt else "",
+                scan_mode=scan_mode,
+            )
+
+        return inspect, calls
+
+    def test_scan_directory_counts_under_concurrency(self):
+        """Test that progress counts are correct with several workers"""
+        for i in range(10):
+            (self.temp_path / f"video{i}.mp4").touch()
+
+        inspect, calls = self._fake_inspect(corrupt_names={"video1.mp4", "video7.mp4"})
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(self.temp_path, ScanMode.DEEP, resume=False)
+
+        assert len(calls) == 10
+        assert summary.processed_files == 10
+        assert summary.corrupt_files == 2
+        assert summary.healthy_files == 8
+        assert summary.deep_scans_completed == 10
+
+    def test_scan_directory_hybrid_deep_scans_suspicious(self):
+        """Test that HYBRID deep-scans only files flagged by the quick pass"""
+        for i in range(6):
+            (self.temp_path / f"video{i}.mp4").touch()
+
+        inspect, calls = self._fake_inspect(
+            corrupt_names={"video2.mp4"}, suspicious_names={"video2.mp4", "video4.mp4"}
+        )
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(self.temp_path, ScanMode.HYBRID, resume=False)
+
+        deep_calls = sorted(name for name, mode in calls if mode == ScanMode.DEEP)
+        assert deep_calls == ["video2.mp4", "video4.mp4"]
+        assert summary.processed_files == 6
+        assert summary.corrupt_files == 1
+        assert summary.deep_scans_needed == 2
+        assert summary.deep_scans_completed == 2
+
+    def test_scan_directory_reports_each_result(self):
+        """Test that result_callback receives quick and deep results as they complete"""
+        for i in range(4):
+            (self.temp_path / f"video{i}.mp4").touch()
+
+        inspect, _calls = self._fake_inspect(suspicious_names={"video3.mp4"})
+        reported = []
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                scanner.scan_directory(
+                    self.temp_path,
+                    ScanMode.HYBRID,
+                    resume=False,
+                    result_callback=lambda r: reported.append(
+                        (r.video_file.path.name, r.scan_mode)
+                    ),
+                )
+
+        assert len(reported) == 5
+        assert ("video3.mp4", ScanMode.DEEP) in reported
+
+    def test_structurally_broken_files_skip_ffmpeg(self):
+        """Test that files failing the container check are reported without inspection"""
+        ftyp = (16).to_bytes(4, "big") + b"ftypisom" + bytes(4)
+        moov = (8).to_bytes(4, "big") + b"moov"
+        (self.temp_path / "healthy.mp4").write_bytes(ftyp + moov)
+        # mdat declares 1000 bytes of payload but only 10 are present
+        (self.temp_path / "truncated.mp4").write_bytes(
+            ftyp + (1008).to_bytes(4, "big") + b"mdat" + bytes(10)
+        )
+
+        client = Mock()
+        client.inspect_quick.side_effect = lambda video_file: ScanResult(
+            video_file=video_file, scan_mode=ScanMode.QUICK
+        )
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=client),
+                patch.object(scanner, "_precheck_file", return_value=None),
+            ):
+                summary = scanner.scan_directory(self.temp_path, ScanMode.QUICK, resume=False)
+
+        # The structure check runs in the worker, in place of the FFmpeg inspection
+        assert [c.args[0].path.name for c in client.inspect_quick.call_args_list] == ["healthy.mp4"]
+        assert summary.processed_files == 2
+        assert summary.corrupt_files == 1
+
+    def test_prefiltered_files_get_issue_codes_without_inspection(self):
+        """Test that empty and mis-typed files are reported without inspection"""
+        self.mock_config.scan.prefilter = True
+        self.mock_config.scan.structure_check = False
+        (self.temp_path / "empty.mkv").touch()
+        (self.temp_path / "error.mkv").write_bytes(b"<!DOCTYPE html><html>403 Forbidden</html>")
+        (self.temp_path / "video.mkv").write_bytes(b"\x1a\x45\xdf\xa3" + bytes(64))
+
+        inspect, calls = self._fake_inspect()
+        reported = {}
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(
+                    self.temp_path,
+                    ScanMode.QUICK,
+                    resume=False,
+                    result_callback=lambda r: reported.update({r.video_file.path.name: r}),
+                )
+
+        assert [name for name, _mode in calls] == ["video.mkv"]
+        assert reported["empty.mkv"].issue_code == IssueCode.EMPTY_FILE
+        assert reported["error.mkv"].issue_code == IssueCode.TYPE_MISMATCH
+        assert reported["video.mkv"].issue_code is None
+        assert summary.corrupt_files == 2
+
+    def test_keyframe_mode_uses_keyframe_inspection(self):
+        """Test that KEYFRAME scans dispatch to FFmpegClient.inspect_keyframe"""
+        video_file = VideoFile(path=self.temp_path / "video.mp4")
+        client = Mock()
+        client.inspect_keyframe.return_value = ScanResult(
+            video_file=video_file, scan_mode=ScanMode.KEYFRAME
+        )
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            result = scanner._inspect_file(client, video_file, ScanMode.KEYFRAME)
+
+        client.inspect_keyframe.assert_called_once_with(video_file)
+        client.inspect_deep.assert_not_called()
+        assert result.scan_mode == ScanMode.KEYFRAME
+
+    def test_bitstream_mode_without_ffmpeg_needs_deep_scan(self):
+        """Test that a triage mode defers to a deep scan when FFmpeg is missing"""
+        video_file = VideoFile(path=self.temp_path / "video.mp4")
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            result = scanner._inspect_file(None, video_file, ScanMode.BITSTREAM)
+
+        assert result.needs_deep_scan
+        assert result.scan_mode == ScanMode.BITSTREAM
+
+    def test_zeroblock_mode_reports_damaged_ranges(self):
+        """Test that ZEROBLOCK scans report zero-filled regions without FFmpeg"""
+        path = self.temp_path / "video.mkv"
+        data = bytearray(b"\x5a" * (64 * 4096))
+        data[16 * 4096 : 32 * 4096] = bytes(16 * 4096)
+        path.write_bytes(bytes(data))
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            result = scanner._inspect_file(None, VideoFile(path=path), ScanMode.ZEROBLOCK)
+
+        assert result.is_corrupt
+        assert result.issue_code == IssueCode.ZERO_BLOCKS
+        assert result.damaged_ranges == [(16 * 4096, 32 * 4096)]
+        assert "16 zero-filled blocks" in result.error_message
+
+    def test_scan_directory_respects_shutdown(self):
+        """Test that request_shutdown stops dispatching new files"""
+        for i in range(20):
+            (self.temp_path / f"video{i}.mp4").touch()
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+
+            def inspect(_ffmpeg_client, video_file, scan_mode):
+                scanner.request_shutdown()
+                return ScanResult(video_file=video_file, scan_mode=scan_mode)
+
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(self.temp_path, ScanMode.QUICK, resume=False)
+
+        assert summary.processed_files <= self.mock_config.processing.max_workers
+        assert summary.total_files == 20
+
+    def test_interrupted_scan_resumes_with_previous_verdicts(self):
+        """Test that an interrupted scan keeps its journal and restores counts on resume"""
+        for i in range(6):
+            (self.temp_path / f"video{i}.mp4").touch()
+        self.mock_config.processing.max_workers = 1
+        self.mock_config.scan.max_workers = 1
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+
+            def interrupting_inspect(_ffmpeg_client, video_file, scan_mode):
+                scanner.request_shutdown()
+                return ScanResult(video_file=video_file, is_corrupt=True, scan_mode=scan_mode)
+
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=interrupting_inspect),
+            ):
+                first = scanner.scan_directory(self.temp_path, ScanMode.QUICK)
+
+            assert first.processed_files == 1
+            assert scanner._get_resume_path(self.temp_path).exists()
+
+            resumed_scanner = VideoScanner()
+            inspect, calls = self._fake_inspect()
+            with (
+                patch.object(resumed_scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(resumed_scanner, "_inspect_file", side_effect=inspect),
+            ):
+                second = resumed_scanner.scan_directory(self.temp_path, ScanMode.QUICK)
+
+            assert len(calls) == 5
+            assert second.was_resumed
+            assert second.processed_files == 6
+            assert second.corrupt_files == 1
+            assert not resumed_scanner._get_resume_path(self.temp_path).exists()
+
+    def test_resumed_hybrid_scan_deep_scans_leftover_suspicious_files(self):
+        """Test that files flagged before an interruption are deep-scanned on resume"""
+        for i in range(4):
+            (self.temp_path / f"video{i}.mp4").touch()
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            journal = ResumeJournal(scanner._get_resume_path(self.temp_path))
+            journal.open()
+            for name, suspicious in (("video0.mp4", True), ("video1.mp4", False)):
+                video_file = VideoFile(path=self.temp_path / name)
+                journal.record(
+                    ScanResult(
+                        video_file=video_file, needs_deep_scan=suspicious, scan_mode=ScanMode.QUICK
+                    )
+                )
+            journal.close()
+
+            inspect, calls = self._fake_inspect(corrupt_names={"video0.mp4"})
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(self.temp_path, ScanMode.HYBRID)
+
+        assert sorted(calls) == [
+            ("video0.mp4", ScanMode.DEEP),
+            ("video2.mp4", ScanMode.QUICK),
+            ("video3.mp4", ScanMode.QUICK),
+        ]
+        assert summary.processed_files == 4
+        assert summary.corrupt_files == 1
+        assert summary.deep_scans_needed == 1
+        assert summary.deep_scans_completed == 1
+
+    def _scan_with(self, inspect, scan_mode=ScanMode.QUICK, **kwargs):
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                return scanner.scan_directory(self.temp_path, scan_mode, resume=False, **kwargs)
+
+    def test_longest_first_order_dispatches_largest_files_first(self):
+        """Test that an ordered scan waits for discovery and inspects by expected cost"""
+        self.mock_config.scan.max_workers = 1
+        for name, size in (("b.mp4", 10), ("a.mp4", 300), ("c.mp4", 200)):
+            (self.temp_path / name).write_bytes(bytes(size))
+
+        inspect, calls = self._fake_inspect()
+        self._scan_with(inspect, ScanMode.DEEP, order=ScanOrder.LONGEST_FIRST)
+
+        assert [name for name, _mode in calls] == ["a.mp4", "c.mp4", "b.mp4"]
+
+    def test_incremental_scan_skips_unchanged_files(self):
+        """Test that only new or modified files are inspected again"""
+        for i in range(4):
+            (self.temp_path / f"video{i}.mp4").write_bytes(b"original")
+
+        inspect, _calls = self._fake_inspect(corrupt_names={"video3.mp4"})
+        self._scan_with(inspect)
+
+        (self.temp_path / "video0.mp4").write_bytes(b"modified contents")
+        (self.temp_path / "video4.mp4").touch()
+        inspect, calls = self._fake_inspect(corrupt_names={"video3.mp4"})
+        summary = self._scan_with(inspect, incremental=True)
+
+        assert sorted(name for name, _mode in calls) == ["video0.mp4", "video4.mp4"]
+        assert summary.skipped_unchanged == 3
+        assert summary.total_files == 5
+        assert summary.processed_files == 5
+        assert summary.corrupt_files == 1
+
+    def test_incremental_scan_rechecks_inconclusive_and_expired_verdicts(self):
+        """Test that suspicious results and verdicts past the max age are re-inspected"""
+        for name in ("fresh.mp4", "suspicious.mp4"):
+            (self.temp_path / name).touch()
+
+        inspect, _calls = self._fake_inspect(suspicious_names={"suspicious.mp4"})
+        self._scan_with(inspect)
+
+        inspect, calls = self._fake_inspect()
+        self._scan_with(inspect, incremental=True)
+        assert [name for name, _mode in calls] == ["suspicious.mp4"]
+
+        self.mock_config.scan.incremental_max_age_days = 1
+        with patch("src.core.scanner.time.time", return_value=time.time() + 2 * 24 * 60 * 60):
+            inspect, calls = self._fake_inspect()
+            summary = self._scan_with(inspect, incremental=True)
+        assert sorted(name for name, _mode in calls) == ["fresh.mp4", "suspicious.mp4"]
+        assert summary.skipped_unchanged == 0
+
+    def test_incremental_scan_reuses_only_verdicts_as_thorough_as_the_mode(self):
+        """Test that a quick verdict does not suppress a deep scan, but a deep one covers quick"""
+        (self.temp_path / "video.mp4").touch()
+        inspect, _calls = self._fake_inspect()
+        self._scan_with(inspect, ScanMode.QUICK)
+
+        inspect, calls = self._fake_inspect()
+        summary = self._scan_with(inspect, ScanMode.DEEP, incremental=True)
+        assert calls == [("video.mp4", ScanMode.DEEP)]
+        assert summary.skipped_unchanged == 0
+
+        inspect, calls = self._fake_inspect()
+        summary = self._scan_with(inspect, ScanMode.QUICK, incremental=True)
+        assert calls == []
+        assert summary.skipped_unchanged == 1
+
+    def test_full_scan_ignores_fingerprints(self):
+        """Test that a non-incremental scan inspects every file"""
+        (self.temp_path / "video.mp4").touch()
+        inspect, _calls = self._fake_inspect()
+        self._scan_with(inspect)
+
+        inspect, calls = self._fake_inspect()
+        summary = self._scan_with(inspect)
+
+        assert len(calls) == 1
+        assert summary.skipped_unchanged == 0
+
+    def test_scan_starts_before_discovery_finishes(self):
+        """Test that files are inspected while the directory walk is still running"""
+        walk_finished = threading.Event()
+        inspected_during_walk = []
+
+        def slow_walk(_directory, **_kwargs):
+            for i in range(3):
+                yield VideoFile(path=self.temp_path / f"video{i}.mp4")
+                time.sleep(0.2)
+            walk_finished.set()
+
+        def inspect(_ffmpeg_client, video_file, scan_mode):
+            inspected_during_walk.append(not walk_finished.is_set())
+            return ScanResult(video_file=video_file, scan_mode=scan_mode)
+
+        progress_updates = []
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "iter_video_files", side_effect=slow_walk),
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file", side_effect=inspect),
+            ):
+                summary = scanner.scan_directory(
+                    self.temp_path,
+                    ScanMode.QUICK,
+                    resume=False,
+                    progress_callback=lambda p: progress_updates.append(
+                        (p.total_files, p.processed_count, p.discovery_complete)
+                    ),
+                )
+
+        assert inspected_during_walk[0]
+        assert progress_updates[0] == (1, 1, False)
+        assert summary.total_files == 3
+        assert summary.processed_files == 3
+
+    def test_max_workers_uses_smaller_configured_limit(self):
+        """Test that the worker count honors both configured limits"""
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            self.mock_config.processing.max_workers = 6
+            self.mock_config.scan.max_workers = 3
+            assert scanner._get_max_workers() == 3
+            self.mock_config.scan.max_workers = 16
+            assert scanner._get_max_workers() == 6
+
+    def test_scan_files_async_bounds_concurrency(self):
+        """Test that the async scan loop never exceeds max_concurrency"""
+        import asyncio
+
+        video_files = [VideoFile(path=self.temp_path / f"video{i}.mp4") for i in range(8)]
+        running = 0
+        peak = 0
+
+        async def inspect(_ffmpeg_client, video_file, scan_mode):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ScanResult(
+                video_file=video_file,
+                is_corrupt=video_file.path.name == "video3.mp4",
+                scan_mode=scan_mode,
+            )
+
+        progress_updates = []
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file_async", side_effect=inspect),
+            ):
+                results = asyncio.run(
+                    scanner.scan_files_async(
+                        video_files,
+                        ScanMode.QUICK,
+                        max_concurrency=3,
+                        progress_callback=lambda p: progress_updates.append(p.processed_count),
+                    )
+                )
+
+        assert len(results) == 8
+        assert peak == 3
+        assert progress_updates[-1] == 8
+        assert sum(1 for r in results if r.is_corrupt) == 1
+
+    def test_scan_files_async_prechecks_files(self):
+        """Test that async scans report mis-typed files without inspecting them"""
+        import asyncio
+
+        self.mock_config.scan.prefilter = True
+        self.mock_config.scan.structure_check = False
+        error_page = self.temp_path / "error.mkv"
+        error_page.write_bytes(b"<!DOCTYPE html><html>403 Forbidden</html>")
+        video = self.temp_path / "video.mkv"
+        video.write_bytes(b"\x1a\x45\xdf\xa3" + bytes(64))
+        inspected = []
+
+        async def inspect(_ffmpeg_client, video_file, scan_mode):
+            inspected.append(video_file.path.name)
+            return ScanResult(video_file=video_file, scan_mode=scan_mode)
+
+        with patch("src.core.scanner.load_config", return_value=self.mock_config):
+            scanner = VideoScanner()
+            with (
+                patch.object(scanner, "_create_ffmpeg_client", return_value=None),
+                patch.object(scanner, "_inspect_file_async", side_effect=inspect),
+            ):
+                results = asyncio.run(
+                    scanner.scan_files_async(
+                        [VideoFile(path=error_page), VideoFile(path=video)], ScanMode.QUICK
+                    )
+                )
+
+        by_name = {r.video_file.path.name: r for r in results}
+        assert inspected == ["video.mkv"]
+        assert by_name["error.mkv"].is_corrupt
+        assert by_name["error.mkv"].issue_code == IssueCode.TYPE_MISMATCH
@@ -157,6 +157,13 @@ class TestScanProgressValidation:
         assert result.phase == ScanPhase.SCANNING
         assert result.scan_mode == ScanMode.HYBRID
 
+    def test_partly_decoded_files_count_towards_progress(self):
+        """Test that files still decoding contribute their decoded fraction."""
+        data = {"total_files": 4, "processed_count": 1, "active_files": {"/a.mkv": 0.5}}
+        result = ScanProgress.model_validate(data)
+        assert result.progress_percentage == 37.5
+        assert result.model_dump()["active_files"] == {"/a.mkv": 0.5}
+
 
 class TestBatchScanRequestValidation:
     """Test BatchScanRequest.model_validate behavior."""
@@ -0,0 +1,91 @@
+"""
+Unit tests for cost-based ordering of scan work.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.core.models.inspection import VideoFile
+from src.core.models.scanning import ScanOrder
+from src.core.scheduler import ScanCostEstimator, order_by_cost
+
+pytestmark = pytest.mark.unit
+
+
+def _video_file(tmp_path: Path, name: str, size: int, **kwargs) -> VideoFile:
+    path = tmp_path / name
+    path.write_bytes(bytes(size))
+    return VideoFile(path=path, **kwargs)
+
+
+class TestScanCostEstimator:
+    """Test ScanCostEstimator class"""
+
+    def test_history_is_scaled_by_size_change(self, tmp_path):
+        """Test that a file's own past inspection time is preferred and scaled"""
+        video_file = _video_file(tmp_path, "a.mp4", 2000)
+        estimator = ScanCostEstimator({str(video_file.path): (1000, 30.0)})
+
+        assert estimator.estimate(video_file) == pytest.approx(60.0)
+
+    def test_unknown_files_use_seconds_per_byte_of_history(self, tmp_path):
+        """Test that files never scanned are estimated from the median scan rate"""
+        video_file = _video_file(tmp_path, "new.mp4", 500)
+        history = {"/x/1.mp4": (1000, 10.0), "/x/2.mp4": (1000, 20.0), "/x/3.mp4": (100, 100.0)}
+
+        estimator = ScanCostEstimator(history)
+
+        assert estimator.seconds_per_byte == pytest.approx(0.02)
+        assert estimator.estimate(video_file) == pytest.approx(10.0)
+
+
+class TestOrderByCost:
+    """Test order_by_cost function"""
+
+    @pytest.fixture
+    def video_files(self, tmp_path):
+        return [
+            _video_file(tmp_path, "medium.mp4", 200),
+            _video_file(tmp_path, "small.mp4", 100),
+            _video_file(tmp_path, "large.mp4", 300),
+            _video_file(tmp_path, "also_small.mp4", 100),
+        ]
+
+    def test_longest_first(self, video_files):
+        """Test that the most expensive files come first, ties in path order"""
+        ordered = order_by_cost(video_files, ScanCostEstimator(), ScanOrder.LONGEST_FIRST)
+
+        assert [vf.name for vf in ordered] == [
+            "large.mp4",
+            "medium.mp4",
+            "also_small.mp4",
+            "small.mp4",
+        ]
+
+    def test_shortest_first(self, video_files):
+        """Test that the cheapest files come first"""
+        ordered = order_by_cost(video_files, ScanCostEstimator(), ScanOrder.SHORTEST_FIRST)
+
+        assert [vf.name for vf in ordered] == [
+            "also_small.mp4",
+            "small.mp4",
+            "medium.mp4",
+            "large.mp4",
+        ]
+
+    def test_history_outranks_size(self, video_files):
+        """Test that a small file known to be slow is scheduled before large ones"""
+        slow = str(video_files[1].path)
+        history = {slow: (100, 500.0), "/x/1.mp4": (1000, 1.0), "/x/2.mp4": (1000, 1.0)}
+        estimator = ScanCostEstimator(history)
+
+        ordered = order_by_cost(video_files, estimator, ScanOrder.LONGEST_FIRST)
+
+        assert ordered[0].name == "small.mp4"
+
+    def test_discovery_order_is_kept(self, video_files):
+        """Test that DISCOVERY leaves the input order alone"""
+        ordered = order_by_cost(video_files, ScanCostEstimator(), ScanOrder.DISCOVERY)
+
+        assert ordered == video_files
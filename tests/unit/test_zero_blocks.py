@@ -0,0 +1,74 @@
+"""
+Unit tests for zero-filled block run detection.
+"""
+
+import pytest
+
+from src.core.zero_blocks import BLOCK_SIZE, ZeroBlockDetector
+
+pytestmark = pytest.mark.unit
+
+
+def _write(tmp_path, data: bytes):
+    path = tmp_path / "video.mkv"
+    path.write_bytes(data)
+    return path
+
+
+def _payload(blocks: int) -> bytearray:
+    return bytearray(b"\x5a\xa5" * (blocks * BLOCK_SIZE // 2))
+
+
+class TestZeroBlockDetector:
+    """Test ZeroBlockDetector class"""
+
+    def test_rejects_invalid_run_length(self):
+        """Test that at least one block is required"""
+        with pytest.raises(ValueError, match="min_run_blocks"):
+            ZeroBlockDetector(min_run_blocks=0)
+
+    def test_clean_file_has_no_runs(self, tmp_path):
+        """Test that data without zero blocks is clean"""
+        assert ZeroBlockDetector().find_zero_runs(_write(tmp_path, bytes(_payload(64)))) == []
+
+    def test_reports_aligned_runs(self, tmp_path):
+        """Test that zero runs are reported with their byte ranges"""
+        data = _payload(64)
+        data[8 * BLOCK_SIZE : 20 * BLOCK_SIZE] = bytes(12 * BLOCK_SIZE)
+        data[40 * BLOCK_SIZE : 50 * BLOCK_SIZE] = bytes(10 * BLOCK_SIZE)
+
+        runs = ZeroBlockDetector().find_zero_runs(_write(tmp_path, bytes(data)))
+
+        assert runs == [(8 * BLOCK_SIZE, 20 * BLOCK_SIZE), (40 * BLOCK_SIZE, 50 * BLOCK_SIZE)]
+
+    def test_short_runs_are_ignored(self, tmp_path):
+        """Test that runs shorter than the minimum are treated as padding"""
+        data = _payload(64)
+        data[8 * BLOCK_SIZE : 12 * BLOCK_SIZE] = bytes(4 * BLOCK_SIZE)
+        path = _write(tmp_path, bytes(data))
+
+        assert ZeroBlockDetector(min_run_blocks=8).find_zero_runs(path) == []
+        assert ZeroBlockDetector(min_run_blocks=4).find_zero_runs(path) == [
+            (8 * BLOCK_SIZE, 12 * BLOCK_SIZE)
+        ]
+
+    def test_only_whole_aligned_blocks_count(self, tmp_path):
+        """Test that an unaligned zero run only reports the blocks it fully covers"""
+        data = _payload(16)
+        data[BLOCK_SIZE + 100 : 4 * BLOCK_SIZE + 100] = bytes(3 * BLOCK_SIZE)
+
+        runs = ZeroBlockDetector(min_run_blocks=1).find_zero_runs(_write(tmp_path, bytes(data)))
+
+        assert runs == [(2 * BLOCK_SIZE, 4 * BLOCK_SIZE)]
+
+    def test_run_at_end_of_file(self, tmp_path):
+        """Test that a zero-filled tail is reported"""
+        data = _payload(16) + bytes(8 * BLOCK_SIZE)
+
+        runs = ZeroBlockDetector().find_zero_runs(_write(tmp_path, bytes(data)))
+
+        assert runs == [(16 * BLOCK_SIZE, 24 * BLOCK_SIZE)]
+
+    def test_small_file(self, tmp_path):
+        """Test that files smaller than a block have no runs"""
+        assert ZeroBlockDetector().find_zero_runs(_write(tmp_path, b"")) == []